@@ -0,0 +1,28 @@
+"""기존 지출 내역에 organizationName 채워 넣기 (조직 단위 단일 쿼리 조회용)"""
+import asyncio
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.expense_service import expense_service
+
+
+async def backfill(dry_run: bool):
+    """organizationName 백필 실행"""
+    try:
+        print(f"지출 내역 조직 정보 백필 시작... (dry_run={dry_run})")
+
+        result = await expense_service.backfill_organization_names(dry_run=dry_run)
+
+        print(f"✅ 조직 수: {result['organizations']}")
+        print(f"- 확인한 지출: {result['scanned']}건")
+        print(f"- {'갱신 대상' if dry_run else '갱신된'} 지출: {result['updated']}건")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill(dry_run="--dry-run" in sys.argv))
@@ -0,0 +1,84 @@
+"""
+AI 카테고리 분류 엔진 벤치마크
+
+같은 샘플 문장으로 pipeline(기존 HF 파이프라인), nli(가설 토큰 캐시),
+embedding(임베딩 유사도) 엔진의 항목당 지연 시간과 pipeline 대비 일치율을 비교합니다.
+분류 캐시를 거치지 않고 엔진을 직접 호출합니다.
+
+사용법:
+    python benchmark_ai_classifier.py [배치 크기]
+"""
+import sys
+import os
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.ai_category_service import ai_category_service
+
+SAMPLES = [
+    "스타벅스 강남점에서 아메리카노",
+    "GS25 역삼점에서 삼각김밥",
+    "다이소 신촌점에서 A4 용지",
+    "모닝글로리에서 볼펜",
+    "교촌치킨에서 치킨 세트",
+    "새마을식당에서 소주",
+    "카카오택시",
+    "SK에너지 주유소에서 휘발유",
+    "한국전력공사 전기요금",
+    "온누리약국에서 감기약",
+    "CGV 용산에서 영화 관람",
+    "해커스어학원에서 토익 강의",
+    "교보문고에서 전공 교재",
+    "파리바게뜨에서 케이크",
+    "이마트에서 음료수",
+    "코인노래방",
+]
+
+
+def benchmark_engine(kind: str, batch_size: int, rounds: int = 3):
+    """엔진 하나의 로드 시간, 항목당 지연 시간, 예측 결과"""
+    started = time.perf_counter()
+    engine = ai_category_service.create_engine(kind)
+    load_seconds = time.perf_counter() - started
+
+    # 첫 호출 워밍업
+    engine.classify_batch(SAMPLES[:1])
+
+    predictions = []
+    started = time.perf_counter()
+    for _ in range(rounds):
+        predictions = []
+        for i in range(0, len(SAMPLES), batch_size):
+            predictions.extend(engine.classify_batch(SAMPLES[i:i + batch_size]))
+    per_item_ms = (time.perf_counter() - started) * 1000 / (rounds * len(SAMPLES))
+
+    return load_seconds, per_item_ms, predictions
+
+
+def main(batch_size: int):
+    """벤치마크 실행"""
+    print(f"샘플 {len(SAMPLES)}개, 배치 크기 {batch_size}")
+    print(f"{'엔진':<10} {'로드s':>7} {'항목당ms':>9} {'일치율':>7}")
+
+    baseline = None
+    for kind in ("pipeline", "nli", "embedding"):
+        try:
+            load_seconds, per_item_ms, predictions = benchmark_engine(kind, batch_size)
+        except Exception as e:
+            print(f"{kind:<10} ❌ 실패: {e}")
+            continue
+
+        labels = [label for label, _ in predictions]
+        if baseline is None and kind == "pipeline":
+            baseline = labels
+        agreement = (
+            sum(a == b for a, b in zip(labels, baseline)) / len(labels) * 100
+            if baseline else float("nan")
+        )
+        print(f"{kind:<10} {load_seconds:>7.1f} {per_item_ms:>9.1f} {agreement:>6.0f}%")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
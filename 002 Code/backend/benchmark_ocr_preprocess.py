@@ -0,0 +1,86 @@
+"""
+영수증 이미지 전처리 벤치마크
+
+샘플 이미지 폴더의 각 파일에 대해 전처리 전후의 용량과 처리 시간을 비교합니다.
+--ocr 옵션을 주면 원본/전처리본 각각 Azure OCR 지연 시간도 측정합니다 (유료 호출).
+
+사용법:
+    python benchmark_ocr_preprocess.py <이미지 폴더> [--ocr]
+"""
+import asyncio
+import sys
+import os
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.ocr_service import ocr_service
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".heic", ".webp")
+
+
+async def measure_ocr(image_bytes: bytes) -> float:
+    """Azure OCR 지연 시간 (캐시를 거치지 않도록 직접 분석 호출)"""
+    started = time.perf_counter()
+    await asyncio.to_thread(ocr_service._analyze, image_bytes, "application/octet-stream")
+    return time.perf_counter() - started
+
+
+async def benchmark(folder: str, with_ocr: bool):
+    """벤치마크 실행"""
+    files = sorted(
+        os.path.join(folder, name) for name in os.listdir(folder)
+        if name.lower().endswith(IMAGE_EXTENSIONS)
+    )
+    if not files:
+        print(f"❌ 이미지가 없습니다: {folder}")
+        return
+
+    print(f"샘플 {len(files)}개 전처리 벤치마크 (ocr={with_ocr})")
+    print(f"{'파일':<30} {'원본KB':>9} {'처리KB':>9} {'감소율':>7} {'전처리ms':>9}" +
+          (f" {'OCR원본s':>9} {'OCR처리s':>9}" if with_ocr else ""))
+
+    total_before = total_after = 0
+    total_preprocess = total_ocr_before = total_ocr_after = 0.0
+
+    for path in files:
+        with open(path, "rb") as f:
+            original = f.read()
+
+        started = time.perf_counter()
+        processed = await ocr_service.preprocess_image(original)
+        preprocess_ms = (time.perf_counter() - started) * 1000
+
+        total_before += len(original)
+        total_after += len(processed)
+        total_preprocess += preprocess_ms
+        reduction = (1 - len(processed) / len(original)) * 100
+
+        line = (f"{os.path.basename(path)[:30]:<30} {len(original) / 1024:>9.0f} "
+                f"{len(processed) / 1024:>9.0f} {reduction:>6.1f}% {preprocess_ms:>9.0f}")
+
+        if with_ocr:
+            ocr_before = await measure_ocr(original)
+            ocr_after = await measure_ocr(processed)
+            total_ocr_before += ocr_before
+            total_ocr_after += ocr_after
+            line += f" {ocr_before:>9.2f} {ocr_after:>9.2f}"
+
+        print(line)
+
+    count = len(files)
+    print("-" * 70)
+    print(f"✅ 총 용량: {total_before / 1024 / 1024:.2f}MB → {total_after / 1024 / 1024:.2f}MB "
+          f"({(1 - total_after / total_before) * 100:.1f}% 감소)")
+    print(f"- 평균 전처리 시간: {total_preprocess / count:.0f}ms")
+    if with_ocr:
+        print(f"- 평균 OCR 지연: {total_ocr_before / count:.2f}s → {total_ocr_after / count:.2f}s")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if not args:
+        print(__doc__)
+        sys.exit(1)
+    asyncio.run(benchmark(args[0], with_ocr="--ocr" in sys.argv))
@@ -0,0 +1,199 @@
+"""
+상호명 매칭 벤치마크
+
+가상의 영수증 상호명 N개(기본 10,000)를 만들고, 일부를 다른 표기/OCR 오류로 바꾼 질의로
+기존 규칙(소문자 일치/포함)과 퍼지 매칭(전체 비교, 3-gram 역색인)의
+1순위 정확도와 질의당 지연 시간을 비교합니다.
+영수증에 없는 비슷한 상호명(첫 음절이 같은 짧은 한글 이름 등)을 질의했을 때
+결과가 나오는 비율(오매칭률)도 최소 유사도(MIN_SIMILARITY)별로 비교합니다.
+
+사용법:
+    python benchmark_store_matching.py [영수증 수] [질의 수]
+"""
+import sys
+import os
+import random
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.services import store_name_matcher as matcher_module
+from src.services.store_name_matcher import StoreNameIndex, store_name_matcher
+
+# (영수증에 찍히는 표기, 사용자가 입력할 만한 다른 표기)
+BRANDS = [
+    ("GS25", ["지에스25", "gs 25"]),
+    ("CU", ["씨유"]),
+    ("세븐일레븐", ["7-ELEVEN", "코리아세븐"]),
+    ("이마트24", ["emart24"]),
+    ("스타벅스", ["STARBUCKS", "스타벅스커피"]),
+    ("투썸플레이스", ["투썸", "A TWOSOME PLACE"]),
+    ("이디야커피", ["이디야", "EDIYA"]),
+    ("메가커피", ["MEGA COFFEE"]),
+    ("맥도날드", ["McDonald's"]),
+    ("버거킹", ["BURGER KING"]),
+    ("파리바게뜨", ["파리바게트"]),
+    ("다이소", ["DAISO"]),
+    ("올리브영", ["OLIVE YOUNG"]),
+    ("교보문고", ["KYOBO"]),
+]
+LOCAL_STORES = [
+    "새마을식당", "김밥천국", "교촌치킨", "BBQ치킨", "본죽", "한솥도시락", "홍콩반점",
+    "역전할머니맥주", "명랑핫도그", "봉구스밥버거", "할매순대국", "신전떡볶이", "모닝글로리",
+    "알파문구", "온누리약국", "코인노래방", "해커스어학원", "현대오일뱅크", "궁동칼국수",
+]
+# 영수증에 없는 상호 (위 상호와 첫 음절/단어가 같거나 포함 관계인 이름)
+LOOKALIKE_STORES = [
+    "다이닝", "이디저디", "올리브네트웍스", "교보생명", "버거운", "메가마트", "맥주창고",
+    "본가", "본도시락", "김밥나라", "홍콩각", "한솥밥", "새마을금고", "할매국수", "신참떡볶이",
+    "교동짬뽕", "명랑시장", "알파카페", "온누리상회", "궁동반점", "모닝빵", "코인세탁",
+    "현대자동차", "해커스편입", "역전우동", "봉구네", "스타필드", "투다리", "파리크라상",
+]
+SIMILARITY_THRESHOLDS = [0.6, 0.65, 0.7, 0.75]
+
+BRANCHES = [
+    "한밭대", "궁동", "유성", "둔산", "봉명", "노은", "신촌", "강남", "역삼", "서면",
+    "월평", "관평", "도룡", "어은", "반석", "지족", "탄방", "갈마", "은행", "대흥",
+]
+
+
+def ocr_noise(text: str, rng: random.Random) -> str:
+    """한글 음절 하나의 모음/받침을 바꾸거나 공백을 넣는 OCR 오류 흉내"""
+    chars = list(text)
+    positions = [i for i, char in enumerate(chars) if "가" <= char <= "힣"]
+    if positions and rng.random() < 0.7:
+        i = rng.choice(positions)
+        offset = ord(chars[i]) - 0xAC00
+        cho, jung, jong = offset // 588, (offset // 28) % 21, offset % 28
+        if rng.random() < 0.5:
+            jung = (jung + rng.choice([1, -1])) % 21
+        else:
+            jong = 0 if jong else 4
+        chars[i] = chr(0xAC00 + cho * 588 + jung * 28 + jong)
+    elif len(chars) > 2:
+        chars.insert(rng.randrange(1, len(chars)), " ")
+    return "".join(chars)
+
+
+def build_dataset(receipt_count: int, query_count: int, seed: int = 42):
+    """(영수증 ID → 상호명, 상호 식별자) 목록과 (질의, 정답 식별자) 목록"""
+    rng = random.Random(seed)
+    stores = []
+    for name, aliases in BRANDS:
+        stores.append((name, aliases))
+    for name in LOCAL_STORES:
+        stores.append((name, []))
+
+    receipts = []
+    for i in range(receipt_count):
+        store_index = rng.randrange(len(stores))
+        name, _ = stores[store_index]
+        branch = rng.choice(BRANCHES)
+        receipts.append((f"r{i}", f"{name} {branch}점", store_index))
+
+    queries = []
+    for receipt_id, receipt_name, store_index in rng.sample(receipts, query_count):
+        name, aliases = stores[store_index]
+        variant = rng.choice([name, *aliases])
+        if rng.random() < 0.5:
+            variant = ocr_noise(variant, rng)
+        queries.append((variant, store_index))
+
+    negatives = []
+    for _ in range(query_count):
+        variant = rng.choice(LOOKALIKE_STORES)
+        if rng.random() < 0.5:
+            variant = ocr_noise(variant, rng)
+        negatives.append(variant)
+
+    return receipts, queries, negatives
+
+
+def legacy_score(a: str, b: str) -> float:
+    """기존 규칙: 소문자 일치 50점, 포함 관계 30점"""
+    a, b = a.lower(), b.lower()
+    if a == b:
+        return 50
+    if a in b or b in a:
+        return 30
+    return 0
+
+
+def evaluate(name: str, search, queries, store_of, negatives=None):
+    """1순위 결과가 같은 상호인 비율, 질의당 지연 시간, 없는 상호 질의의 오매칭률"""
+    correct = 0
+    started = time.perf_counter()
+    for query, store_index in queries:
+        best = search(query)
+        if best is not None and store_of[best] == store_index:
+            correct += 1
+    per_query_ms = (time.perf_counter() - started) * 1000 / len(queries)
+
+    false_match = ""
+    if negatives is not None:
+        matched = sum(search(query) is not None for query in negatives)
+        false_match = f"{matched / len(negatives) * 100:>9.1f}%"
+    print(f"{name:<22} {correct / len(queries) * 100:>7.1f}% {per_query_ms:>10.3f} {false_match}")
+
+
+def main(receipt_count: int, query_count: int):
+    """벤치마크 실행"""
+    receipts, queries, negatives = build_dataset(receipt_count, query_count)
+    store_of = {receipt_id: store_index for receipt_id, _, store_index in receipts}
+    print(f"영수증 {len(receipts):,}개, 질의 {len(queries):,}개")
+
+    started = time.perf_counter()
+    keys = [(receipt_id, store_name_matcher.key(name)) for receipt_id, name, _ in receipts]
+    key_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    index = StoreNameIndex(store_name_matcher)
+    for receipt_id, name, _ in receipts:
+        index.add(receipt_id, name)
+    index_ms = (time.perf_counter() - started) * 1000
+    print(f"키 계산 {key_ms:.0f}ms, 역색인 구성 {index_ms:.0f}ms")
+
+    print(f"{'방식':<22} {'1순위 정확도':>8} {'질의당ms':>10} {'오매칭률':>9}")
+
+    def legacy_search(query):
+        best_id, best_score = None, 0
+        for receipt_id, name, _ in receipts:
+            score = legacy_score(name, query)
+            if score > best_score:
+                best_id, best_score = receipt_id, score
+        return best_id
+
+    def fuzzy_scan(query):
+        query_key = store_name_matcher.key(query)
+        best_id, best_score = None, 0.0
+        for receipt_id, key in keys:
+            score = store_name_matcher.match_score(key, query_key)
+            if score > best_score:
+                best_id, best_score = receipt_id, score
+        return best_id
+
+    def indexed_search(query):
+        results = index.search(query, limit=1)
+        return results[0][1] if results else None
+
+    evaluate("기존 (일치/포함)", legacy_search, queries, store_of, negatives)
+    evaluate("퍼지 (전체 비교)", fuzzy_scan, queries, store_of, negatives)
+    evaluate("퍼지 (3-gram 역색인)", indexed_search, queries, store_of, negatives)
+
+    print("\n최소 유사도별 (3-gram 역색인)")
+    configured = matcher_module.MIN_SIMILARITY
+    try:
+        for threshold in SIMILARITY_THRESHOLDS:
+            matcher_module.MIN_SIMILARITY = threshold
+            mark = " (현재)" if threshold == configured else ""
+            evaluate(f"{threshold:.2f}{mark}", indexed_search, queries, store_of, negatives)
+    finally:
+        matcher_module.MIN_SIMILARITY = configured
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    )
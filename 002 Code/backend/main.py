@@ -1,57 +1,23 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from src.core.config import settings
-from src.api.routes import budget, receipt, auth, expense, department, admin, data, report, public
+"""
+FastAPI 앱 엔트리포인트
 
-# FastAPI 앱 초기화
-app = FastAPI(
-    title=settings.APP_NAME,
-    version=settings.APP_VERSION,
-    description="NAVER Clover OCR을 활용한 조직예산 관리 API",
-    docs_url="/docs",
-    redoc_url="/redoc"
-)
+앱 정의는 src/app.py에 있습니다. PDF 워커는 spawn으로 시작하며 python main.py로 실행하면
+워커가 이 파일을 __mp_main__으로 다시 임포트하므로, 임포트 시점에는 라우터/Firebase/AI 모델을
+불러오지 않고 uvicorn이 main:app을 조회할 때 앱을 임포트합니다.
+"""
 
-# CORS 설정
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # 또는 ["http://ec2-43-203-136-37.ap-northeast-2.compute.amazonaws.com:3000"]
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
 
-# 라우터 등록 - prefix는 각 라우터에 이미 정의되어 있음
-app.include_router(auth.router)
-app.include_router(budget.router)
-app.include_router(receipt.router)
-app.include_router(expense.router)
-app.include_router(department.router)
-app.include_router(admin.router)
-app.include_router(data.router)
-app.include_router(report.router)
-app.include_router(public.router)
-
-
-@app.get("/")
-async def root():
-    """API 루트 엔드포인트"""
-    return {
-        "message": "Budget Management API",
-        "version": settings.APP_VERSION,
-        "docs": "/docs",
-        "redoc": "/redoc"
-    }
-
-
-@app.get("/health")
-async def health_check():
-    """헬스 체크 엔드포인트"""
-    return {"status": "healthy"}
+def __getattr__(name):
+    """uvicorn main:app 호환 (app 속성에 처음 접근할 때 src.app 임포트)"""
+    if name == "app":
+        from src.app import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
     import uvicorn
+    from src.core.config import settings
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
@@ -0,0 +1,28 @@
+"""월별 카테고리 통계 롤업 재구축 스크립트 (지출 원본 기준으로 재계산)"""
+import asyncio
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.expense_service import expense_service
+
+
+async def rebuild(dry_run: bool):
+    """통계 롤업 재구축 실행"""
+    try:
+        print(f"통계 롤업 재구축 시작... (dry_run={dry_run})")
+
+        result = await expense_service.rebuild_statistics_rollups(dry_run=dry_run)
+
+        print(f"✅ 확인한 지출: {result['expenses']}개")
+        print(f"- 롤업 문서: {result['rollups']}개")
+        print(f"- 삭제 대상 문서: {result['removed']}개")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(rebuild(dry_run="--dry-run" in sys.argv))
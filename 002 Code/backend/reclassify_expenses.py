@@ -0,0 +1,68 @@
+"""
+지출 일괄 재분류 스크립트 (현재 키워드/AI 분류기 기준)
+
+사용법:
+    python reclassify_expenses.py <조직 이름> [--dry-run] [--resume]
+    python reclassify_expenses.py --all [--dry-run] [--resume]
+"""
+import asyncio
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.category_service import category_service
+from src.services.expense_service import expense_service
+
+# AI 모델 로드 최대 대기 시간 (초)
+MODEL_LOAD_TIMEOUT = 600
+
+
+async def reclassify(organization_name, dry_run: bool, resume: bool):
+    """재분류 실행"""
+    try:
+        target = organization_name or "전체"
+        print(f"지출 재분류 시작... (대상={target}, dry_run={dry_run}, resume={resume})")
+
+        # 키워드 결과로 이전 AI 분류를 덮어쓰지 않도록 모델 로드를 기다린 뒤 분류
+        ai_service = category_service.ai_service
+        if ai_service is not None:
+            print("AI 분류 모델 로드 중...")
+            if not await asyncio.to_thread(ai_service.wait_until_loaded, MODEL_LOAD_TIMEOUT):
+                print(f"⚠️ AI 모델을 사용할 수 없습니다 (상태: {ai_service.state}, 오류: {ai_service.load_error})")
+                if not dry_run:
+                    print("❌ 키워드 분류만으로는 저장하지 않습니다. --dry-run으로 확인만 할 수 있습니다")
+                    return
+
+        result = await expense_service.reclassify_expenses(
+            organizationName=organization_name,
+            dry_run=dry_run,
+            resume=resume
+        )
+
+        for diff in result["diffs"]:
+            print(f"  {diff['id']}: {diff['store_name']} / {diff['item_name'] or '-'} "
+                  f"{diff['from']} → {diff['to']} ({diff['stage']}, {diff['confidence']:.2f})")
+        if result["diffs_truncated"]:
+            print(f"  ... 외 {result['changed'] - len(result['diffs'])}개")
+        print(f"✅ 확인한 지출: {result['scanned']}개")
+        print(f"- 수동 분류 제외: {result['skipped_manual']}개")
+        print(f"- 카테고리 변경: {result['changed']}개")
+        if not result["completed"]:
+            print(f"- 중단됨, --resume으로 이어서 실행 (체크포인트: {result['checkpoint']})")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if not args and "--all" not in sys.argv:
+        print(__doc__)
+        sys.exit(1)
+    asyncio.run(reclassify(
+        organization_name=None if "--all" in sys.argv else args[0],
+        dry_run="--dry-run" in sys.argv,
+        resume="--resume" in sys.argv
+    ))
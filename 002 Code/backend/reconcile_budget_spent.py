@@ -0,0 +1,30 @@
+"""예산 spent 누계 보정 스크립트 (지출 원본 기준으로 재계산)"""
+import asyncio
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from src.services.budget_service import budget_service
+
+
+async def reconcile(dry_run: bool):
+    """spent 누계 보정 실행"""
+    try:
+        print(f"예산 spent 누계 보정 시작... (dry_run={dry_run})")
+
+        result = await budget_service.reconcile_spent(dry_run=dry_run)
+
+        print(f"✅ 확인한 예산: {result['checked']}개")
+        print(f"- 불일치: {len(result['drifted'])}개")
+        for item in result["drifted"]:
+            print(f"  {item['budget_id']}: 저장값={item['stored']}, 실제={item['actual']:,.0f}")
+        print(f"- 보정됨: {result['repaired']}개")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {str(e)}")
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile(dry_run="--dry-run" in sys.argv))
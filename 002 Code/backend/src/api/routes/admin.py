@@ -85,37 +85,28 @@ async def archive_old_receipts(
 async def get_receipts_summary(current_user: dict = Depends(get_current_user)):
     """영수증 현황 요약"""
     try:
-        from src.core.firebase import firebase_client
+        from src.core.firebase import firebase_client, firestore_repo
         from datetime import datetime, timedelta
+        import asyncio
         
         db = firebase_client.db
         now = datetime.utcnow()
         
-        # 전체 통계
-        total_receipts = len(list(db.collection("receipts").stream()))
-        
-        # 최근 30일 통계
+        receipts_ref = db.collection("receipts")
         recent_date = now - timedelta(days=30)
-        recent_receipts = len(list(
-            db.collection("receipts")
-            .where("created_at", ">=", recent_date)
-            .stream()
-        ))
-        
-        # 실패한 영수증 통계
-        failed_receipts = len(list(
-            db.collection("receipts")
-            .where("ocr_status", "==", "failed")
-            .stream()
-        ))
-        
-        # 오래된 영수증 (90일 이상)
         old_date = now - timedelta(days=90)
-        old_receipts = len(list(
-            db.collection("receipts")
-            .where("created_at", "<", old_date)
-            .stream()
-        ))
+
+        # 서버 측 count() 집계로 문서를 내려받지 않고 개수만 조회
+        total_receipts, recent_receipts, failed_receipts, old_receipts = await asyncio.gather(
+            # 전체 통계
+            firestore_repo.count(receipts_ref),
+            # 최근 30일 통계
+            firestore_repo.count(receipts_ref.where("created_at", ">=", recent_date)),
+            # 실패한 영수증 통계
+            firestore_repo.count(receipts_ref.where("ocr_status", "==", "failed")),
+            # 오래된 영수증 (90일 이상)
+            firestore_repo.count(receipts_ref.where("created_at", "<", old_date)),
+        )
         
         return {
             "total_receipts": total_receipts,
@@ -127,4 +118,81 @@ async def get_receipts_summary(current_user: dict = Depends(get_current_user)):
         }
         
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/classification/cache")
+async def get_classification_cache_stats(current_user: dict = Depends(get_current_user)):
+    """AI 카테고리 분류 캐시 적중률 통계"""
+    try:
+        from src.services.category_service import category_service
+
+        if not category_service.ai_service:
+            return {"available": False}
+
+        return {"available": True, **category_service.ai_service.cache.stats()}
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/classification/keywords/reload")
+async def reload_category_keywords(current_user: dict = Depends(get_current_user)):
+    """카테고리 키워드 설정 파일 재로드 (서버 재시작 불필요)"""
+    try:
+        from src.services.category_service import category_service
+
+        return {"status": "success", **category_service.reload_keywords()}
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/expenses/reclassify")
+async def reclassify_expenses(
+    dry_run: bool = Query(True, description="실제 저장하지 않고 변경 내역만 반환"),
+    batch_size: int = Query(100, ge=1, le=150, description="한 번에 분류/저장할 지출 수"),
+    resume: bool = Query(False, description="마지막 체크포인트부터 이어서 실행"),
+    max_batches: Optional[int] = Query(None, ge=1, description="이번 요청에서 처리할 최대 묶음 수"),
+    current_user: dict = Depends(get_current_user)
+):
+    """
+    자동 분류된 지출 일괄 재분류
+
+    - 키워드/카테고리 조정 후 기존 지출에 현재 분류기를 다시 적용
+    - 대상은 항상 내 조직의 지출 (전체 재분류는 reclassify_expenses.py 스크립트 사용)
+    - 수동 분류 지출은 건너뜀
+    - dry_run=True로 변경 내역(diffs)을 먼저 확인 후 실제 반영
+    """
+    organization_name = current_user.get("organizationName")
+    if not organization_name:
+        raise HTTPException(status_code=400, detail="소속 조직이 없는 사용자는 재분류할 수 없습니다")
+
+    try:
+        from src.services.expense_service import expense_service
+
+        result = await expense_service.reclassify_expenses(
+            organizationName=organization_name,
+            dry_run=dry_run,
+            batch_size=batch_size,
+            resume=resume,
+            max_batches=max_batches
+        )
+        return result
+
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/pdf/stats")
+async def get_pdf_stats(current_user: dict = Depends(get_current_user)):
+    """PDF 생성 프로세스 풀 대기열 통계"""
+    try:
+        from src.services.pdf_service import pdf_service
+
+        return pdf_service.stats()
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
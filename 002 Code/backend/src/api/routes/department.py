@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends
 from typing import List
 from src.schemas.department import DepartmentCreate, DepartmentUpdate, DepartmentResponse
-from src.core.firebase import firebase_client
+from src.core.firebase import firebase_client, firestore_repo
 from src.api.dependencies import get_current_user
 from datetime import datetime
 
@@ -20,7 +20,7 @@ async def get_departments(current_user: dict = Depends(get_current_user)):
     """
     try:
         departments_ref = db.collection("departments")
-        docs = departments_ref.stream()
+        docs = await firestore_repo.stream(departments_ref)
 
         departments = []
         for doc in docs:
@@ -57,7 +57,7 @@ async def create_department(
 
         # Firestore에 저장
         doc_ref = db.collection("departments").document()
-        doc_ref.set(department_dict)
+        await firestore_repo.set(doc_ref, department_dict)
 
         # 생성된 부서 반환
         department_dict["id"] = doc_ref.id
@@ -76,7 +76,7 @@ async def get_department(
     """특정 부서 조회"""
     try:
         doc_ref = db.collection("departments").document(department_id)
-        doc = doc_ref.get()
+        doc = await firestore_repo.get(doc_ref)
 
         if not doc.exists:
             raise HTTPException(status_code=404, detail="부서를 찾을 수 없습니다")
@@ -107,7 +107,7 @@ async def update_department(
             raise HTTPException(status_code=403, detail="부서 수정 권한이 없습니다")
 
         doc_ref = db.collection("departments").document(department_id)
-        doc = doc_ref.get()
+        doc = await firestore_repo.get(doc_ref)
 
         if not doc.exists:
             raise HTTPException(status_code=404, detail="부서를 찾을 수 없습니다")
@@ -116,10 +116,10 @@ async def update_department(
         update_data = department_data.dict(exclude_unset=True)
         update_data["updated_at"] = datetime.now()
 
-        doc_ref.update(update_data)
+        await firestore_repo.update(doc_ref, update_data)
 
         # 수정된 부서 반환
-        updated_doc = doc_ref.get()
+        updated_doc = await firestore_repo.get(doc_ref)
         result = updated_doc.to_dict()
         result["id"] = updated_doc.id
         return result
@@ -141,12 +141,12 @@ async def delete_department(
             raise HTTPException(status_code=403, detail="부서 삭제 권한이 없습니다")
 
         doc_ref = db.collection("departments").document(department_id)
-        doc = doc_ref.get()
+        doc = await firestore_repo.get(doc_ref)
 
         if not doc.exists:
             raise HTTPException(status_code=404, detail="부서를 찾을 수 없습니다")
 
-        doc_ref.delete()
+        await firestore_repo.delete(doc_ref)
         return {"message": "부서가 삭제되었습니다"}
     except HTTPException:
         raise
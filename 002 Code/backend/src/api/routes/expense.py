@@ -1,5 +1,7 @@
+import os
 from fastapi import APIRouter, HTTPException, Query, Depends
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
 from typing import Optional, List
 from datetime import datetime
 from src.schemas.expense import (
@@ -12,6 +14,7 @@ from src.services.expense_service import expense_service
 from src.services.receipt_service import receipt_service
 from src.services.pdf_service import pdf_service
 from src.api.dependencies import get_current_user
+from src.core.config import settings
 
 router = APIRouter(prefix="/expense", tags=["expense"])
 
@@ -41,7 +44,8 @@ async def create_expense(
             item_name=expense_data.item_name,
             category=expense_data.category,
             description=expense_data.description,
-            budget_id=expense_data.budget_id
+            budget_id=expense_data.budget_id,
+            organizationName=current_user.get("organizationName")
         )
 
         return expense
@@ -51,10 +55,12 @@ async def create_expense(
 
 @router.get("/", response_model=List[ExpenseResponse])
 async def get_expenses(
+    response: Response,
     category: Optional[str] = Query(None, description="카테고리 필터"),
     start_date: Optional[str] = Query(None, description="시작 날짜"),
     end_date: Optional[str] = Query(None, description="종료 날짜"),
-    limit: int = Query(100, ge=1, le=10000, description="최대 결과 수"),
+    limit: int = Query(100, ge=1, le=500, description="최대 결과 수 (페이지 크기)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -62,6 +68,7 @@ async def get_expenses(
 
     - 카테고리, 날짜 범위로 필터링 가능
     - 조직 공유 지출인 경우 조직 멤버 전체 지출 조회
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다
     """
     try:
         # 인증된 사용자 ID 가져오기
@@ -82,18 +89,24 @@ async def get_expenses(
             except ValueError:
                 raise HTTPException(status_code=400, detail="잘못된 end_date 형식")
 
-        expenses = await expense_service.get_expenses(
+        page = await expense_service.get_expenses_page(
             user_id=user_id,
             category=category,
             start_date=parsed_start_date,
             end_date=parsed_end_date,
             limit=limit,
-            organizationName=organizationName
+            organizationName=organizationName,
+            cursor=cursor
         )
 
-        return expenses
+        if page["next_cursor"]:
+            response.headers["X-Next-Cursor"] = page["next_cursor"]
+
+        return page["items"]
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         print(f"[ERROR] get_expenses 실패: {str(e)}")
         import traceback
@@ -233,6 +246,8 @@ async def export_expense_pdf(expense_id: str):
 
     except HTTPException:
         raise
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF 생성 실패: {str(e)}")
 
@@ -254,78 +269,75 @@ async def export_report_pdf(
         if not expense_ids:
             raise HTTPException(status_code=400, detail="선택된 지출 내역이 없습니다")
 
-        # 지출 내역들 조회 및 영수증 이미지 URL 추가
+        if len(expense_ids) > settings.PDF_REPORT_MAX_EXPENSES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"리포트에는 최대 {settings.PDF_REPORT_MAX_EXPENSES}건까지 포함할 수 있습니다"
+            )
+
+        # 지출 내역과 연결된 영수증을 배치 읽기로 조회 (문서별 순차 조회 대신 몇 번의 왕복)
+        expenses_by_id = await expense_service.get_expenses_by_ids(expense_ids)
+        receipts_by_id = await receipt_service.get_receipts_by_ids(
+            [expense.get('receipt_id') for expense in expenses_by_id.values()]
+        )
+        print(f"[PDF] 지출 내역 {len(expenses_by_id)}건, 영수증 {len(receipts_by_id)}건 조회")
+
+        # 요청 순서대로 영수증 이미지 URL 추가
         expenses = []
-        for expense_id in expense_ids:
-            print(f"[PDF] 지출 내역 조회 중: {expense_id}")
-            expense = await expense_service.get_expense(expense_id)
-            if expense:
-                # receipt_id로 영수증 조회하여 image_url 추가
-                receipt_id = expense.get('receipt_id')
-                if receipt_id:
-                    print(f"[PDF] 영수증 조회 중: {receipt_id}")
-                    receipt = await receipt_service.get_receipt(receipt_id)
-
-                    if receipt and receipt.get('image_url'):
-                        expense['receipt_url'] = receipt.get('image_url')
-                        print(f"[PDF] 영수증 이미지 URL 추가: {receipt.get('image_url')}")
-                    elif receipt_id.startswith('manual-'):
-                        # manual receipt인 경우 자동 매칭 시도
-                        print(f"[PDF] Manual receipt 감지 - 자동 매칭 시도")
-                        expense_date = expense.get('date')
-                        if isinstance(expense_date, str):
-                            try:
-                                expense_date = datetime.fromisoformat(expense_date.replace('Z', '+00:00'))
-                            except:
-                                expense_date = datetime.utcnow()
-
-                        matched_receipt = await receipt_service.find_matching_receipt(
-                            user_id=expense.get('user_id'),
-                            store_name=expense.get('store_name', ''),
-                            amount=expense.get('amount', 0),
-                            date=expense_date
-                        )
-
-                        if matched_receipt and matched_receipt.get('image_url'):
-                            expense['receipt_url'] = matched_receipt.get('image_url')
-                            print(f"[PDF] 매칭된 영수증 이미지 URL 추가: {matched_receipt.get('image_url')}")
-                        else:
-                            print(f"[PDF] 매칭되는 영수증 없음")
-                            expense['receipt_url'] = None
-                    else:
-                        print(f"[PDF] 영수증 이미지 없음")
-                        expense['receipt_url'] = None
-                else:
-                    print(f"[PDF] receipt_id 없음")
-                    expense['receipt_url'] = None
-
-                expenses.append(expense)
-                print(f"[PDF] 지출 내역 추가: {expense.get('store_name', 'N/A')}")
+        manual_expenses = []
+        for expense_id in dict.fromkeys(expense_ids):
+            expense = expenses_by_id.get(expense_id)
+            if not expense:
+                continue
+
+            receipt_id = expense.get('receipt_id')
+            receipt = receipts_by_id.get(receipt_id) if receipt_id else None
+            expense['receipt_url'] = receipt.get('image_url') if receipt else None
+
+            if not expense['receipt_url'] and receipt_id and receipt_id.startswith('manual-'):
+                manual_expenses.append(expense)
+            expenses.append(expense)
+
+        # manual receipt인 지출은 한 번에 자동 매칭 (사용자별 후보 인덱스 사용)
+        if manual_expenses:
+            print(f"[PDF] Manual receipt {len(manual_expenses)}건 자동 매칭 시도")
+            matches = await receipt_service.match_receipts(manual_expenses)
+            for expense in manual_expenses:
+                matched_receipt = matches.get(expense['id'])
+                if matched_receipt:
+                    expense['receipt_url'] = matched_receipt.get('image_url')
 
         if not expenses:
             raise HTTPException(status_code=404, detail="유효한 지출 내역을 찾을 수 없습니다")
 
         print(f"[PDF] 총 {len(expenses)}개 지출 내역으로 PDF 생성 시작")
 
-        # 리포트 PDF 생성
-        pdf_bytes = await pdf_service.generate_report_pdf(expenses)
+        # 리포트 PDF 생성 (임시 파일)
+        pdf_path = await pdf_service.generate_report_pdf_file(expenses)
+        pdf_size = os.path.getsize(pdf_path)
 
-        print(f"[PDF] PDF 생성 완료, 크기: {len(pdf_bytes)} bytes")
+        print(f"[PDF] PDF 생성 완료, 크기: {pdf_size} bytes")
 
         # 파일명 생성
         today = datetime.now().strftime('%Y%m%d')
         filename = f"expense_report_{today}.pdf"
 
-        return Response(
-            content=pdf_bytes,
+        # 파일을 청크 단위로 전송하고, 본문을 끝까지 읽지 않고 응답이 끝나도
+        # 백그라운드 작업으로 임시 파일 삭제
+        return StreamingResponse(
+            pdf_service.iter_report_file(pdf_path),
             media_type="application/pdf",
             headers={
-                "Content-Disposition": f"attachment; filename={filename}"
-            }
+                "Content-Disposition": f"attachment; filename={filename}",
+                "Content-Length": str(pdf_size)
+            },
+            background=BackgroundTask(pdf_service.remove_report_file, pdf_path)
         )
 
     except HTTPException:
         raise
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         print(f"[PDF] 에러 발생: {type(e).__name__}: {str(e)}")
         import traceback
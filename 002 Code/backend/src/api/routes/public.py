@@ -1,10 +1,10 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import uuid
 
 from src.api.dependencies import get_current_user
-from src.core.firebase import firebase_client
+from src.core.firebase import firebase_client, firestore_repo
 
 
 router = APIRouter(prefix="/public", tags=["public"])
@@ -32,15 +32,15 @@ async def create_share_link(current_user: Dict[str, Any] = Depends(get_current_u
             "expires_at": expires_at,
             "active": True,
         }
-        firebase_client.db.collection("public_shares").document(token).set(doc)
+        await firestore_repo.set(firebase_client.db.collection("public_shares").document(token), doc)
         return {"token": token, "expires_at": expires_at.isoformat()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _validate_share_token(token: str) -> str:
+async def _validate_share_token(token: str) -> str:
     doc_ref = firebase_client.db.collection("public_shares").document(token)
-    snap = doc_ref.get()
+    snap = await firestore_repo.get(doc_ref)
     if not snap.exists:
         raise HTTPException(status_code=404, detail="공유 토큰을 찾을 수 없습니다")
     data = snap.to_dict()
@@ -66,10 +66,12 @@ async def get_public_organization(token: str = Query(..., description="공유 
     공유 토큰 기반 자치기구 정보/임원 목록 조회 (무인증)
     """
     try:
-        org_name = _validate_share_token(token)
+        org_name = await _validate_share_token(token)
 
         # users 컬렉션에서 해당 조직 사용자 조회
-        users_ref = firebase_client.db.collection("users").where("organizationName", "==", org_name).stream()
+        users_ref = await firestore_repo.stream(
+            firebase_client.db.collection("users").where("organizationName", "==", org_name)
+        )
         officers: List[Dict[str, Any]] = []
         org_meta: Dict[str, Any] = {
             "name": org_name,
@@ -104,43 +106,42 @@ async def get_public_organization(token: str = Query(..., description="공유 
 
 @router.get("/expenses", response_model=List[Dict[str, Any]])
 async def get_public_expenses(
+    response: Response,
     token: str = Query(..., description="공유 토큰"),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
-    limit: int = Query(1000, ge=1, le=10000),
+    limit: int = Query(500, ge=1, le=500, description="최대 결과 수 (페이지 크기)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
 ):
     """
     공유 토큰 기반 조직 지출 목록 조회 (무인증, 읽기 전용)
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환
     """
     try:
-        org_name = _validate_share_token(token)
+        org_name = await _validate_share_token(token)
 
-        # 같은 조직 사용자 ID 수집
-        users_ref = firebase_client.db.collection("users").where("organizationName", "==", org_name).stream()
-        user_ids = [u.id for u in users_ref]
-        if not user_ids:
-            return []
-
-        # 모든 사용자 지출 모으기
-        expenses: List[Dict[str, Any]] = []
-        for uid in user_ids:
-            q = firebase_client.db.collection("expenses").where("user_id", "==", uid)
-            docs = q.stream()
-            for d in docs:
-                e = d.to_dict()
-                e["id"] = d.id
-                expenses.append(e)
-
-        # Python에서 기간 필터, 정렬
+        # 조직 전체 지출을 단일 쿼리로 조회 (기간 필터, 정렬, limit은 Firestore에서 처리)
+        q = firebase_client.db.collection("expenses").where("organizationName", "==", org_name)
         if start_date:
-            expenses = [e for e in expenses if e.get("date") and e["date"] >= start_date]
+            q = q.where("date", ">=", start_date)
         if end_date:
-            expenses = [e for e in expenses if e.get("date") and e["date"] <= end_date]
+            q = q.where("date", "<=", end_date)
+        q = q.order_by("date", direction="DESCENDING")
 
-        expenses.sort(key=lambda x: x.get("date", datetime.min), reverse=True)
-        return expenses[:limit]
+        docs, next_cursor = await firestore_repo.page(q, "date", limit, cursor)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+
+        expenses: List[Dict[str, Any]] = []
+        for d in docs:
+            e = d.to_dict()
+            e["id"] = d.id
+            expenses.append(e)
+        return expenses
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
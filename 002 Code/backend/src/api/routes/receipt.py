@@ -1,16 +1,32 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Depends
+import asyncio
+from fastapi import APIRouter, UploadFile, File, HTTPException, Query, Depends, Response
+from fastapi.responses import JSONResponse
 from typing import Optional, List
 from datetime import datetime
 from src.services.receipt_service import receipt_service
+from src.services.ocr_job_service import ocr_job_service
+from src.services.ocr_service import ocr_service
+from src.services.storage_service import storage_service
 from src.schemas.receipt import ReceiptResponse
 from src.api.dependencies import get_current_user
 
 router = APIRouter(prefix="/receipt", tags=["receipt"])
 
 
+def _job_accepted(receipt: dict) -> JSONResponse:
+    """작업 모드 응답 (202 Accepted + 작업 ID)"""
+    return JSONResponse(status_code=202, content={
+        "status": "pending",
+        "job_id": receipt["id"],
+        "receipt_id": receipt["id"],
+        "status_url": f"/receipt/jobs/{receipt['id']}"
+    })
+
+
 @router.post("/ocr")
 async def ocr_receipt(
     file: UploadFile = File(...),
+    async_job: bool = Query(False, description="작업 모드: OCR 완료를 기다리지 않고 202와 작업 ID 반환"),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -25,25 +41,28 @@ async def ocr_receipt(
     2. OCR 처리
     3. 상호명, 주소, 전화번호, 날짜, 금액 추출
     4. Receipt 정보 반환 및 DB 저장
+
+    async_job=true이면 영수증을 pending 상태로 저장하고 즉시 202를 반환합니다.
+    결과는 GET /receipt/jobs/{job_id}로 조회합니다.
     """
     try:
         # 인증된 사용자 ID 가져오기
         user_id = current_user["user_id"]
 
-        # 이미지 파일 읽기
-        image_data = await file.read()
+        # 업로드 파일은 bytes로 복사하지 않고 전처리기가 직접 읽음 (메모리에 남는 전처리본을 OCR과 Storage 업로드에 함께 사용)
+        image_data = await ocr_service.preprocess_image(file.file)
 
-        # 1. Firebase Storage에 이미지 업로드
-        from src.core.firebase import firebase_client
-        from src.services.ocr_service import ocr_service
-        
-        uploaded_image_url = firebase_client.upload_image(
-            image_data=image_data,
-            user_id=user_id
-        )
+        if async_job:
+            receipt = await ocr_job_service.submit(user_id=user_id, image_data=image_data)
+            return _job_accepted(receipt)
+
+        # 1~2. Firebase Storage 업로드와 OCR 처리를 동시에 진행
+        from src.core.firebase import firebase_client, firestore_repo
 
-        # 2. OCR 처리
-        ocr_result = await ocr_service.process_receipt(image_data=image_data)
+        uploaded, ocr_result = await asyncio.gather(
+            storage_service.upload_receipt_image(image_data, user_id),
+            ocr_service.process_receipt(image_data=image_data)
+        )
 
         if ocr_result["status"] != "success":
             raise HTTPException(status_code=400, detail=f"OCR 처리 실패: {ocr_result.get('message', 'Unknown error')}")
@@ -69,7 +88,9 @@ async def ocr_receipt(
             "total_amount": ocr_data.get("total_amount", 0),
             "purchase_date": purchase_date,
             "items": [],
-            "image_url": uploaded_image_url,
+            "image_url": uploaded["image_url"] if uploaded else None,
+            "image_size_bytes": uploaded["size_bytes"] if uploaded else 0,
+            "image_content_type": uploaded["content_type"] if uploaded else None,
             "ocr_raw_data": ocr_result.get("raw_ocr_response"),
             "ocr_status": "completed",
             "ocr_processed_at": datetime.utcnow(),
@@ -79,7 +100,7 @@ async def ocr_receipt(
 
         # 5. Firestore에 Receipt 저장
         receipt_ref = firebase_client.db.collection("receipts").document()
-        receipt_ref.set(receipt_data)
+        await firestore_repo.set(receipt_ref, receipt_data)
         receipt_id = receipt_ref.id
 
         print(f"[SUCCESS] Receipt saved: {receipt_id}")
@@ -101,6 +122,8 @@ async def ocr_receipt(
 
     except HTTPException:
         raise
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         print(f"[ERROR] Receipt OCR/Upload failed: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -109,6 +132,7 @@ async def ocr_receipt(
 @router.post("/upload")
 async def upload_receipt(
     file: UploadFile = File(...),
+    async_job: bool = Query(False, description="작업 모드: 처리 완료를 기다리지 않고 202와 작업 ID 반환"),
     current_user: dict = Depends(get_current_user)
 ):
     """
@@ -125,19 +149,32 @@ async def upload_receipt(
     4. 카테고리 자동 분류
     5. 품목별 Expense 생성
     6. Receipt 저장
+
+    async_job=true이면 영수증을 pending 상태로 저장하고 즉시 202를 반환합니다.
+    결과는 GET /receipt/jobs/{job_id}로 조회합니다.
     """
     try:
         # 인증된 사용자 ID 가져오기
         user_id = current_user["user_id"]
 
-        # 이미지 파일 읽기
-        image_data = await file.read()
+        # 업로드 파일은 bytes로 복사하지 않고 전처리기가 직접 읽음 (메모리에 남는 전처리본을 OCR과 Storage 업로드에 함께 사용)
+        image_data = await ocr_service.preprocess_image(file.file)
+
+        if async_job:
+            receipt = await ocr_job_service.submit(
+                user_id=user_id,
+                image_data=image_data,
+                create_expense=True,
+                organizationName=current_user.get("organizationName")
+            )
+            return _job_accepted(receipt)
 
         # 전체 처리 플로우 실행
         result = await receipt_service.upload_and_process_receipt(
             user_id=user_id,
             image_data=image_data,
-            image_url=None  # TODO: 이미지 스토리지 업로드 후 URL 설정
+            image_url=None,  # TODO: 이미지 스토리지 업로드 후 URL 설정
+            organizationName=current_user.get("organizationName")
         )
 
         return {
@@ -149,31 +186,67 @@ async def upload_receipt(
             "message": result["message"]
         }
 
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/jobs/{job_id}")
+async def get_ocr_job(job_id: str, current_user: dict = Depends(get_current_user)):
+    """
+    OCR 작업 상태 조회
+
+    - status: pending / processing / success / failed
+    - success이면 OCR 결과(data)와 생성된 지출 수(expenses_count)를 함께 반환
+    """
+    try:
+        job = await ocr_job_service.get_status(job_id, current_user["user_id"])
+
+        if not job:
+            raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+
+        return job
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/", response_model=List[ReceiptResponse])
 async def get_receipts(
+    response: Response,
     start_date: Optional[datetime] = Query(None, description="시작 날짜"),
     end_date: Optional[datetime] = Query(None, description="종료 날짜"),
-    limit: int = Query(100, ge=1, le=1000, description="최대 결과 수"),
+    limit: int = Query(100, ge=1, le=500, description="최대 결과 수 (페이지 크기)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
     current_user: dict = Depends(get_current_user)
 ):
-    """영수증 목록 조회"""
+    """
+    영수증 목록 조회
+
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다
+    """
     try:
         # 인증된 사용자 ID 가져오기
         user_id = current_user["user_id"]
 
-        receipts = await receipt_service.get_receipts(
+        page = await receipt_service.get_receipts(
             user_id=user_id,
             start_date=start_date,
             end_date=end_date,
-            limit=limit
+            limit=limit,
+            cursor=cursor
         )
 
-        return receipts
+        if page["next_cursor"]:
+            response.headers["X-Next-Cursor"] = page["next_cursor"]
+
+        return page["items"]
 
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
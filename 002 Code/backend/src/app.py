@@ -0,0 +1,78 @@
+"""FastAPI 앱 정의 (라우터 등록, 시작 이벤트)"""
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from src.core.config import settings
+from src.api.routes import budget, receipt, auth, expense, department, admin, data, report, public
+
+# FastAPI 앱 초기화
+app = FastAPI(
+    title=settings.APP_NAME,
+    version=settings.APP_VERSION,
+    description="NAVER Clover OCR을 활용한 조직예산 관리 API",
+    docs_url="/docs",
+    redoc_url="/redoc"
+)
+
+# CORS 설정
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # 또는 ["http://ec2-43-203-136-37.ap-northeast-2.compute.amazonaws.com:3000"]
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # 목록 API 페이지 커서
+)
+
+# 라우터 등록 - prefix는 각 라우터에 이미 정의되어 있음
+app.include_router(auth.router)
+app.include_router(budget.router)
+app.include_router(receipt.router)
+app.include_router(expense.router)
+app.include_router(department.router)
+app.include_router(admin.router)
+app.include_router(data.router)
+app.include_router(report.router)
+app.include_router(public.router)
+
+
+@app.on_event("startup")
+async def warm_up_ai_model():
+    """AI 분류 모델을 백그라운드에서 로드 (로드 전에는 키워드 분류 사용)"""
+    from src.services.category_service import category_service
+    if settings.AI_MODEL_PRELOAD and category_service.ai_service:
+        category_service.ai_service.start_loading()
+
+
+@app.on_event("startup")
+async def recover_ocr_jobs():
+    """OCR 작업 임대 갱신 시작 (임대가 만료된 pending/processing 작업은 주기적으로 실패 처리)"""
+    from src.services.ocr_job_service import ocr_job_service
+    ocr_job_service.start_lease_keeper()
+
+
+@app.get("/")
+async def root():
+    """API 루트 엔드포인트"""
+    return {
+        "message": "Budget Management API",
+        "version": settings.APP_VERSION,
+        "docs": "/docs",
+        "redoc": "/redoc"
+    }
+
+
+@app.get("/health")
+async def health_check():
+    """헬스 체크 엔드포인트"""
+    return {"status": "healthy"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """준비 상태 확인 (AI 분류 모델 로드 상태 및 소요 시간 포함)"""
+    from src.services.category_service import category_service
+    ai_status = category_service.ai_service.status() if category_service.ai_service else {"state": "unavailable", "available": False}
+    return {
+        "status": "ready" if ai_status["available"] else "degraded",
+        "ai_model": ai_status
+    }
@@ -1,3 +1,4 @@
+import os
 from pydantic_settings import BaseSettings
 from typing import Optional, List
 from pydantic import field_validator
@@ -16,10 +17,50 @@ class Settings(BaseSettings):
     FIREBASE_PRIVATE_KEY: Optional[str] = None
     FIREBASE_CLIENT_EMAIL: Optional[str] = None
     FIREBASE_STORAGE_BUCKET: Optional[str] = None
+    STORAGE_UPLOAD_CHUNK_MB: int = 5  # 이보다 큰 이미지는 청크 단위로 업로드 (256KB 배수)
+    FIRESTORE_MAX_WORKERS: int = 16  # Firestore 동기 SDK 호출용 스레드 풀 크기
 
     # Azure OCR 설정
     AZURE_OCR_ENDPOINT: Optional[str] = None
     AZURE_OCR_KEY: Optional[str] = None
+    OCR_JOB_WORKERS: int = 4  # 비동기 OCR 작업을 동시에 처리하는 워커 수
+    OCR_JOB_QUEUE_MAX: int = 64  # 대기 중인 OCR 작업 최대 수 (작업마다 이미지 바이트를 메모리에 보관)
+    OCR_JOB_LEASE_SECONDS: int = 300  # 작업 임대 시간 (이 시간 동안 updated_at 갱신이 없으면 중단된 작업으로 실패 처리)
+    OCR_CACHE_MAX_ENTRIES: int = 256  # OCR 결과 메모리 캐시 최대 항목 수
+    OCR_CACHE_TTL_DAYS: int = 30  # OCR 결과 캐시 보관 기간 (Firestore TTL)
+
+    # 영수증 이미지 전처리 (OCR 및 Storage 업로드 전)
+    OCR_PREPROCESS_ENABLED: bool = True
+    OCR_MAX_DIMENSION: int = 2000  # 긴 변 최대 픽셀 (OCR 인식에 충분한 해상도 유지)
+    OCR_GRAYSCALE: bool = False
+    OCR_DESKEW: bool = True  # 영수증 윤곽 검출 후 잘라내기/기울기 보정
+    OCR_JPEG_QUALITY: int = 85
+
+    # PDF 생성 (프로세스 풀)
+    PDF_MAX_WORKERS: int = 2  # 렌더링 워커 프로세스 수
+    PDF_MAX_PENDING: int = 8  # 처리 중 + 대기 중 작업 최대 수 (초과 시 503)
+    PDF_REPORT_MAX_EXPENSES: int = 200  # 리포트 하나에 포함할 수 있는 최대 지출 건수
+    PDF_IMAGE_FETCH_CONCURRENCY: int = 8  # 영수증 이미지 동시 다운로드 수
+    PDF_THUMBNAIL_CACHE_DIR: str = "cache/receipt_thumbnails"  # PDF용 축소 영수증 이미지 디스크 캐시
+    PDF_THUMBNAIL_CACHE_MAX_MB: int = 256
+    PDF_SPOOL_DIR: Optional[str] = None  # 리포트 PDF/이미지 임시 파일 위치 (None이면 시스템 임시 디렉터리)
+    PDF_STREAM_CHUNK_BYTES: int = 64 * 1024  # 리포트 PDF 응답 청크 크기
+
+    # 카테고리 분류 키워드 설정 파일 (POST /admin/classification/keywords/reload로 재로드)
+    CATEGORY_KEYWORDS_PATH: str = os.path.join(os.path.dirname(__file__), "category_keywords.json")
+
+    # 영수증 매칭용 상호명 브랜드 별칭 (정규 브랜드명 → 표기 목록)
+    STORE_ALIASES_PATH: str = os.path.join(os.path.dirname(__file__), "store_aliases.json")
+
+    # AI 카테고리 분류 결과 캐시
+    AI_CACHE_PATH: str = "cache/classification_cache.sqlite3"
+    AI_CACHE_MAX_ENTRIES: int = 2048
+    AI_CACHE_TTL_DAYS: int = 30
+    AI_BATCH_MAX_SIZE: int = 16  # 한 번에 추론할 최대 분류 요청 수
+    AI_BATCH_MAX_WAIT_MS: int = 10  # 배치를 채우기 위해 기다리는 최대 시간
+    AI_MODEL_PRELOAD: bool = True  # 서버 시작 직후 백그라운드에서 모델 로드 (False면 첫 분류 요청 시)
+    AI_ENGINE: str = "nli"  # pipeline(HF 파이프라인) / nli(가설 토큰 캐시) / embedding(임베딩 유사도)
+    AI_EMBEDDING_MODEL: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
 
     # CORS 설정
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:8080,http://localhost:5173"
@@ -1,9 +1,21 @@
 import firebase_admin
 from firebase_admin import credentials, firestore, auth, storage
 from src.core.config import settings
-from typing import Optional
+from typing import Optional, Any, Callable, Dict, Iterable, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import base64
+import functools
+import json
 import uuid
-from datetime import timedelta
+from datetime import datetime, timedelta
+
+
+# Firestore 제약: `in` 쿼리 값 최대 30개, 배치 쓰기 최대 500건
+FIRESTORE_IN_QUERY_LIMIT = 30
+FIRESTORE_BATCH_LIMIT = 500
+# 배치 읽기(get_all) 한 번에 요청하는 문서 수 (청크들은 동시에 요청)
+FIRESTORE_GET_ALL_CHUNK = 100
 
 
 class FirebaseClient:
@@ -130,5 +142,221 @@ class FirebaseClient:
         return False
 
 
+class FirestoreRepository:
+    """
+    Firestore 비동기 접근 레이어
+
+    firebase-admin의 Firestore SDK는 동기 API이므로, 모든 네트워크 호출
+    (get/stream/set/update/delete)을 전용 스레드 풀에서 실행하여
+    uvicorn 이벤트 루프가 막히지 않도록 한다.
+    쿼리 객체 구성(where/order_by/limit)은 I/O가 없으므로 호출부에서 그대로 수행한다.
+    """
+
+    def __init__(self, client: FirebaseClient, max_workers: int):
+        self._client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="firestore"
+        )
+
+    @property
+    def db(self):
+        """Firestore 데이터베이스 인스턴스"""
+        return self._client.db
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """동기 함수를 Firestore 전용 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(func, *args, **kwargs)
+        )
+
+    async def get(self, ref):
+        """문서 스냅샷 조회"""
+        return await self.run(ref.get)
+
+    async def stream(self, query) -> List[Any]:
+        """쿼리 결과 스냅샷 전체를 스레드 풀에서 읽어서 반환"""
+        return await self.run(lambda: list(query.stream()))
+
+    async def set(self, ref, data: Dict[str, Any], merge: bool = False):
+        """문서 저장"""
+        return await self.run(ref.set, data, merge=merge)
+
+    async def update(self, ref, data: Dict[str, Any]):
+        """문서 수정"""
+        return await self.run(ref.update, data)
+
+    async def delete(self, ref):
+        """문서 삭제"""
+        return await self.run(ref.delete)
+
+    async def get_all(self, refs: Iterable[Any]) -> List[Any]:
+        """
+        여러 문서를 배치 읽기로 조회
+
+        FIRESTORE_GET_ALL_CHUNK개씩 나누어 동시에 요청합니다.
+        결과 순서는 요청 순서와 다를 수 있으므로 호출부에서 문서 ID로 매칭해야 합니다.
+        """
+        refs = list(refs)
+        if not refs:
+            return []
+
+        chunks = [
+            refs[i:i + FIRESTORE_GET_ALL_CHUNK]
+            for i in range(0, len(refs), FIRESTORE_GET_ALL_CHUNK)
+        ]
+        results = await asyncio.gather(*(
+            self.run(lambda chunk=chunk: list(self.db.get_all(chunk)))
+            for chunk in chunks
+        ))
+        return [snapshot for result in results for snapshot in result]
+
+    async def count(self, query) -> int:
+        """
+        쿼리 결과 문서 수를 서버 측 count() 집계로 조회
+
+        집계 쿼리를 지원하지 않는 환경(구버전 에뮬레이터 등)에서는
+        필드 없이 문서 ID만 읽는 프로젝션 스캔으로 대체한다.
+        """
+        try:
+            result = await self.run(lambda: query.count(alias="count").get())
+            return int(result[0][0].value)
+        except Exception as e:
+            print(f"[Firestore] count() 집계 실패, 프로젝션 스캔으로 대체: {e}")
+            return len(await self.stream(query.select([])))
+
+    async def sum(self, query, field: str) -> float:
+        """
+        쿼리 결과의 숫자 필드 합계를 서버 측 sum() 집계로 조회
+
+        집계 쿼리를 지원하지 않는 환경에서는 해당 필드만 프로젝션하여 합산한다.
+        """
+        try:
+            result = await self.run(lambda: query.sum(field, alias="total").get())
+            return result[0][0].value or 0
+        except Exception as e:
+            print(f"[Firestore] sum() 집계 실패, 프로젝션 스캔으로 대체: {e}")
+            docs = await self.stream(query.select([field]))
+            return sum((doc.to_dict() or {}).get(field) or 0 for doc in docs)
+
+    async def batch_write(self, ops: Iterable[Tuple[str, Any, Optional[Dict[str, Any]]]]) -> int:
+        """
+        ("set" | "merge" | "update" | "delete", 문서 참조, 데이터) 목록을 배치 쓰기로 반영
+
+        Firestore 배치 한도(500건)마다 나누어 커밋한다.
+
+        Returns:
+            반영된 문서 수
+        """
+        committed = 0
+        batch = self.db.batch()
+        pending = 0
+        for op, ref, data in ops:
+            if op == "set":
+                batch.set(ref, data)
+            elif op == "merge":
+                batch.set(ref, data, merge=True)
+            elif op == "update":
+                batch.update(ref, data)
+            elif op == "delete":
+                batch.delete(ref)
+            else:
+                raise ValueError(f"지원하지 않는 배치 작업입니다: {op}")
+            pending += 1
+            if pending >= FIRESTORE_BATCH_LIMIT:
+                await self.run(batch.commit)
+                committed += pending
+                batch = self.db.batch()
+                pending = 0
+        if pending:
+            await self.run(batch.commit)
+            committed += pending
+        return committed
+
+    async def batch_update(self, updates: Iterable[Tuple[Any, Dict[str, Any]]]) -> int:
+        """
+        (문서 참조, 수정 데이터) 목록을 배치 쓰기로 반영
+
+        Returns:
+            반영된 문서 수
+        """
+        return await self.batch_write(("update", ref, data) for ref, data in updates)
+
+    async def page(
+        self,
+        query,
+        order_field: str,
+        limit: int,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        커서 기반 페이지 조회
+
+        query는 order_field 기준 내림차순 정렬이 이미 적용되어 있어야 하며,
+        동일 값 사이의 순서를 고정하기 위해 문서 ID 정렬을 추가한다.
+
+        Args:
+            query: 정렬된 Firestore 쿼리
+            order_field: 정렬 기준 필드명
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor (선택)
+
+        Returns:
+            (문서 스냅샷 리스트, 다음 페이지 커서 또는 None)
+
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        query = query.order_by("__name__", direction="DESCENDING")
+        if cursor:
+            value, path = self.decode_cursor(cursor)
+            query = query.start_after({
+                order_field: value,
+                "__name__": self.db.document(path)
+            })
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        docs = await self.stream(query.limit(limit + 1))
+        if len(docs) <= limit:
+            return docs, None
+
+        docs = docs[:limit]
+        last = docs[-1]
+        return docs, self.encode_cursor(last.get(order_field), last.reference.path)
+
+    @staticmethod
+    def encode_cursor(value: Any, path: str) -> str:
+        """정렬 값과 문서 경로를 불투명한 커서 문자열로 인코딩"""
+        if isinstance(value, datetime):
+            payload = {"t": "dt", "v": value.isoformat(), "p": path}
+        else:
+            payload = {"t": "raw", "v": value, "p": path}
+        raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[Any, str]:
+        """커서 문자열을 (정렬 값, 문서 경로)로 디코딩"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+            value = payload["v"]
+            if payload.get("t") == "dt":
+                value = datetime.fromisoformat(value)
+            return value, payload["p"]
+        except Exception:
+            raise ValueError("유효하지 않은 커서입니다")
+
+    @staticmethod
+    def to_dict(doc) -> Dict[str, Any]:
+        """스냅샷을 id가 포함된 딕셔너리로 변환"""
+        data = doc.to_dict() or {}
+        data["id"] = doc.id
+        return data
+
+
 # 싱글톤 인스턴스
 firebase_client = FirebaseClient()
+firestore_repo = FirestoreRepository(firebase_client, settings.FIRESTORE_MAX_WORKERS)
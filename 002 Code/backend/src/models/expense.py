@@ -18,7 +18,7 @@ class Expense:
         store_phone_number: Optional[str] = None,
         description: Optional[str] = None,
         item_name: Optional[str] = None,
-        classification_method: str = "auto",  # auto, manual
+        classification_method: str = "keyword",  # ai, keyword, manual (이전 데이터는 auto)
         classification_confidence: Optional[float] = None,
         created_at: Optional[datetime] = None,
         updated_at: Optional[datetime] = None
@@ -31,6 +31,7 @@ class ExpenseUpdate(BaseModel):
     store_phone_number: Optional[str] = Field(None, max_length=50)
     description: Optional[str] = Field(None, max_length=500)
     item_name: Optional[str] = Field(None, max_length=200)
+    budget_id: Optional[str] = Field(None, max_length=100, description="연결된 예산 ID")
 
 
 class ExpenseResponse(ExpenseBase):
@@ -39,6 +40,7 @@ class ExpenseResponse(ExpenseBase):
     user_id: str
     receipt_id: Optional[str]
     budget_id: Optional[str] = None
+    organizationName: Optional[str] = None
     classification_method: str
     classification_confidence: Optional[float] = None
     created_at: datetime
@@ -0,0 +1,120 @@
+"""
+AI 카테고리 분류 추론 엔진
+
+AICategoryService의 모델 로드 스레드에서만 임포트합니다 (transformers/torch 의존).
+모든 엔진은 classify_batch(texts) → [(카테고리 설명, 신뢰도), ...]를 제공합니다.
+"""
+from typing import List, Tuple
+import torch
+from transformers import (
+    AutoModel,
+    AutoModelForSequenceClassification,
+    AutoTokenizer,
+    pipeline
+)
+
+
+class PipelineEngine:
+    """
+    HF zero-shot-classification 파이프라인 (기존 방식)
+
+    호출마다 전제 문장과 모든 가설 문장을 다시 토큰화합니다.
+    """
+
+    def __init__(self, model_name: str, labels: List[str], hypothesis_template: str):
+        self.labels = labels
+        self.hypothesis_template = hypothesis_template
+        self.classifier = pipeline(
+            "zero-shot-classification",
+            model=model_name,
+            device=-1  # CPU 사용 (GPU 없어도 동작)
+        )
+
+    def classify_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
+        results = self.classifier(
+            texts,
+            candidate_labels=self.labels,
+            hypothesis_template=self.hypothesis_template,
+            batch_size=len(texts)
+        )
+        if isinstance(results, dict):
+            results = [results]
+        return [(result["labels"][0], result["scores"][0]) for result in results]
+
+
+class CachedHypothesisEngine:
+    """
+    가설 문장 토큰을 미리 계산해 두는 NLI 분류 엔진
+
+    파이프라인과 같은 모델/점수 방식(라벨별 entailment 로짓의 softmax)을 쓰지만,
+    가설 문장은 초기화 시 한 번만 토큰화하고 요청마다 전제 문장만 토큰화하여
+    (전제 × 라벨) 쌍을 한 번의 forward pass로 추론합니다.
+    """
+
+    def __init__(self, model_name: str, labels: List[str], hypothesis_template: str):
+        self.labels = labels
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_name).eval()
+
+        self.entailment_id = next(
+            index for label, index in self.model.config.label2id.items()
+            if label.lower().startswith("entail")
+        )
+        self.max_length = min(self.tokenizer.model_max_length, 512)
+
+        # 가설 문장 토큰 (특수 토큰 제외) - 요청마다 재사용
+        self.hypothesis_ids = [
+            self.tokenizer.encode(hypothesis_template.format(label), add_special_tokens=False)
+            for label in labels
+        ]
+
+    def classify_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
+        rows = []
+        for text in texts:
+            premise = self.tokenizer.encode(text, add_special_tokens=False)
+            for hypothesis in self.hypothesis_ids:
+                # 특수 토큰 3개([CLS], [SEP] x2) 자리를 남기고 전제 문장을 자름
+                room = self.max_length - len(hypothesis) - 3
+                rows.append(self.tokenizer.build_inputs_with_special_tokens(premise[:room], hypothesis))
+
+        inputs = self.tokenizer.pad({"input_ids": rows}, return_tensors="pt")
+        with torch.inference_mode():
+            logits = self.model(**inputs).logits[:, self.entailment_id]
+
+        scores = logits.view(len(texts), len(self.labels)).softmax(dim=-1)
+        best = scores.argmax(dim=-1).tolist()
+        return [(self.labels[index], float(scores[row, index])) for row, index in enumerate(best)]
+
+
+class EmbeddingEngine:
+    """
+    문장 임베딩 유사도 기반 분류 엔진 (저비용 대안)
+
+    라벨 설명의 임베딩을 미리 계산해 두고, 요청마다 입력 문장만 인코딩하여
+    코사인 유사도의 softmax를 신뢰도로 사용합니다.
+    NLI보다 훨씬 빠르지만 신뢰도 분포가 달라 단계별 임계값 조정이 필요할 수 있습니다.
+    """
+
+    def __init__(self, model_name: str, labels: List[str], temperature: float = 0.05):
+        self.labels = labels
+        self.temperature = temperature
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModel.from_pretrained(model_name).eval()
+
+        # 라벨 임베딩 - 요청마다 재사용
+        self.label_embeddings = self._embed(labels)
+
+    def _embed(self, texts: List[str]) -> torch.Tensor:
+        """평균 풀링 + L2 정규화 문장 임베딩"""
+        inputs = self.tokenizer(texts, padding=True, truncation=True, max_length=128, return_tensors="pt")
+        with torch.inference_mode():
+            hidden = self.model(**inputs).last_hidden_state
+        mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+        pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+        return torch.nn.functional.normalize(pooled, dim=-1)
+
+    def classify_batch(self, texts: List[str]) -> List[Tuple[str, float]]:
+        similarities = self._embed(texts) @ self.label_embeddings.T
+        scores = (similarities / self.temperature).softmax(dim=-1)
+        best = scores.argmax(dim=-1).tolist()
+        return [(self.labels[index], float(scores[row, index])) for row, index in enumerate(best)]
@@ -2,10 +2,18 @@
 AI 기반 카테고리 분류 서비스
 License: Apache 2.0 (polyglot-ko model)
 """
-from typing import Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional
+from concurrent.futures import Future
+import asyncio
+import hashlib
+import json
 import logging
-from transformers import pipeline
+import queue
+import threading
+import time
+from src.core.config import settings
 from src.models.expense import ExpenseCategory
+from src.services.classification_cache_service import ClassificationCacheService
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +27,7 @@ class AICategoryService:
     """
 
     def __init__(self):
-        self.classifier = None
+        self.engine = None
         self.categories = [
             ExpenseCategory.FOOD,
             ExpenseCategory.DINING_OUT,
@@ -45,29 +53,119 @@ class AICategoryService:
             ExpenseCategory.OTHER: "기타 항목"
         }
 
-        self._initialize_model()
+        self.model_name = "MoritzLaurer/mDeBERTa-v3-base-xnli-multilingual-nli-2mil7"
+        self.hypothesis_template = "이 영수증 항목은 {}에 해당합니다."
+
+        # 카테고리 설명/모델/가설 문장이 바뀌면 캐시 버전이 바뀌어 이전 결과가 무효화됨
+        self.cache = ClassificationCacheService(
+            path=settings.AI_CACHE_PATH,
+            version=self._cache_version(),
+            max_entries=settings.AI_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.AI_CACHE_TTL_DAYS * 24 * 3600
+        )
+
+        # 마이크로 배치 추론 워커 (모델 로드 성공 시 시작)
+        self._requests: "queue.Queue[Tuple[str, str, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+        # 모델 로드 상태 (not_loaded → loading → ready / failed)
+        self.state = "not_loaded"
+        self.load_seconds: Optional[float] = None
+        self.load_error: Optional[str] = None
+        self._load_lock = threading.Lock()
+        self._load_finished = threading.Event()
+
+    def _cache_version(self) -> str:
+        """분류 결과에 영향을 주는 설정의 해시"""
+        raw = json.dumps({
+            "model": self.model_name,
+            "engine": settings.AI_ENGINE,
+            "embedding_model": settings.AI_EMBEDDING_MODEL if settings.AI_ENGINE == "embedding" else None,
+            "template": self.hypothesis_template,
+            "descriptions": {str(k): v for k, v in self.category_descriptions.items()}
+        }, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+    def start_loading(self):
+        """
+        백그라운드 스레드에서 모델 로드 시작 (중복 호출 시 무시)
+
+        AI_MODEL_PRELOAD이면 서버 시작 직후, 아니면 첫 분류 요청 시 CategoryService가 호출합니다.
+        로드가 끝나기 전까지 is_available()은 False이므로 키워드 분류가 요청을 처리합니다.
+        """
+        with self._load_lock:
+            if self.state != "not_loaded":
+                return
+            self.state = "loading"
+
+        threading.Thread(
+            target=self._initialize_model,
+            name="ai-category-loader",
+            daemon=True
+        ).start()
+
+    def create_engine(self, kind: str):
+        """
+        추론 엔진 생성
+
+        Args:
+            kind: pipeline / nli / embedding
+        """
+        from src.services import ai_category_engines
+
+        labels = list(self.category_descriptions.values())
+        if kind == "pipeline":
+            return ai_category_engines.PipelineEngine(self.model_name, labels, self.hypothesis_template)
+        if kind == "nli":
+            return ai_category_engines.CachedHypothesisEngine(self.model_name, labels, self.hypothesis_template)
+        if kind == "embedding":
+            return ai_category_engines.EmbeddingEngine(settings.AI_EMBEDDING_MODEL, labels)
+        raise ValueError(f"지원하지 않는 AI 엔진입니다: {kind}")
 
     def _initialize_model(self):
         """
-        AI 모델 초기화 (lazy loading)
+        AI 모델 초기화 (백그라운드 스레드에서 실행)
         """
+        started = time.perf_counter()
         try:
             logger.info("Initializing AI classification model...")
 
-            # Zero-shot classification pipeline
-            # 다국어 지원 모델 (한국어 포함)
-            self.classifier = pipeline(
-                "zero-shot-classification",
-                model="MoritzLaurer/mDeBERTa-v3-base-xnli-multilingual-nli-2mil7",
-                device=-1  # CPU 사용 (GPU 없어도 동작)
+            # transformers/torch 임포트 자체도 오래 걸리므로 로드 시점에 임포트
+            engine = self.create_engine(settings.AI_ENGINE)
+
+            self._worker = threading.Thread(
+                target=self._batch_loop,
+                name="ai-category-batcher",
+                daemon=True
             )
+            self._worker.start()
 
-            logger.info("AI model initialized successfully")
+            self.engine = engine
+            self.load_seconds = round(time.perf_counter() - started, 2)
+            self.state = "ready"
+            logger.info(f"AI model initialized successfully ({self.load_seconds}s)")
 
         except Exception as e:
             logger.error(f"Failed to initialize AI model: {e}")
             logger.warning("AI classification will be disabled")
-            self.classifier = None
+            self.engine = None
+            self.load_seconds = round(time.perf_counter() - started, 2)
+            self.load_error = str(e)
+            self.state = "failed"
+
+        finally:
+            self._load_finished.set()
+
+    def wait_until_loaded(self, timeout: Optional[float] = None) -> bool:
+        """
+        모델 로드를 시작하고 끝날 때까지 대기 (동기, 스크립트용)
+
+        Returns:
+            모델 사용 가능 여부 (로드 실패/시간 초과 시 False)
+        """
+        self.start_loading()
+        self._load_finished.wait(timeout)
+        return self.is_available()
 
     def classify(
         self,
@@ -75,7 +173,10 @@ class AICategoryService:
         item_name: Optional[str] = None
     ) -> Tuple[str, float]:
         """
-        AI 기반 카테고리 분류
+        AI 기반 카테고리 분류 (동기, 스크립트용)
+
+        배치 워커에 요청을 넣고 결과를 기다립니다.
+        이벤트 루프에서는 classify_async를 사용하세요.
 
         Args:
             store_name: 상점명
@@ -84,37 +185,116 @@ class AICategoryService:
         Returns:
             (카테고리, 신뢰도) 튜플
         """
-        if not self.classifier:
-            return ExpenseCategory.OTHER, 0.0
+        return self.submit(store_name, item_name).result()
+
+    async def classify_async(
+        self,
+        store_name: str,
+        item_name: Optional[str] = None
+    ) -> Tuple[str, float]:
+        """
+        AI 기반 카테고리 분류 (비동기)
+
+        캐시 조회(SQLite)를 포함한 요청 등록은 스레드에서, 추론은 배치 워커 스레드에서
+        실행되며 이벤트 루프는 결과만 기다립니다.
+        """
+        future = await asyncio.to_thread(self.submit, store_name, item_name)
+        return await asyncio.wrap_future(future)
+
+    def submit(
+        self,
+        store_name: str,
+        item_name: Optional[str] = None
+    ) -> Future:
+        """
+        분류 요청 등록
+
+        캐시에 있으면 바로 완료된 Future를, 아니면 배치 워커가 완료할 Future를 반환합니다.
+        """
+        future: Future = Future()
+
+        if not self.engine:
+            self.start_loading()
+            future.set_result((ExpenseCategory.OTHER, 0.0))
+            return future
+
+        cache_key = self.cache.normalize_key(store_name, item_name)
+        cached = self.cache.get(cache_key)
+        if cached:
+            future.set_result(cached)
+            return future
+
+        # 분류할 텍스트 구성
+        text = self._build_classification_text(store_name, item_name)
+        self._requests.put((cache_key, text, future))
+        return future
 
+    def _batch_loop(self):
+        """
+        배치 워커 스레드
+
+        첫 요청이 들어오면 AI_BATCH_MAX_WAIT_MS 동안 또는 AI_BATCH_MAX_SIZE개가
+        모일 때까지 요청을 더 모아 한 번의 엔진 호출로 추론합니다.
+        배치 하나가 실패해도 워커는 계속 다음 요청을 처리합니다.
+        """
+        max_wait = settings.AI_BATCH_MAX_WAIT_MS / 1000
+        while True:
+            batch = [self._requests.get()]
+            deadline = time.monotonic() + max_wait
+            while len(batch) < settings.AI_BATCH_MAX_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._requests.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            # 호출자가 이미 취소한 요청(asyncio.wrap_future 취소 등)은 제외하고,
+            # 나머지는 실행 중으로 표시해 이후 취소되지 않게 함
+            batch = [request for request in batch if request[2].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                logger.error(f"AI classification batch failed: {e}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_result((ExpenseCategory.OTHER, 0.0))
+
+    def _run_batch(self, batch: List[Tuple[str, str, Future]]):
+        """요청 묶음을 한 번에 추론하고 각 Future에 결과 설정"""
         try:
-            # 분류할 텍스트 구성
-            text = self._build_classification_text(store_name, item_name)
+            started = time.perf_counter()
 
             # Zero-shot classification 수행
-            result = self.classifier(
-                text,
-                candidate_labels=list(self.category_descriptions.values()),
-                hypothesis_template="이 영수증 항목은 {}에 해당합니다."
-            )
+            results = self.engine.classify_batch([text for _, text, _ in batch])
 
-            # 결과 파싱
-            best_label = result['labels'][0]
-            best_score = result['scores'][0]
+            # 캐시 적중 시 절약되는 시간 추정치 (요청당 평균)
+            elapsed_ms = (time.perf_counter() - started) * 1000 / len(batch)
 
+        except Exception as e:
+            logger.error(f"AI classification failed: {e}")
+            for _, _, future in batch:
+                future.set_result((ExpenseCategory.OTHER, 0.0))
+            return
+
+        cached = []
+        for (cache_key, text, future), (best_label, best_score) in zip(batch, results):
             # 설명에서 카테고리 코드로 역매핑
             category = self._description_to_category(best_label)
 
             logger.info(
                 f"AI Classification: '{text}' -> {category} "
-                f"(confidence: {best_score:.2f})"
+                f"(confidence: {best_score:.2f}, batch: {len(batch)})"
             )
 
-            return category, best_score
+            cached.append((cache_key, category, best_score, elapsed_ms))
+            future.set_result((category, best_score))
 
-        except Exception as e:
-            logger.error(f"AI classification failed: {e}")
-            return ExpenseCategory.OTHER, 0.0
+        # 결과를 먼저 돌려준 뒤 묶음 전체를 한 번의 커밋으로 캐시에 저장
+        self.cache.set_many(cached)
 
     def _build_classification_text(
         self,
@@ -143,7 +323,18 @@ class AICategoryService:
         """
         AI 모델 사용 가능 여부 확인
         """
-        return self.classifier is not None
+        return self.engine is not None
+
+    def status(self) -> Dict[str, Any]:
+        """모델 로드 상태 (준비 상태 확인용)"""
+        return {
+            "model": self.model_name,
+            "engine": settings.AI_ENGINE,
+            "state": self.state,
+            "available": self.is_available(),
+            "load_seconds": self.load_seconds,
+            "error": self.load_error
+        }
 
 
 # 싱글톤 인스턴스
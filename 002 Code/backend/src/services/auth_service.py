@@ -3,7 +3,7 @@ from typing import Optional, Dict, Any, List
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from src.core.config import settings
-from src.core.firebase import firebase_client
+from src.core.firebase import firebase_client, firestore_repo
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -14,6 +14,7 @@ class AuthService:
 
     def __init__(self):
         self.db = firebase_client.db
+        self.repo = firestore_repo
         self.collection = "users"
 
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -73,10 +74,11 @@ class AuthService:
             position = user_data.get("position")
 
             # 1. 이메일 중복 체크
-            existing_users = self.db.collection(self.collection)\
-                .where("email", "==", email)\
-                .limit(1)\
-                .stream()
+            existing_users = await self.repo.stream(
+                self.db.collection(self.collection)
+                .where("email", "==", email)
+                .limit(1)
+            )
 
             if any(existing_users):
                 raise Exception("이미 존재하는 이메일입니다")
@@ -110,7 +112,7 @@ class AuthService:
                 user_doc["position"] = position
 
             doc_ref = self.db.collection(self.collection).document()
-            doc_ref.set(user_doc)
+            await self.repo.set(doc_ref, user_doc)
 
             # 4. 응답 데이터 생성 (비밀번호 제외)
             user_doc["id"] = doc_ref.id
@@ -137,10 +139,11 @@ class AuthService:
         """
         try:
             # 1. Firestore에서 사용자 조회
-            users = self.db.collection(self.collection)\
-                .where("email", "==", email)\
-                .limit(1)\
-                .stream()
+            users = await self.repo.stream(
+                self.db.collection(self.collection)
+                .where("email", "==", email)
+                .limit(1)
+            )
 
             user_doc = None
             user_id = None
@@ -199,7 +202,7 @@ class AuthService:
         """
         try:
             doc_ref = self.db.collection(self.collection).document(user_id)
-            doc = doc_ref.get()
+            doc = await self.repo.get(doc_ref)
 
             if not doc.exists:
                 return None
@@ -229,9 +232,10 @@ class AuthService:
         """
         try:
             # 같은 조직의 사용자 조회
-            users_ref = self.db.collection(self.collection)\
-                .where("organizationName", "==", organizationName)\
-                .stream()
+            users_ref = await self.repo.stream(
+                self.db.collection(self.collection)
+                .where("organizationName", "==", organizationName)
+            )
 
             users = []
             for doc in users_ref:
@@ -259,7 +263,7 @@ class AuthService:
         """
         try:
             # 모든 사용자 조회
-            users_ref = self.db.collection(self.collection).stream()
+            users_ref = await self.repo.stream(self.db.collection(self.collection))
 
             # organizationName별로 그룹화
             organizations_map = {}
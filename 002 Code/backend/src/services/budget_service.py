@@ -1,6 +1,7 @@
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from src.core.firebase import firebase_client
+from firebase_admin import firestore
+from src.core.firebase import firebase_client, firestore_repo
 
 
 class BudgetService:
@@ -8,6 +9,7 @@ class BudgetService:
 
     def __init__(self):
         self.db = firebase_client.db
+        self.repo = firestore_repo
         self.collection = "budgets"
         self.expense_collection = "expenses"
 
@@ -26,29 +28,26 @@ class BudgetService:
             budgets: List[Dict[str, Any]] = []
 
             # 1) 개인 예산 조회
-            user_budgets_ref = self.db.collection(self.collection)\
-                .where("user_id", "==", user_id)\
-                .stream()
+            user_budgets_ref = await self.repo.stream(
+                self.db.collection(self.collection)
+                .where("user_id", "==", user_id)
+            )
 
             for doc in user_budgets_ref:
                 budget_data = doc.to_dict()
                 budget_data["id"] = doc.id
 
-                spent = await self._calculate_spent(
-                    user_id,
-                    budget_data.get("id"),  # budget_id
-                    budget_data.get("category"),
-                    budget_data.get("organizationName")
-                )
+                spent = await self._resolve_spent(budget_data)
                 budget_data["spent"] = spent
                 budget_data["remaining"] = budget_data["amount"] - spent
                 budgets.append(budget_data)
 
             # 2) 조직 예산 추가 조회 (조직 이름이 있는 경우)
             if organizationName:
-                org_budgets_ref = self.db.collection(self.collection)\
-                    .where("organizationName", "==", organizationName)\
-                    .stream()
+                org_budgets_ref = await self.repo.stream(
+                    self.db.collection(self.collection)
+                    .where("organizationName", "==", organizationName)
+                )
 
                 # 중복 방지를 위한 ID 집합
                 existing_ids = {b["id"] for b in budgets}
@@ -59,12 +58,7 @@ class BudgetService:
                     budget_data = doc.to_dict()
                     budget_data["id"] = doc.id
 
-                    spent = await self._calculate_spent(
-                        user_id,
-                        budget_data.get("id"),  # budget_id
-                        budget_data.get("category"),
-                        budget_data.get("organizationName") or organizationName
-                    )
+                    spent = await self._resolve_spent(budget_data)
                     budget_data["spent"] = spent
                     budget_data["remaining"] = budget_data["amount"] - spent
                     budgets.append(budget_data)
@@ -88,7 +82,7 @@ class BudgetService:
         try:
             # Firestore에서 예산 조회
             doc_ref = self.db.collection(self.collection).document(budget_id)
-            doc = doc_ref.get()
+            doc = await self.repo.get(doc_ref)
 
             if not doc.exists:
                 return None
@@ -100,8 +94,8 @@ class BudgetService:
             if budget_data.get("user_id") != user_id:
                 raise Exception("권한이 없습니다")
 
-            # 실제 지출 금액 계산
-            spent = await self._calculate_spent(user_id, budget_id, budget_data.get("category"))
+            # 지출 누계 (예산 문서에 유지되는 spent)
+            spent = await self._resolve_spent(budget_data)
             budget_data["spent"] = spent
             budget_data["remaining"] = budget_data["amount"] - spent
 
@@ -129,6 +123,7 @@ class BudgetService:
                 "name": budget_data["name"],
                 "amount": budget_data["amount"],
                 "category": budget_data.get("category", "전체"),
+                "spent": 0.0,  # 지출 생성/수정/삭제 시 트랜잭션으로 갱신되는 누계
                 "created_at": datetime.utcnow(),
                 "updated_at": datetime.utcnow()
             }
@@ -140,11 +135,10 @@ class BudgetService:
 
             # Firestore에 저장
             doc_ref = self.db.collection(self.collection).document()
-            doc_ref.set(new_budget)
+            await self.repo.set(doc_ref, new_budget)
 
             # 응답 데이터 생성
             new_budget["id"] = doc_ref.id
-            new_budget["spent"] = 0.0
             new_budget["remaining"] = new_budget["amount"]
 
             return new_budget
@@ -161,9 +155,10 @@ class BudgetService:
         """
         try:
             updated = 0
-            budgets_ref = self.db.collection(self.collection)\
-                .where("user_id", "==", user_id)\
-                .stream()
+            budgets_ref = await self.repo.stream(
+                self.db.collection(self.collection)
+                .where("user_id", "==", user_id)
+            )
 
             for doc in budgets_ref:
                 data = doc.to_dict()
@@ -171,7 +166,7 @@ class BudgetService:
                 if data.get("organizationName"):
                     continue
                 # 조직 이름 설정
-                self.db.collection(self.collection).document(doc.id).update({
+                await self.repo.update(self.db.collection(self.collection).document(doc.id), {
                     "organizationName": organizationName,
                     "updated_at": datetime.utcnow()
                 })
@@ -201,7 +196,7 @@ class BudgetService:
         try:
             # 기존 예산 조회 및 권한 확인
             doc_ref = self.db.collection(self.collection).document(budget_id)
-            doc = doc_ref.get()
+            doc = await self.repo.get(doc_ref)
 
             if not doc.exists:
                 raise Exception("예산을 찾을 수 없습니다")
@@ -223,14 +218,14 @@ class BudgetService:
                 update_data["category"] = budget_data["category"]
 
             # Firestore 업데이트
-            doc_ref.update(update_data)
+            await self.repo.update(doc_ref, update_data)
 
             # 업데이트된 데이터 반환
             existing_budget.update(update_data)
             existing_budget["id"] = budget_id
 
-            # 실제 지출 금액 계산
-            spent = await self._calculate_spent(user_id, budget_id, existing_budget.get("category"))
+            # 지출 누계 (예산 문서에 유지되는 spent)
+            spent = await self._resolve_spent(existing_budget)
             existing_budget["spent"] = spent
             existing_budget["remaining"] = existing_budget["amount"] - spent
 
@@ -253,7 +248,7 @@ class BudgetService:
         try:
             # 기존 예산 조회 및 권한 확인
             doc_ref = self.db.collection(self.collection).document(budget_id)
-            doc = doc_ref.get()
+            doc = await self.repo.get(doc_ref)
 
             if not doc.exists:
                 raise Exception("예산을 찾을 수 없습니다")
@@ -266,122 +261,109 @@ class BudgetService:
                     raise Exception("권한이 없습니다")
 
             # Firestore에서 삭제
-            doc_ref.delete()
+            await self.repo.delete(doc_ref)
 
             return True
 
         except Exception as e:
             raise Exception(f"예산 삭제 실패: {str(e)}")
 
-    async def _calculate_spent(self, user_id: str, budget_id: Optional[str] = None, category: Optional[str] = None, organizationName: Optional[str] = None) -> float:
+    async def _resolve_spent(self, budget_data: Dict[str, Any]) -> float:
         """
-        예산별 지출 금액 계산 (budget_id 우선, 없으면 category 기반)
+        예산 문서의 spent 누계 반환
+
+        spent 필드가 없는 기존 예산은 연결된 지출을 한 번 합산하여 문서에 저장하고,
+        이후에는 지출 쓰기 시 갱신되는 누계를 그대로 사용합니다.
+        초기화는 예산 문서와 지출 쿼리를 다시 읽는 트랜잭션 안에서 수행하므로,
+        합산과 저장 사이에 생성된 지출(누계가 없어 증감을 건너뛴 지출)이 빠지지 않고
+        동시에 다른 요청이 먼저 초기화했다면 그 값을 그대로 사용합니다.
 
         Args:
-            user_id: 사용자 ID
-            budget_id: 예산 ID (우선 사용)
-            category: 카테고리 (budget_id가 없을 때 fallback)
-            organizationName: 조직 이름 (있는 경우 조직 멤버 전체 지출 합산)
+            budget_data: 예산 데이터 (id 포함)
 
         Returns:
             총 지출 금액
         """
-        try:
-            # budget_id가 있으면 해당 예산에 연결된 지출만 계산
-            if budget_id:
-                # 조직 공유 예산인 경우
-                if organizationName:
-                    # 같은 조직의 모든 사용자 ID 가져오기
-                    users_ref = self.db.collection("users")\
-                        .where("organizationName", "==", organizationName)\
-                        .stream()
-                    
-                    user_ids = []
-                    for user_doc in users_ref:
-                        user_ids.append(user_doc.id)
-                    
-                    # 모든 사용자의 해당 예산 지출 합산
-                    total_spent = 0.0
-                    for org_user_id in user_ids:
-                        expenses_ref = self.db.collection(self.expense_collection)\
-                            .where("user_id", "==", org_user_id)\
-                            .where("budget_id", "==", budget_id)
-                        
-                        expenses = expenses_ref.stream()
-                        
-                        for expense_doc in expenses:
-                            expense_data = expense_doc.to_dict()
-                            total_spent += expense_data.get("amount", 0.0)
-                    
-                    return total_spent
-                else:
-                    # 개인 예산인 경우
-                    expenses_ref = self.db.collection(self.expense_collection)\
-                        .where("user_id", "==", user_id)\
-                        .where("budget_id", "==", budget_id)
-
-                    expenses = expenses_ref.stream()
-
-                    # 총 지출 금액 계산
-                    total_spent = 0.0
-                    for expense_doc in expenses:
-                        expense_data = expense_doc.to_dict()
-                        total_spent += expense_data.get("amount", 0.0)
-
-                    return total_spent
-            
-            # budget_id가 없으면 기존 category 기반 로직 (하위 호환)
-            # 조직 공유 예산인 경우
-            if organizationName:
-                # 같은 조직의 모든 사용자 ID 가져오기
-                users_ref = self.db.collection("users")\
-                    .where("organizationName", "==", organizationName)\
-                    .stream()
-                
-                user_ids = []
-                for user_doc in users_ref:
-                    user_ids.append(user_doc.id)
-                
-                # 모든 사용자의 지출 합산
-                total_spent = 0.0
-                for org_user_id in user_ids:
-                    expenses_ref = self.db.collection(self.expense_collection)\
-                        .where("user_id", "==", org_user_id)
-                    
-                    # 카테고리 필터 (있는 경우)
-                    if category and category != "전체":
-                        expenses_ref = expenses_ref.where("category", "==", category)
-                    
-                    expenses = expenses_ref.stream()
-                    
-                    for expense_doc in expenses:
-                        expense_data = expense_doc.to_dict()
-                        total_spent += expense_data.get("amount", 0.0)
-                
-                return total_spent
-            else:
-                # 개인 예산인 경우
-                expenses_ref = self.db.collection(self.expense_collection)\
-                    .where("user_id", "==", user_id)
-
-                # 카테고리 필터 (있는 경우)
-                if category and category != "전체":
-                    expenses_ref = expenses_ref.where("category", "==", category)
-
-                expenses = expenses_ref.stream()
-
-                # 총 지출 금액 계산
-                total_spent = 0.0
-                for expense_doc in expenses:
-                    expense_data = expense_doc.to_dict()
-                    total_spent += expense_data.get("amount", 0.0)
-
-                return total_spent
+        if "spent" in budget_data:
+            return float(budget_data.get("spent") or 0.0)
 
+        try:
+            return await self._initialize_spent(budget_data["id"])
         except Exception as e:
             # 에러가 나도 0 반환 (지출 계산 실패해도 예산 조회는 가능하게)
             print(f"지출 계산 실패: {str(e)}")
             return 0.0
 
+    async def _initialize_spent(self, budget_id: str) -> float:
+        """spent 필드가 없는 예산의 누계를 연결된 지출 합계로 초기화 (트랜잭션)"""
+        budget_ref = self.db.collection(self.collection).document(budget_id)
+        expense_query = self.db.collection(self.expense_collection)\
+            .where("budget_id", "==", budget_id)\
+            .select(["amount"])
+
+        @firestore.transactional
+        def _initialize(transaction):
+            snapshot = budget_ref.get(transaction=transaction)
+            if not snapshot.exists:
+                return 0.0
+            stored = snapshot.to_dict() or {}
+            if "spent" in stored:
+                return float(stored.get("spent") or 0.0)
+
+            spent = 0.0
+            for expense_doc in transaction.get(expense_query):
+                spent += float((expense_doc.to_dict() or {}).get("amount") or 0.0)
+            transaction.update(budget_ref, {"spent": spent})
+            return spent
+
+        return await self.repo.run(_initialize, self.db.transaction())
+
+    async def reconcile_spent(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        모든 예산의 spent 누계를 지출 원본과 비교하여 보정
+
+        Args:
+            dry_run: 실제 수정하지 않고 불일치 목록만 반환
+
+        Returns:
+            보정 결과 통계
+        """
+        try:
+            # 1) 지출을 한 번만 읽어서 예산별 합계 계산
+            expenses = await self.repo.stream(
+                self.db.collection(self.expense_collection).select(["budget_id", "amount"])
+            )
+            totals: Dict[str, float] = {}
+            for expense_doc in expenses:
+                expense_data = expense_doc.to_dict() or {}
+                budget_id = expense_data.get("budget_id")
+                if budget_id:
+                    totals[budget_id] = totals.get(budget_id, 0.0) + expense_data.get("amount", 0.0)
+
+            # 2) 예산 문서의 누계와 비교
+            budgets = await self.repo.stream(
+                self.db.collection(self.collection).select(["spent"])
+            )
+            drifted = []
+            updates = []
+            for budget_doc in budgets:
+                stored = (budget_doc.to_dict() or {}).get("spent")
+                actual = totals.get(budget_doc.id, 0.0)
+                if stored is None or abs(float(stored) - actual) > 0.005:
+                    drifted.append({"budget_id": budget_doc.id, "stored": stored, "actual": actual})
+                    updates.append((budget_doc.reference, {"spent": actual}))
+
+            if not dry_run:
+                await self.repo.batch_update(updates)
+
+            return {
+                "checked": len(budgets),
+                "drifted": drifted,
+                "repaired": 0 if dry_run else len(updates),
+                "dry_run": dry_run
+            }
+
+        except Exception as e:
+            raise Exception(f"예산 누계 보정 실패: {str(e)}")
 
 budget_service = BudgetService()
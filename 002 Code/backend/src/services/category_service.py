@@ -1,6 +1,10 @@
-from typing import Dict, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
+import json
 import logging
+import time
+from src.core.config import settings
 from src.models.expense import ExpenseCategory
+from src.services.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -19,88 +23,65 @@ class CategoryService:
             logger.warning("AI classification not available (dependencies missing)")
         except Exception as e:
             logger.warning(f"AI classification disabled: {e}")
-        # 상호명 기반 카테고리 매핑
-        self.store_keywords = {
-            ExpenseCategory.FOOD: [
-                "스타벅스", "커피", "카페", "cafe", "coffee",
-                "맥도날드", "버거킹", "롯데리아", "kfc",
-                "편의점", "gs25", "cu", "세븐일레븐", "이마트24",
-                "김밥", "치킨", "피자", "중국집", "한식", "일식", "양식",
-                "베이커리", "빵", "마트", "마켓", "슈퍼"
-            ],
-            ExpenseCategory.OFFICE_SUPPLIES: [
-                "다이소", "알파", "문구", "사무", "office",
-                "복사", "인쇄", "프린트", "용지", "펜", "노트",
-                "모닝글로리", "교보문고", "yes24"
-            ],
-            ExpenseCategory.DINING_OUT: [
-                "술집", "bar", "pub", "호프", "포차",
-                "삼겹살", "고깃집", "회식", "연회", "뷔페",
-                "레스토랑", "restaurant"
-            ],
-            ExpenseCategory.TRANSPORTATION: [
-                "택시", "taxi", "우버", "카카오택시",
-                "주차", "parking", "주유", "gas", "oil",
-                "버스", "지하철", "ktx", "기차", "렌터카"
-            ],
-            ExpenseCategory.UTILITIES: [
-                "전기", "수도", "가스", "관리비",
-                "통신", "인터넷", "kt", "skt", "lg", "u+"
-            ],
-            ExpenseCategory.ENTERTAINMENT: [
-                "cgv", "메가박스", "롯데시네마", "영화",
-                "노래방", "pc방", "오락", "게임"
-            ],
-            ExpenseCategory.EDUCATION: [
-                "학원", "교육", "education", "academy",
-                "도서", "book", "강의", "수강", "튜터",
-                "교재", "영어교재", "토익", "토익강의", "토플", "영어", "중국어", "일본어",
-                "강좌", "온라인강의", "인강"
-            ],
-            ExpenseCategory.HEALTH: [
-                "병원", "hospital", "의원", "clinic",
-                "약국", "pharmacy", "한의원", "치과"
-            ]
-        }
+        # 상호명/품목명 키워드 (설정 파일에서 로드, reload_keywords로 재로드)
+        self.store_keywords: Dict[str, List[str]] = {}
+        self.item_keywords: Dict[str, List[str]] = {}
+        self.reload_keywords()
+
+    def _ai_ready(self) -> bool:
+        """
+        AI 모델 사용 가능 여부
+
+        아직 로드하지 않은 모델(AI_MODEL_PRELOAD=False)은 여기서 백그라운드 로드를 시작하고,
+        로드가 끝날 때까지는 키워드 분류를 사용하도록 False를 반환합니다.
+        """
+        if self.ai_service is None:
+            return False
+        if self.ai_service.is_available():
+            return True
+        self.ai_service.start_loading()
+        return False
+
+    def reload_keywords(self) -> Dict[str, Any]:
+        """
+        키워드 설정 파일을 다시 읽어 매처 재구성
+
+        파일 형식: {"priority": {카테고리: 우선순위}, "store": {카테고리: [키워드]}, "item": {...}}
+        우선순위가 높은 카테고리가 먼저, 같으면 더 긴 키워드가 선택됩니다.
+        새 매처를 모두 만든 뒤 교체하므로 분류 중인 요청에는 영향이 없습니다.
+
+        Returns:
+            로드된 키워드 수
+        """
+        with open(settings.CATEGORY_KEYWORDS_PATH, encoding="utf-8") as f:
+            config = json.load(f)
+
+        priority = config.get("priority", {})
+        store_keywords = config.get("store", {})
+        item_keywords = config.get("item", {})
+        store_matcher = KeywordMatcher(store_keywords, priority)
+        item_matcher = KeywordMatcher(item_keywords, priority)
+
+        self.store_keywords, self.item_keywords = store_keywords, item_keywords
+        self._store_matcher, self._item_matcher = store_matcher, item_matcher
 
-        # 품목명 기반 카테고리 매핑 (메인 분류 로직)
-        self.item_keywords = {
-            ExpenseCategory.FOOD: [
-                # 음료
-                "음료", "커피", "아메리카노", "라떼", "카페라떼", "카푸치노",
-                "에스프레소", "주스", "차", "tea", "음료수", "cola", "콜라",
-                # 식사/간식
-                "음식", "식사", "간식", "과자", "빵", "케이크", "샌드위치",
-                "김밥", "도시락", "햄버거", "피자", "치킨", "떡볶이",
-                "라면", "국수", "우동", "파스타", "쌀", "밥"
-            ],
-            ExpenseCategory.DINING_OUT: [
-                # 회식/술자리 관련
-                "소주", "맥주", "와인", "양주", "사케", "위스키", "하이볼",
-                "안주", "삼겹살", "목살", "갈비", "곱창", "대창", "막창",
-                "고기", "육회", "회", "조개", "해산물", "구이", "찜",
-                "전골", "탕", "찌개", "정식", "세트", "코스",
-                # 고급 요리
-                "스테이크", "랍스터", "오마카세"
-            ],
-            ExpenseCategory.OFFICE_SUPPLIES: [
-                "볼펜", "샤프", "연필", "지우개", "공책", "노트", "수첩",
-                "파일", "폴더", "바인더", "클립", "스테이플러", "호치키스",
-                "테이프", "풀", "가위", "칼", "자", "형광펜", "마커",
-                "포스트잇", "메모지", "용지", "A4", "복사지", "인쇄",
-                "토너", "잉크", "프린터", "책상", "의자", "캐비닛"
-            ],
-            ExpenseCategory.TRANSPORTATION: [
-                "휘발유", "경유", "lpg", "충전", "세차", "통행료",
-                "택시", "버스", "지하철", "기차", "ktx", "주유"
-            ],
-            ExpenseCategory.UTILITIES: [
-                "전기", "수도", "가스", "관리비", "요금"
-            ],
-            ExpenseCategory.HEALTH: [
-                "약", "medicine", "처방", "진료", "검사", "치료"
-            ]
+        counts = {
+            "store_keywords": sum(len(words) for words in store_keywords.values()),
+            "item_keywords": sum(len(words) for words in item_keywords.values())
         }
+        logger.info(f"Category keywords loaded: {counts}")
+        return counts
+
+    @staticmethod
+    def classification_method(stage: str) -> str:
+        """
+        판정 단계를 지출에 저장하는 분류 방식으로 변환
+
+        Returns:
+            "ai" (AI 단계) 또는 "keyword" (키워드/금액 규칙, 기본값)
+            사용자가 직접 고른 카테고리는 ExpenseService에서 "manual"로 저장합니다.
+        """
+        return "ai" if stage in ("ai", "ai_fallback") else "keyword"
 
     def classify_by_store(self, store_name: str) -> Tuple[str, float]:
         """
@@ -115,12 +96,9 @@ class CategoryService:
         if not store_name:
             return ExpenseCategory.OTHER, 0.0
 
-        store_name_lower = store_name.lower()
-
-        for category, keywords in self.store_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in store_name_lower:
-                    return category, 0.7  # 중간 신뢰도 (유명 브랜드만 신뢰)
+        category = self._store_matcher.match(store_name)
+        if category:
+            return category, 0.7  # 중간 신뢰도 (유명 브랜드만 신뢰)
 
         return ExpenseCategory.OTHER, 0.0
 
@@ -137,12 +115,9 @@ class CategoryService:
         if not item_name:
             return ExpenseCategory.OTHER, 0.0
 
-        item_name_lower = item_name.lower()
-
-        for category, keywords in self.item_keywords.items():
-            for keyword in keywords:
-                if keyword.lower() in item_name_lower:
-                    return category, 0.9  # 높은 신뢰도 (상품명이 더 정확)
+        category = self._item_matcher.match(item_name)
+        if category:
+            return category, 0.9  # 높은 신뢰도 (상품명이 더 정확)
 
         return ExpenseCategory.OTHER, 0.0
 
@@ -155,13 +130,7 @@ class CategoryService:
         """
         하이브리드 카테고리 분류 (AI + 키워드)
 
-        분류 전략:
-        1. AI 모델 분류 (신뢰도 0.8 이상)
-        2. 키워드 매칭 - 품목명 우선 (신뢰도 0.9 이상)
-        3. 키워드 매칭 - 상호명 (신뢰도 0.7 이상)
-        4. AI 모델 낮은 신뢰도 결과
-        5. 키워드 낮은 신뢰도 결과
-        6. 기타
+        단계별 판정 규칙과 근거는 classify_detailed를 참고하세요.
 
         Args:
             store_name: 상점명
@@ -171,90 +140,213 @@ class CategoryService:
         Returns:
             (카테고리, 신뢰도) 튜플
         """
-        # === 1단계: AI 모델 분류 (Primary) ===
-        if self.ai_service and self.ai_service.is_available():
+        result = self.classify_detailed(store_name, item_name, amount)
+        return result["category"], result["confidence"]
+
+    async def classify_async(
+        self,
+        store_name: str,
+        item_name: Optional[str] = None,
+        amount: Optional[float] = None
+    ) -> Tuple[str, float]:
+        """
+        하이브리드 카테고리 분류 (비동기)
+
+        AI 추론은 배치 워커 스레드에서 실행되므로 이벤트 루프를 막지 않습니다.
+
+        Returns:
+            (카테고리, 신뢰도) 튜플
+        """
+        result = await self.classify_detailed_async(store_name, item_name, amount)
+        return result["category"], result["confidence"]
+
+    async def classify_detailed_async(
+        self,
+        store_name: str,
+        item_name: Optional[str] = None,
+        amount: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        classify_detailed의 비동기 버전
+
+        AI 신호는 1단계에서 항상 필요하므로 먼저 기다린 뒤 판정 규칙에 넘깁니다.
+        AI 사용 여부도 여기서 한 번만 판단해 넘기므로, 그 사이 모델 로드가 끝나도
+        판정 규칙에서 블로킹 AI 호출을 하지 않습니다.
+        """
+        ai_result = None
+        ai_ms = None
+        if self._ai_ready():
+            started = time.perf_counter()
             try:
-                ai_category, ai_confidence = self.ai_service.classify(
+                ai_result = await self.ai_service.classify_async(
                     store_name=store_name,
                     item_name=item_name
                 )
+            except Exception as e:
+                logger.error(f"AI classification error: {e}")
+                ai_result = (ExpenseCategory.OTHER, 0.0)
+            ai_ms = round((time.perf_counter() - started) * 1000, 2)
 
-                if ai_confidence >= 0.8:
-                    logger.info(
-                        f"AI classification (high confidence): "
-                        f"{store_name}/{item_name} -> {ai_category} ({ai_confidence:.2f})"
-                    )
-                    return ai_category, ai_confidence
+        result = self.classify_detailed(
+            store_name, item_name, amount,
+            ai_result=ai_result,
+            ai_available=ai_result is not None
+        )
+        if ai_ms is not None:
+            result["timings_ms"]["ai"] = ai_ms
+        return result
 
+    def classify_detailed(
+        self,
+        store_name: str,
+        item_name: Optional[str] = None,
+        amount: Optional[float] = None,
+        ai_result: Optional[Tuple[str, float]] = None,
+        ai_available: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        """
+        하이브리드 카테고리 분류 및 판정 근거
+
+        각 신호(AI, 품목 키워드, 상호 키워드, 금액)는 요청당 최대 한 번만 계산하고,
+        아래 순서의 판정 규칙에 적용합니다.
+        1. AI 모델 분류 (신뢰도 0.8 이상)
+        2. 키워드 매칭 - 품목명 우선 (신뢰도 0.9 이상)
+        3. 키워드 매칭 - 상호명 (신뢰도 0.7 이상)
+        4. AI 모델 낮은 신뢰도 결과 (0.5 초과)
+        5. 키워드 낮은 신뢰도 결과
+        6. 금액 기반 휴리스틱
+        7. 기타
+
+        Args:
+            store_name: 상점명
+            item_name: 품목명 (선택)
+            amount: 금액 (선택, 추가 휴리스틱용)
+            ai_result: 미리 계산된 AI 분류 결과 (비동기 호출에서 전달)
+            ai_available: AI 단계 적용 여부 (None이면 모델 상태로 판단하고 필요 시 동기 호출,
+                비동기 호출에서는 ai_result를 구했는지를 전달)
+
+        Returns:
+            {"category", "confidence", "stage": 판정 단계,
+             "signals": 계산된 신호별 (카테고리, 신뢰도), "timings_ms": 신호별 소요 시간}
+        """
+        signals: Dict[str, Tuple[str, float]] = {}
+        timings_ms: Dict[str, float] = {}
+
+        def signal(name: str, compute: Callable[[], Tuple[str, float]]) -> Tuple[str, float]:
+            """신호를 처음 필요할 때 한 번만 계산"""
+            if name not in signals:
+                started = time.perf_counter()
+                signals[name] = compute()
+                timings_ms[name] = round((time.perf_counter() - started) * 1000, 2)
+            return signals[name]
+
+        def decide(stage: str, category: str, confidence: float) -> Dict[str, Any]:
+            return {
+                "category": category,
+                "confidence": confidence,
+                "stage": stage,
+                "signals": signals,
+                "timings_ms": timings_ms
+            }
+
+        def classify_ai() -> Tuple[str, float]:
+            if ai_result is not None:
+                return ai_result
+            try:
+                return self.ai_service.classify(store_name=store_name, item_name=item_name)
             except Exception as e:
                 logger.error(f"AI classification error: {e}")
+                return ExpenseCategory.OTHER, 0.0
+
+        if ai_available is None:
+            ai_available = self._ai_ready()
+
+        # === 1단계: AI 모델 분류 (Primary) ===
+        if ai_available:
+            ai_category, ai_confidence = signal("ai", classify_ai)
+
+            if ai_confidence >= 0.8:
+                logger.info(
+                    f"AI classification (high confidence): "
+                    f"{store_name}/{item_name} -> {ai_category} ({ai_confidence:.2f})"
+                )
+                return decide("ai", ai_category, ai_confidence)
 
         # === 2단계: 키워드 품목명 분류 (높은 신뢰도) ===
         if item_name:
-            item_category, item_confidence = self.classify_by_item(item_name)
+            item_category, item_confidence = signal("item_keyword", lambda: self.classify_by_item(item_name))
 
             if item_confidence >= 0.9:
                 logger.info(
                     f"Keyword classification (item): "
                     f"{item_name} -> {item_category} ({item_confidence:.2f})"
                 )
-                return item_category, item_confidence
+                return decide("item_keyword", item_category, item_confidence)
 
         # === 3단계: 키워드 상호명 분류 (중간 신뢰도) ===
-        store_category, store_confidence = self.classify_by_store(store_name)
+        store_category, store_confidence = signal("store_keyword", lambda: self.classify_by_store(store_name))
 
         if store_confidence >= 0.7:
             logger.info(
                 f"Keyword classification (store): "
                 f"{store_name} -> {store_category} ({store_confidence:.2f})"
             )
-            return store_category, store_confidence
+            return decide("store_keyword", store_category, store_confidence)
 
-        # === 4단계: AI 낮은 신뢰도 결과 사용 ===
-        if self.ai_service and self.ai_service.is_available():
-            try:
-                ai_category, ai_confidence = self.ai_service.classify(
-                    store_name=store_name,
-                    item_name=item_name
-                )
-
-                if ai_confidence > 0.5:
-                    logger.info(
-                        f"AI classification (low confidence fallback): "
-                        f"{store_name}/{item_name} -> {ai_category} ({ai_confidence:.2f})"
-                    )
-                    return ai_category, ai_confidence
+        # === 4단계: AI 낮은 신뢰도 결과 사용 (1단계 결과 재사용) ===
+        if ai_available:
+            ai_category, ai_confidence = signals["ai"]
 
-            except Exception as e:
-                logger.error(f"AI classification error (fallback): {e}")
+            if ai_confidence > 0.5:
+                logger.info(
+                    f"AI classification (low confidence fallback): "
+                    f"{store_name}/{item_name} -> {ai_category} ({ai_confidence:.2f})"
+                )
+                return decide("ai_fallback", ai_category, ai_confidence)
 
-        # === 5단계: 키워드 낮은 신뢰도 결과 ===
+        # === 5단계: 키워드 낮은 신뢰도 결과 (2단계 결과 재사용) ===
         if item_name:
-            item_category, item_confidence = self.classify_by_item(item_name)
+            item_category, item_confidence = signals["item_keyword"]
             if item_confidence > 0:
                 logger.info(
                     f"Keyword classification (item fallback): "
                     f"{item_name} -> {item_category} ({item_confidence:.2f})"
                 )
-                return item_category, item_confidence
+                return decide("item_keyword_fallback", item_category, item_confidence)
 
         if store_confidence > 0:
             logger.info(
                 f"Keyword classification (store fallback): "
                 f"{store_name} -> {store_category} ({store_confidence:.2f})"
             )
-            return store_category, store_confidence
+            return decide("store_keyword_fallback", store_category, store_confidence)
 
         # === 6단계: 금액 기반 휴리스틱 (선택적) ===
-        if amount and amount > 100000:  # 10만원 이상
-            # 대형 지출은 회식이나 사무용품일 가능성
+        amount_category, amount_confidence = signal("amount", lambda: self.classify_by_amount(amount))
+        if amount_confidence > 0:
             logger.info(f"Amount-based heuristic: large expense -> DINING_OUT")
-            return ExpenseCategory.DINING_OUT, 0.3
+            return decide("amount", amount_category, amount_confidence)
 
         # === 7단계: 기본값 ===
         logger.warning(
             f"Classification failed for {store_name}/{item_name} -> OTHER"
         )
+        return decide("default", ExpenseCategory.OTHER, 0.0)
+
+    def classify_by_amount(self, amount: Optional[float]) -> Tuple[str, float]:
+        """
+        금액 기반 휴리스틱 분류
+
+        Args:
+            amount: 금액
+
+        Returns:
+            (카테고리, 신뢰도) 튜플
+        """
+        if amount and amount > 100000:  # 10만원 이상
+            # 대형 지출은 회식이나 사무용품일 가능성
+            return ExpenseCategory.DINING_OUT, 0.3
+
         return ExpenseCategory.OTHER, 0.0
 
     def get_category_suggestions(self, text: str) -> list[Dict[str, any]]:
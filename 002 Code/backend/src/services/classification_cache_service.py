@@ -0,0 +1,155 @@
+"""AI 카테고리 분류 결과 캐시 (정규화된 상호명/품목명 기준)"""
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+
+class ClassificationCacheService:
+    """
+    (상호명, 품목명) → (카테고리, 신뢰도) LRU + TTL 캐시
+
+    메모리 LRU를 먼저 확인하고, 없으면 로컬 SQLite 파일을 조회하여
+    서버 재시작 후에도 이전 분류 결과를 재사용합니다.
+    version(카테고리 설명/모델 설정의 해시)이 바뀌면 이전 결과는 모두 무효화됩니다.
+    메모리 LRU와 SQLite 연결은 각각 다른 잠금으로 보호하여, 디스크 조회/저장 중에도
+    다른 스레드의 메모리 적중은 기다리지 않습니다.
+    디스크를 읽고 쓰므로 이벤트 루프에서 직접 호출하지 말고 스레드에서 호출하세요.
+    """
+
+    def __init__(self, path: str, version: str, max_entries: int, ttl_seconds: int):
+        self.path = path
+        self.version = version
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._memory: "OrderedDict[str, Tuple[str, float, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()  # 메모리 LRU, 통계
+        self._db_lock = threading.Lock()  # SQLite 연결
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+        self.saved_ms = 0.0
+        self._open()
+
+    def _open(self):
+        """SQLite 파일 열기 및 다른 버전/만료 항목 정리 (실패 시 메모리 캐시만 사용)"""
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS classification_cache ("
+                "key TEXT PRIMARY KEY, version TEXT, category TEXT, "
+                "confidence REAL, elapsed_ms REAL, created_at REAL)"
+            )
+            self._conn.execute(
+                "DELETE FROM classification_cache WHERE version != ? OR created_at < ?",
+                (self.version, time.time() - self.ttl_seconds)
+            )
+            self._conn.commit()
+        except Exception as e:
+            print(f"[Classification Cache] 디스크 캐시 사용 불가, 메모리 캐시만 사용: {e}")
+            self._conn = None
+
+    @staticmethod
+    def normalize_key(store_name: Optional[str], item_name: Optional[str]) -> str:
+        """유니코드 정규화(NFKC), 소문자, 공백 정리 후 캐시 키 생성"""
+        def normalize(text: Optional[str]) -> str:
+            text = unicodedata.normalize("NFKC", text or "").lower()
+            return re.sub(r"\s+", " ", text).strip()
+
+        return f"{normalize(store_name)}\x1f{normalize(item_name)}"
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """캐시된 (카테고리, 신뢰도) 조회"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[3] >= self.ttl_seconds:
+                del self._memory[key]
+                entry = None
+            if entry is not None:
+                self._memory.move_to_end(key)
+
+        from_disk = False
+        if entry is None and self._conn is not None:
+            try:
+                with self._db_lock:
+                    row = self._conn.execute(
+                        "SELECT category, confidence, elapsed_ms, created_at FROM classification_cache "
+                        "WHERE key = ? AND version = ?",
+                        (key, self.version)
+                    ).fetchone()
+            except Exception as e:
+                print(f"[Classification Cache] 조회 실패: {e}")
+                row = None
+            if row and now - row[3] < self.ttl_seconds:
+                entry = tuple(row)
+                from_disk = True
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            if from_disk:
+                self._remember(key, entry)
+            self.hits += 1
+            self.saved_ms += entry[2]
+            return entry[0], entry[1]
+
+    def set(self, key: str, category: str, confidence: float, elapsed_ms: float):
+        """분류 결과 저장 (elapsed_ms: 적중 시 절약되는 추론 시간 추정치)"""
+        self.set_many([(key, category, confidence, elapsed_ms)])
+
+    def set_many(self, results: Iterable[Tuple[str, str, float, float]]):
+        """
+        (키, 카테고리, 신뢰도, 추론 시간) 여러 건을 저장하고 디스크에는 한 번만 커밋
+
+        배치 워커가 추론 묶음마다 한 번 호출합니다.
+        """
+        now = time.time()
+        rows = [(key, self.version, category, confidence, elapsed_ms, now)
+                for key, category, confidence, elapsed_ms in results]
+        if not rows:
+            return
+
+        with self._lock:
+            for row in rows:
+                self._remember(row[0], row[2:])
+
+        if self._conn is not None:
+            try:
+                with self._db_lock:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO classification_cache VALUES (?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+                    self._conn.commit()
+            except Exception as e:
+                print(f"[Classification Cache] 저장 실패: {e}")
+
+    def _remember(self, key: str, entry: Tuple[str, float, float, float]):
+        """메모리 LRU에 추가 (잠금 안에서 호출)"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        """적중률 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "saved_inference_ms": round(self.saved_ms, 1),
+                "persistent": self._conn is not None
+            }
@@ -1,15 +1,26 @@
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-from src.core.firebase import firebase_client
+from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
+from firebase_admin import firestore
+from src.core.firebase import firebase_client, firestore_repo, FIRESTORE_IN_QUERY_LIMIT
 from src.services.category_service import category_service
 
+# 재분류 묶음 최대 크기: 지출 1건당 최대 3건(지출 수정 + 개인/조직 롤업)에 체크포인트 1건을 더해도 (150 * 3 + 1)
+# 한 번의 배치 커밋(FIRESTORE_BATCH_LIMIT) 안에 들어가야 묶음 단위로 원자적으로 반영됨
+RECLASSIFY_MAX_BATCH_SIZE = 150
+
 
 class ExpenseService:
     """지출 내역 관리 서비스"""
 
     def __init__(self):
         self.db = firebase_client.db
+        self.repo = firestore_repo
         self.collection = "expenses"
+        self.budget_collection = "budgets"
+        self.rollup_collection = "expense_rollups"
+        self.rollup_meta_id = "_meta"
 
     async def create_expense(
         self,
@@ -23,7 +34,8 @@ class ExpenseService:
         item_name: str = None,
         category: str = None,
         description: str = None,
-        budget_id: Optional[str] = None
+        budget_id: Optional[str] = None,
+        organizationName: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         지출 내역 생성 (카테고리 자동 분류)
@@ -35,8 +47,10 @@ class ExpenseService:
             amount: 금액
             date: 날짜
             item_name: 품목명 (선택)
-            category: 카테고리 (수동 지정 시)
+            category: 사용자가 직접 고른 카테고리 (없으면 자동 분류하고 분류 방식을 ai/keyword로 기록)
             description: 설명 (선택)
+            budget_id: 연결된 예산 ID (선택)
+            organizationName: 작성자의 조직 이름 (조직 단위 조회용으로 함께 저장)
 
         Returns:
             생성된 지출 내역
@@ -44,12 +58,13 @@ class ExpenseService:
         try:
             # 카테고리가 지정되지 않은 경우 자동 분류
             if not category:
-                category, confidence = category_service.classify(
+                result = await category_service.classify_detailed_async(
                     store_name=store_name,
                     item_name=item_name,
                     amount=amount
                 )
-                classification_method = "auto"
+                category, confidence = result["category"], result["confidence"]
+                classification_method = category_service.classification_method(result["stage"])
             else:
                 confidence = 1.0
                 classification_method = "manual"
@@ -76,9 +91,19 @@ class ExpenseService:
             if budget_id:
                 expense_data["budget_id"] = budget_id
 
-            # Firestore에 저장
+            # 조직 이름 추가 (조직 전체 지출을 단일 쿼리로 조회하기 위함)
+            if organizationName:
+                expense_data["organizationName"] = organizationName
+
+            # Firestore에 저장 (연결된 예산의 spent 누계와 함께 트랜잭션으로 반영)
             doc_ref = self.db.collection(self.collection).document()
-            doc_ref.set(expense_data)
+
+            @firestore.transactional
+            def _create(transaction):
+                self._apply_counter_deltas(transaction, None, expense_data)
+                transaction.set(doc_ref, expense_data)
+
+            await self.repo.run(_create, self.db.transaction())
 
             expense_data["id"] = doc_ref.id
             return expense_data
@@ -110,70 +135,95 @@ class ExpenseService:
             지출 내역 리스트
         """
         try:
-            # 조직 공유 조회인 경우
-            if organizationName:
-                # 같은 조직의 모든 사용자 ID 가져오기
-                users_ref = self.db.collection("users")\
-                    .where("organizationName", "==", organizationName)\
-                    .stream()
-                
-                user_ids = []
-                for user_doc in users_ref:
-                    user_ids.append(user_doc.id)
-                
-                # 모든 사용자의 지출 조회
-                docs_list = []
-                for org_user_id in user_ids:
-                    query = self.db.collection(self.collection).where("user_id", "==", org_user_id)
-                    docs = query.stream()
-                    docs_list.extend(docs)
-                
-                expenses = []
-                for doc in docs_list:
-                    expense_data = doc.to_dict()
-                    expense_data["id"] = doc.id
+            query = self._build_list_query(
+                user_id=user_id,
+                category=category,
+                start_date=start_date,
+                end_date=end_date,
+                organizationName=organizationName
+            ).limit(limit)
 
-                    # Python에서 필터링
-                    if category and expense_data.get("category") != category:
-                        continue
-                    if start_date and expense_data.get("date") and expense_data["date"] < start_date:
-                        continue
-                    if end_date and expense_data.get("date") and expense_data["date"] > end_date:
-                        continue
+            docs = await self.repo.stream(query)
+            return [self.repo.to_dict(doc) for doc in docs]
 
-                    expenses.append(expense_data)
-            else:
-                # 개인 지출만 조회
-                query = self.db.collection(self.collection).where("user_id", "==", user_id)
-                docs = query.stream()
-                expenses = []
-                for doc in docs:
-                    expense_data = doc.to_dict()
-                    expense_data["id"] = doc.id
+        except Exception as e:
+            raise Exception(f"지출 목록 조회 실패: {str(e)}")
 
-                    # Python에서 필터링
-                    if category and expense_data.get("category") != category:
-                        continue
-                    if start_date and expense_data.get("date") and expense_data["date"] < start_date:
-                        continue
-                    if end_date and expense_data.get("date") and expense_data["date"] > end_date:
-                        continue
+    async def get_expenses_page(
+        self,
+        user_id: str,
+        category: str = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        limit: int = 100,
+        organizationName: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        지출 내역 페이지 조회 (커서 기반)
 
-                    expenses.append(expense_data)
+        Args:
+            cursor: 이전 페이지 응답의 next_cursor (없으면 첫 페이지)
+            나머지 인자는 get_expenses와 동일
 
-            # Python에서 정렬 (날짜 기준 내림차순)
-            expenses.sort(key=lambda x: x.get("date", datetime.min), reverse=True)
+        Returns:
+            {"items": 지출 내역 리스트, "next_cursor": 다음 페이지 커서 또는 None}
 
-            # limit 적용
-            return expenses[:limit]
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        try:
+            query = self._build_list_query(
+                user_id=user_id,
+                category=category,
+                start_date=start_date,
+                end_date=end_date,
+                organizationName=organizationName
+            )
+
+            docs, next_cursor = await self.repo.page(query, "date", limit, cursor)
+            return {
+                "items": [self.repo.to_dict(doc) for doc in docs],
+                "next_cursor": next_cursor
+            }
 
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"지출 목록 조회 실패: {str(e)}")
 
+    def _build_list_query(
+        self,
+        user_id: str,
+        category: str = None,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        organizationName: Optional[str] = None
+    ):
+        """
+        지출 목록 쿼리 구성 (필터/정렬을 Firestore에서 수행)
+
+        필요한 복합 색인은 firestore.indexes.json에 정의되어 있습니다.
+        """
+        # 조직 공유 조회면 조직 전체, 아니면 개인 지출
+        if organizationName:
+            query = self.db.collection(self.collection).where("organizationName", "==", organizationName)
+        else:
+            query = self.db.collection(self.collection).where("user_id", "==", user_id)
+
+        if category:
+            query = query.where("category", "==", category)
+        if start_date:
+            query = query.where("date", ">=", start_date)
+        if end_date:
+            query = query.where("date", "<=", end_date)
+
+        return query.order_by("date", direction="DESCENDING")
+
     async def get_expense(self, expense_id: str) -> Optional[Dict[str, Any]]:
         """특정 지출 내역 조회"""
         try:
-            doc = self.db.collection(self.collection).document(expense_id).get()
+            doc = await self.repo.get(self.db.collection(self.collection).document(expense_id))
 
             if doc.exists:
                 expense_data = doc.to_dict()
@@ -184,6 +234,31 @@ class ExpenseService:
         except Exception as e:
             raise Exception(f"지출 조회 실패: {str(e)}")
 
+    async def get_expenses_by_ids(self, expense_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 지출 내역을 배치 읽기로 조회
+
+        Args:
+            expense_ids: 지출 ID 리스트 (중복/빈 값 무시)
+
+        Returns:
+            {지출 ID: 지출 데이터} (존재하지 않는 ID는 제외)
+        """
+        try:
+            collection = self.db.collection(self.collection)
+            refs = [collection.document(expense_id) for expense_id in dict.fromkeys(filter(None, expense_ids))]
+
+            expenses = {}
+            for doc in await self.repo.get_all(refs):
+                if doc.exists:
+                    expense_data = doc.to_dict()
+                    expense_data["id"] = doc.id
+                    expenses[doc.id] = expense_data
+            return expenses
+
+        except Exception as e:
+            raise Exception(f"지출 조회 실패: {str(e)}")
+
     async def update_expense(
         self,
         expense_id: str,
@@ -208,12 +283,22 @@ class ExpenseService:
                 update_data["classification_confidence"] = 1.0
 
             doc_ref = self.db.collection(self.collection).document(expense_id)
-            doc_ref.update(update_data)
+
+            # 금액/예산 변경분을 예산 spent 누계에 트랜잭션으로 반영
+            @firestore.transactional
+            def _update(transaction):
+                snapshot = doc_ref.get(transaction=transaction)
+                if not snapshot.exists:
+                    raise Exception("지출 내역을 찾을 수 없습니다")
+                old_data = snapshot.to_dict()
+                new_data = {**old_data, **update_data}
+                self._apply_counter_deltas(transaction, old_data, new_data)
+                transaction.update(doc_ref, update_data)
+                return new_data
 
             # 수정된 데이터 반환
-            updated_doc = doc_ref.get()
-            expense_data = updated_doc.to_dict()
-            expense_data["id"] = updated_doc.id
+            expense_data = await self.repo.run(_update, self.db.transaction())
+            expense_data["id"] = expense_id
             return expense_data
 
         except Exception as e:
@@ -222,11 +307,137 @@ class ExpenseService:
     async def delete_expense(self, expense_id: str) -> bool:
         """지출 내역 삭제"""
         try:
-            self.db.collection(self.collection).document(expense_id).delete()
+            doc_ref = self.db.collection(self.collection).document(expense_id)
+
+            @firestore.transactional
+            def _delete(transaction):
+                snapshot = doc_ref.get(transaction=transaction)
+                if not snapshot.exists:
+                    return
+                self._apply_counter_deltas(transaction, snapshot.to_dict(), None)
+                transaction.delete(doc_ref)
+
+            await self.repo.run(_delete, self.db.transaction())
             return True
         except Exception as e:
             raise Exception(f"지출 삭제 실패: {str(e)}")
 
+    def _apply_counter_deltas(
+        self,
+        transaction,
+        old_data: Optional[Dict[str, Any]],
+        new_data: Optional[Dict[str, Any]]
+    ):
+        """
+        지출 변경 전/후 상태로 예산별 spent 누계와 월별 통계 롤업 증감을 트랜잭션에 반영
+
+        트랜잭션 규칙상 읽기가 쓰기보다 먼저 와야 하므로,
+        지출 문서를 쓰기 전에 호출해야 합니다.
+
+        Args:
+            transaction: Firestore 트랜잭션
+            old_data: 변경 전 지출 데이터 (생성 시 None)
+            new_data: 변경 후 지출 데이터 (삭제 시 None)
+        """
+        deltas: Dict[str, float] = {}
+        for data, sign in ((old_data, -1), (new_data, 1)):
+            if data and data.get("budget_id"):
+                budget_id = data["budget_id"]
+                deltas[budget_id] = deltas.get(budget_id, 0.0) + sign * float(data.get("amount") or 0.0)
+
+        # 1) 읽기: 존재하고 spent 누계가 초기화된 예산만 대상
+        #    (spent 필드가 없는 기존 예산은 조회 시 전체 재계산됨)
+        targets = []
+        for budget_id, delta in deltas.items():
+            if not delta:
+                continue
+            budget_ref = self.db.collection(self.budget_collection).document(budget_id)
+            snapshot = budget_ref.get(transaction=transaction)
+            if snapshot.exists and "spent" in (snapshot.to_dict() or {}):
+                targets.append((budget_ref, delta))
+
+        # 2) 쓰기
+        for budget_ref, delta in targets:
+            transaction.update(budget_ref, {"spent": firestore.Increment(delta)})
+
+        # 월별 카테고리 롤업 (읽기 없이 Increment로 병합)
+        for rollup_ref, payload in self._rollup_writes([(old_data, new_data)]):
+            transaction.set(rollup_ref, payload, merge=True)
+
+    def _rollup_writes(
+        self,
+        changes: List[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]
+    ) -> List[Tuple[Any, Dict[str, Any]]]:
+        """
+        (변경 전, 변경 후) 지출 목록을 롤업 문서별 Increment 병합 데이터로 변환
+
+        Returns:
+            (롤업 문서 참조, merge=True로 저장할 데이터) 리스트
+        """
+        rollup_deltas: Dict[str, Dict[str, Any]] = {}
+        for old_data, new_data in changes:
+            for data, sign in ((old_data, -1), (new_data, 1)):
+                if not data or not data.get("date"):
+                    continue
+                month = self._month_key(data["date"])
+                category = data.get("category") or "기타"
+                amount = float(data.get("amount") or 0.0)
+                for scope in self._rollup_scopes(data):
+                    doc_id = self._rollup_doc_id(scope, month)
+                    entry = rollup_deltas.setdefault(doc_id, {"scope": scope, "month": month, "categories": {}})
+                    totals = entry["categories"].setdefault(category, [0.0, 0])
+                    totals[0] += sign * amount
+                    totals[1] += sign
+
+        writes = []
+        for doc_id, entry in rollup_deltas.items():
+            categories = {
+                category: {
+                    "total_amount": firestore.Increment(total),
+                    "count": firestore.Increment(count)
+                }
+                for category, (total, count) in entry["categories"].items()
+                if total or count
+            }
+            if not categories:
+                continue
+            writes.append((
+                self.db.collection(self.rollup_collection).document(doc_id),
+                {
+                    "scope": entry["scope"],
+                    "month": entry["month"],
+                    "categories": categories,
+                    "updated_at": datetime.utcnow()
+                }
+            ))
+        return writes
+
+    @staticmethod
+    def _to_utc(date: datetime) -> datetime:
+        """naive datetime은 UTC로 간주 (Firestore 저장 기준과 동일)"""
+        if date.tzinfo is None:
+            return date.replace(tzinfo=timezone.utc)
+        return date.astimezone(timezone.utc)
+
+    def _month_key(self, date: datetime) -> str:
+        """롤업 월 키 (YYYY-MM, UTC 기준)"""
+        return self._to_utc(date).strftime("%Y-%m")
+
+    @staticmethod
+    def _rollup_scopes(data: Dict[str, Any]) -> List[str]:
+        """지출이 집계되는 롤업 범위 (작성자 개인 + 소속 조직)"""
+        scopes = []
+        if data.get("user_id"):
+            scopes.append(f"user:{data['user_id']}")
+        if data.get("organizationName"):
+            scopes.append(f"org:{data['organizationName']}")
+        return scopes
+
+    @staticmethod
+    def _rollup_doc_id(scope: str, month: str) -> str:
+        """롤업 문서 ID (문서 ID에 '/'를 쓸 수 없으므로 인코딩)"""
+        return f"{quote(scope, safe=':')}_{month}"
+
     async def get_statistics(
         self,
         user_id: str,
@@ -253,34 +464,28 @@ class ExpenseService:
             if not start_date:
                 start_date = datetime(end_date.year, end_date.month, 1)
 
-            # 해당 기간의 모든 지출 조회
-            expenses = await self.get_expenses(
+            # 카테고리별 집계 (완전히 포함되는 월은 롤업, 경계 월만 원본 지출 조회)
+            totals = await self._aggregate_by_category(
                 user_id=user_id,
                 start_date=start_date,
                 end_date=end_date,
-                limit=10000,
                 organizationName=organizationName
             )
 
-            # 카테고리별 집계
             category_stats = {}
             total_amount = 0.0
-            total_count = len(expenses)
-
-            for expense in expenses:
-                category = expense.get("category", "기타")
-                amount = expense.get("amount", 0.0)
-
-                if category not in category_stats:
-                    category_stats[category] = {
-                        "category": category,
-                        "total_amount": 0.0,
-                        "count": 0
-                    }
-
-                category_stats[category]["total_amount"] += amount
-                category_stats[category]["count"] += 1
+            total_count = 0
+
+            for category, (amount, count) in totals.items():
+                if count <= 0:
+                    continue
+                category_stats[category] = {
+                    "category": category,
+                    "total_amount": amount,
+                    "count": int(count)
+                }
                 total_amount += amount
+                total_count += int(count)
 
             # 퍼센트 계산
             by_category = []
@@ -302,6 +507,157 @@ class ExpenseService:
         except Exception as e:
             raise Exception(f"통계 조회 실패: {str(e)}")
 
+    async def _aggregate_by_category(
+        self,
+        user_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        organizationName: Optional[str] = None
+    ) -> Dict[str, List[float]]:
+        """
+        기간 내 카테고리별 [총액, 건수] 집계
+
+        기간에 완전히 포함되는 월은 expense_rollups 문서에서 읽고,
+        앞뒤 경계의 일부 월만 원본 지출을 조회합니다.
+        롤업이 아직 구축되지 않았으면(_meta.ready 없음) 전체 기간을 원본에서 집계합니다.
+        """
+        start_utc = self._to_utc(start_date)
+        end_utc = self._to_utc(end_date)
+
+        def month_start(date: datetime) -> datetime:
+            return date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+        def next_month(date: datetime) -> datetime:
+            return (date.replace(day=1) + timedelta(days=32)).replace(day=1)
+
+        # 기간에 완전히 포함되는 월 목록 (종료일은 포함 범위)
+        first_full = month_start(start_utc)
+        if first_full < start_utc:
+            first_full = next_month(first_full)
+        full_months = []
+        month = first_full
+        while next_month(month) <= end_utc + timedelta(microseconds=1):
+            full_months.append(month)
+            month = next_month(month)
+
+        totals: Dict[str, List[float]] = {}
+
+        if full_months:
+            scope = f"org:{organizationName}" if organizationName else f"user:{user_id}"
+            rollup_ref = self.db.collection(self.rollup_collection)
+            refs = [rollup_ref.document(self.rollup_meta_id)] + [
+                rollup_ref.document(self._rollup_doc_id(scope, m.strftime("%Y-%m")))
+                for m in full_months
+            ]
+            snapshots = {snap.id: snap for snap in await self.repo.get_all(refs)}
+
+            meta = snapshots.get(self.rollup_meta_id)
+            if meta is not None and meta.exists and (meta.to_dict() or {}).get("ready"):
+                for doc_id, snap in snapshots.items():
+                    if doc_id == self.rollup_meta_id or not snap.exists:
+                        continue
+                    for category, stats in ((snap.to_dict() or {}).get("categories") or {}).items():
+                        entry = totals.setdefault(category, [0.0, 0])
+                        entry[0] += stats.get("total_amount", 0.0)
+                        entry[1] += stats.get("count", 0)
+
+                # 경계 월 (롤업 범위 밖)만 원본 지출에서 집계
+                edges = []
+                if start_utc < first_full:
+                    edges.append((start_utc, first_full - timedelta(microseconds=1)))
+                tail_start = next_month(full_months[-1])
+                if tail_start <= end_utc:
+                    edges.append((tail_start, end_utc))
+                for edge_start, edge_end in edges:
+                    await self._accumulate_raw(totals, user_id, edge_start, edge_end, organizationName)
+                return totals
+
+        await self._accumulate_raw(totals, user_id, start_utc, end_utc, organizationName)
+        return totals
+
+    async def _accumulate_raw(
+        self,
+        totals: Dict[str, List[float]],
+        user_id: str,
+        start_date: datetime,
+        end_date: datetime,
+        organizationName: Optional[str] = None
+    ):
+        """원본 지출을 조회하여 카테고리별 [총액, 건수]에 더하기"""
+        query = self._build_list_query(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+            organizationName=organizationName
+        ).select(["category", "amount"])
+
+        for doc in await self.repo.stream(query):
+            data = doc.to_dict() or {}
+            entry = totals.setdefault(data.get("category", "기타"), [0.0, 0])
+            entry[0] += data.get("amount", 0.0)
+            entry[1] += 1
+
+    async def rebuild_statistics_rollups(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        월별 카테고리 통계 롤업을 원본 지출로부터 재구축
+
+        처음 도입할 때와 누계가 어긋났을 때 실행합니다.
+        완료되면 _meta.ready가 설정되어 get_statistics가 롤업을 사용합니다.
+
+        Args:
+            dry_run: 실제 저장하지 않고 결과 통계만 계산
+
+        Returns:
+            재구축 결과 통계
+        """
+        try:
+            expenses = await self.repo.stream(
+                self.db.collection(self.collection)
+                .select(["user_id", "organizationName", "date", "category", "amount"])
+            )
+
+            rollups: Dict[str, Dict[str, Any]] = {}
+            for doc in expenses:
+                data = doc.to_dict() or {}
+                if not data.get("date"):
+                    continue
+                month = self._month_key(data["date"])
+                category = data.get("category") or "기타"
+                for scope in self._rollup_scopes(data):
+                    doc_id = self._rollup_doc_id(scope, month)
+                    entry = rollups.setdefault(doc_id, {"scope": scope, "month": month, "categories": {}})
+                    stats = entry["categories"].setdefault(category, {"total_amount": 0.0, "count": 0})
+                    stats["total_amount"] += data.get("amount", 0.0)
+                    stats["count"] += 1
+
+            rollup_ref = self.db.collection(self.rollup_collection)
+            existing = await self.repo.stream(rollup_ref.select([]))
+            stale = [
+                doc for doc in existing
+                if doc.id not in rollups and doc.id != self.rollup_meta_id
+            ]
+
+            now = datetime.utcnow()
+            ops = [
+                ("set", rollup_ref.document(doc_id), {**entry, "updated_at": now})
+                for doc_id, entry in rollups.items()
+            ]
+            ops += [("delete", doc.reference, None) for doc in stale]
+            ops.append(("set", rollup_ref.document(self.rollup_meta_id), {"ready": True, "rebuilt_at": now}))
+
+            if not dry_run:
+                await self.repo.batch_write(ops)
+
+            return {
+                "expenses": len(expenses),
+                "rollups": len(rollups),
+                "removed": len(stale),
+                "dry_run": dry_run
+            }
+
+        except Exception as e:
+            raise Exception(f"통계 롤업 재구축 실패: {str(e)}")
+
     async def get_expenses_by_receipt(
         self,
         receipt_id: str
@@ -309,7 +665,7 @@ class ExpenseService:
         """영수증 ID로 지출 내역 조회"""
         try:
             query = self.db.collection(self.collection).where("receipt_id", "==", receipt_id)
-            docs = query.stream()
+            docs = await self.repo.stream(query)
 
             expenses = []
             for doc in docs:
@@ -322,5 +678,216 @@ class ExpenseService:
         except Exception as e:
             raise Exception(f"영수증별 지출 조회 실패: {str(e)}")
 
+    async def backfill_organization_names(self, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        organizationName이 없는 기존 지출 내역에 작성자의 조직 이름을 채워 넣기
+
+        조직 멤버 ID를 30개씩 묶어 `in` 쿼리로 지출을 조회하고,
+        변경이 필요한 문서만 배치 쓰기로 갱신합니다.
+
+        Args:
+            dry_run: 실제 수정하지 않고 대상 건수만 계산
+
+        Returns:
+            처리 결과 통계
+        """
+        try:
+            # 조직별 멤버 ID 수집
+            users = await self.repo.stream(
+                self.db.collection("users").select(["organizationName"])
+            )
+            members_by_org: Dict[str, List[str]] = {}
+            for user_doc in users:
+                org_name = (user_doc.to_dict() or {}).get("organizationName")
+                if org_name:
+                    members_by_org.setdefault(org_name, []).append(user_doc.id)
+
+            scanned = 0
+            updates = []
+            for org_name, member_ids in members_by_org.items():
+                for i in range(0, len(member_ids), FIRESTORE_IN_QUERY_LIMIT):
+                    chunk = member_ids[i:i + FIRESTORE_IN_QUERY_LIMIT]
+                    docs = await self.repo.stream(
+                        self.db.collection(self.collection)
+                        .where("user_id", "in", chunk)
+                        .select(["organizationName"])
+                    )
+                    for doc in docs:
+                        scanned += 1
+                        if (doc.to_dict() or {}).get("organizationName") == org_name:
+                            continue
+                        updates.append((doc.reference, {"organizationName": org_name}))
+
+            updated = len(updates)
+            if not dry_run:
+                updated = await self.repo.batch_update(updates)
+
+            return {
+                "organizations": len(members_by_org),
+                "scanned": scanned,
+                "updated": updated,
+                "dry_run": dry_run
+            }
+
+        except Exception as e:
+            raise Exception(f"지출 조직 정보 백필 실패: {str(e)}")
+
+    async def reclassify_expenses(
+        self,
+        organizationName: Optional[str] = None,
+        dry_run: bool = True,
+        batch_size: int = 100,
+        resume: bool = False,
+        max_batches: Optional[int] = None,
+        max_diffs: int = 200
+    ) -> Dict[str, Any]:
+        """
+        자동 분류된 지출을 현재 분류기로 다시 분류
+
+        문서 ID 순서로 batch_size개씩 조회하여 분류하고, 카테고리가 바뀐 지출과
+        해당 월별 롤업 증감, 체크포인트(reclassify_checkpoints의 마지막 문서 ID)를
+        묶음마다 하나의 배치 커밋으로 함께 반영합니다.
+        지출 1건당 쓰기는 지출 수정과 개인/조직 롤업을 합쳐 최대 3건이므로
+        batch_size를 RECLASSIFY_MAX_BATCH_SIZE 이하로 제한해 커밋이 나뉘지 않게 합니다.
+        사용자가 직접 고른 카테고리(classification_method == "manual")는 건너뜁니다.
+        키워드 결과로 이전 AI 분류를 덮어쓰지 않도록, AI 모델이 있는데 아직 준비되지 않았으면
+        실제 반영(dry_run=False)을 거부합니다.
+        중단되어도 resume=True로 마지막 체크포인트부터 이어서 실행할 수 있습니다.
+
+        Args:
+            organizationName: 대상 조직 이름 (None이면 전체 지출)
+            dry_run: 실제 저장하지 않고 변경 내역(diffs)만 반환
+            batch_size: 한 번에 분류/저장할 지출 수 (최대 RECLASSIFY_MAX_BATCH_SIZE)
+            resume: 마지막 체크포인트 이후부터 이어서 실행 (dry_run이 아닐 때만 기록됨)
+            max_batches: 이번 실행에서 처리할 최대 묶음 수 (None이면 끝까지)
+            max_diffs: 응답에 담을 최대 변경 내역 수 (넘으면 diffs_truncated=True)
+
+        Returns:
+            처리 결과 통계 및 변경 내역
+
+        Raises:
+            RuntimeError: dry_run=False인데 AI 모델이 준비되지 않은 경우 (로드는 시작해 둠)
+        """
+        ai_service = category_service.ai_service
+        if not dry_run and ai_service is not None and not ai_service.is_available():
+            ai_service.start_loading()
+            raise RuntimeError(
+                f"AI 분류 모델이 준비되지 않았습니다 (상태: {ai_service.state}). "
+                "모델 로드가 끝난 뒤 다시 실행하세요"
+            )
+
+        try:
+            batch_size = max(1, min(batch_size, RECLASSIFY_MAX_BATCH_SIZE))
+            checkpoint_ref = self.db.collection("reclassify_checkpoints").document(
+                quote(f"org:{organizationName}" if organizationName else "all", safe=":")
+            )
+
+            last_id = None
+            if resume:
+                checkpoint = await self.repo.get(checkpoint_ref)
+                if checkpoint.exists:
+                    last_id = (checkpoint.to_dict() or {}).get("last_id")
+
+            query = self.db.collection(self.collection)
+            if organizationName:
+                query = query.where("organizationName", "==", organizationName)
+            query = query.order_by("__name__").select([
+                "user_id", "organizationName", "date", "amount", "store_name",
+                "item_name", "category", "classification_method"
+            ])
+
+            scanned = skipped = changed = batches = 0
+            diffs = []
+            while max_batches is None or batches < max_batches:
+                page_query = query
+                if last_id:
+                    page_query = page_query.start_after(
+                        {"__name__": self.db.collection(self.collection).document(last_id)}
+                    )
+                docs = await self.repo.stream(page_query.limit(batch_size))
+                if not docs:
+                    last_id = None
+                    break
+
+                targets = []
+                for doc in docs:
+                    data = doc.to_dict() or {}
+                    if data.get("classification_method") == "manual":
+                        skipped += 1
+                    else:
+                        targets.append((doc, data))
+
+                # 한꺼번에 요청하여 AI 분류가 마이크로 배치로 묶이도록 함
+                results = await asyncio.gather(*[
+                    category_service.classify_detailed_async(
+                        store_name=data.get("store_name", ""),
+                        item_name=data.get("item_name"),
+                        amount=data.get("amount")
+                    )
+                    for _, data in targets
+                ])
+
+                ops = []
+                rollup_changes = []
+                now = datetime.utcnow()
+                for (doc, data), result in zip(targets, results):
+                    if result["category"] == data.get("category"):
+                        continue
+                    changed += 1
+                    if len(diffs) < max_diffs:
+                        diffs.append({
+                            "id": doc.id,
+                            "store_name": data.get("store_name"),
+                            "item_name": data.get("item_name"),
+                            "from": data.get("category"),
+                            "to": result["category"],
+                            "confidence": result["confidence"],
+                            "stage": result["stage"]
+                        })
+                    ops.append(("update", doc.reference, {
+                        "category": result["category"],
+                        "classification_method": category_service.classification_method(result["stage"]),
+                        "classification_confidence": result["confidence"],
+                        "updated_at": now
+                    }))
+                    rollup_changes.append((data, {**data, "category": result["category"]}))
+
+                ops += [("merge", ref, payload) for ref, payload in self._rollup_writes(rollup_changes)]
+
+                scanned += len(docs)
+                batches += 1
+                last_id = docs[-1].id
+
+                if not dry_run:
+                    ops.append(("set", checkpoint_ref, {
+                        "organizationName": organizationName,
+                        "last_id": last_id,
+                        "updated_at": now
+                    }))
+                    await self.repo.batch_write(ops)
+
+                if len(docs) < batch_size:
+                    last_id = None
+                    break
+
+            # 끝까지 처리했으면 체크포인트 초기화
+            if not dry_run and last_id is None:
+                await self.repo.delete(checkpoint_ref)
+
+            return {
+                "scanned": scanned,
+                "skipped_manual": skipped,
+                "changed": changed,
+                "batches": batches,
+                "completed": last_id is None,
+                "checkpoint": last_id,
+                "dry_run": dry_run,
+                "diffs": diffs,
+                "diffs_truncated": changed > len(diffs)
+            }
+
+        except Exception as e:
+            raise Exception(f"지출 재분류 실패: {str(e)}")
+
 
 expense_service = ExpenseService()
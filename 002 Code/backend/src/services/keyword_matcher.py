@@ -0,0 +1,53 @@
+"""카테고리 키워드 매처 (단일 정규식으로 한 번에 검색)"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+class KeywordMatcher:
+    """
+    카테고리별 키워드 목록을 하나의 정규식으로 컴파일한 매처
+
+    텍스트를 한 번만 훑어 모든 위치의 키워드를 찾고,
+    (카테고리 우선순위, 키워드 길이, 카테고리 정의 순서) 기준으로 하나를 고릅니다.
+    키워드는 대소문자를 구분하지 않습니다.
+    """
+
+    def __init__(self, keywords: Dict[str, List[str]], priority: Optional[Dict[str, int]] = None):
+        priority = priority or {}
+        order = {category: index for index, category in enumerate(keywords)}
+
+        # 키워드 → (우선순위, 길이, -정의 순서, 카테고리); 중복 키워드는 순위가 높은 쪽 유지
+        self._ranks: Dict[str, Tuple[int, int, int, str]] = {}
+        for category, words in keywords.items():
+            for word in words:
+                word = word.lower()
+                if not word:
+                    continue
+                rank = (priority.get(category, 0), len(word), -order[category], category)
+                if word not in self._ranks or rank > self._ranks[word]:
+                    self._ranks[word] = rank
+
+        # 같은 위치에서 시작하는 키워드 중 순위가 가장 높은 것이 먼저 시도되도록 정렬하고,
+        # 전방 탐색으로 겹치는 위치의 키워드도 모두 찾음
+        ordered = sorted(self._ranks, key=lambda word: self._ranks[word], reverse=True)
+        self._pattern = (
+            re.compile("(?=(" + "|".join(re.escape(word) for word in ordered) + "))")
+            if ordered else None
+        )
+
+    def matches(self, text: str) -> List[Tuple[str, str]]:
+        """텍스트에 나타난 (키워드, 카테고리) 목록"""
+        if not text or self._pattern is None:
+            return []
+        return [
+            (match.group(1), self._ranks[match.group(1)][3])
+            for match in self._pattern.finditer(text.lower())
+        ]
+
+    def match(self, text: str) -> Optional[str]:
+        """가장 순위가 높은 키워드의 카테고리 (없으면 None)"""
+        found = self.matches(text)
+        if not found:
+            return None
+        best = max(found, key=lambda item: self._ranks[item[0]])
+        return best[1]
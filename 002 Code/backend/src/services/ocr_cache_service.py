@@ -0,0 +1,101 @@
+"""영수증 OCR 결과 캐시 (이미지 내용 해시 기준)"""
+import hashlib
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+from src.core.config import settings
+from src.core.firebase import firebase_client, firestore_repo
+
+
+class OCRCacheService:
+    """
+    이미지 SHA-256 해시를 키로 하는 OCR 파싱 결과 캐시
+
+    같은 사진을 다시 올리는 경우(타임아웃 후 재시도 등) Azure 호출을 생략합니다.
+    메모리 LRU를 먼저 확인하고, 없으면 Firestore ocr_cache 컬렉션을 조회합니다.
+    Firestore 문서는 expires_at 필드의 TTL 정책으로 자동 삭제되며,
+    삭제 전까지의 지연을 고려해 조회 시에도 만료 여부를 확인합니다.
+    """
+
+    def __init__(self, max_entries: int, ttl_days: int):
+        self.db = firebase_client.db
+        self.repo = firestore_repo
+        self.collection = "ocr_cache"
+        self.max_entries = max_entries
+        self.ttl = timedelta(days=ttl_days)
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def image_key(image_bytes: bytes) -> str:
+        """이미지 바이트의 SHA-256 해시"""
+        return hashlib.sha256(image_bytes).hexdigest()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 OCR 결과 조회
+
+        Returns:
+            {"data": 파싱 결과, "confidence": 신뢰도} 또는 None
+        """
+        now = datetime.now(timezone.utc)
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            if entry["expires_at"] > now:
+                self._memory.move_to_end(key)
+                return entry
+            del self._memory[key]
+
+        try:
+            doc = await self.repo.get(self.db.collection(self.collection).document(key))
+        except Exception as e:
+            print(f"[OCR Cache] 조회 실패: {e}")
+            return None
+
+        if not doc.exists:
+            return None
+
+        stored = doc.to_dict() or {}
+        expires_at = stored.get("expires_at")
+        if not expires_at or expires_at <= now:
+            return None
+
+        data = dict(stored.get("data") or {})
+        if isinstance(data.get("date"), str):
+            data["date"] = datetime.fromisoformat(data["date"])
+
+        entry = {"data": data, "confidence": stored.get("confidence", 0), "expires_at": expires_at}
+        self._remember(key, entry)
+        return entry
+
+    async def set(self, key: str, data: Dict[str, Any], confidence: float):
+        """OCR 파싱 결과 저장 (메모리 + Firestore)"""
+        now = datetime.now(timezone.utc)
+        entry = {"data": dict(data), "confidence": confidence, "expires_at": now + self.ttl}
+        self._remember(key, entry)
+
+        # Firestore 타임스탬프는 UTC로 반환되므로 naive 날짜는 문자열로 저장
+        stored_data = dict(data)
+        if isinstance(stored_data.get("date"), datetime):
+            stored_data["date"] = stored_data["date"].isoformat()
+
+        try:
+            await self.repo.set(self.db.collection(self.collection).document(key), {
+                "data": stored_data,
+                "confidence": confidence,
+                "created_at": now,
+                "expires_at": entry["expires_at"]
+            })
+        except Exception as e:
+            print(f"[OCR Cache] 저장 실패: {e}")
+
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        """메모리 LRU에 추가 (최대 개수 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# 싱글톤 인스턴스
+ocr_cache_service = OCRCacheService(settings.OCR_CACHE_MAX_ENTRIES, settings.OCR_CACHE_TTL_DAYS)
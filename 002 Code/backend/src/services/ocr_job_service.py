@@ -0,0 +1,182 @@
+"""영수증 OCR 비동기 작업 큐"""
+import asyncio
+from typing import Dict, Any, Optional, Set
+from src.core.config import settings
+from src.services.receipt_service import receipt_service
+
+
+class OCRJobService:
+    """
+    영수증 OCR 작업 큐 및 백그라운드 워커 풀
+
+    /receipt/ocr, /receipt/upload의 작업 모드에서 사용합니다.
+    엔드포인트는 대기 영수증을 만들고 작업을 넣은 뒤 바로 응답하며,
+    워커가 OCR/Expense 생성을 처리하고 영수증의 ocr_status를 갱신합니다.
+    작업마다 이미지 바이트를 보관하므로 큐 길이를 max_queued로 제한하고,
+    가득 차면 submit이 RuntimeError를 발생시킵니다 (라우트에서 503).
+    큐는 프로세스 메모리에 있으므로 작업을 가진 프로세스는 lease_seconds/3마다
+    작업의 updated_at(임대)을 갱신하고, 임대가 만료된 작업(종료된 프로세스의 작업)은
+    recover_orphaned_jobs가 실패 처리합니다. 여러 워커 프로세스가 떠 있어도
+    다른 프로세스의 진행 중인 작업은 건드리지 않습니다.
+    """
+
+    def __init__(self, workers: int, max_queued: int, lease_seconds: int):
+        self.workers = workers
+        self.max_queued = max_queued
+        self.lease_seconds = lease_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks = []
+        self._lease_task: Optional[asyncio.Task] = None
+        self._active: Set[str] = set()  # 이 프로세스가 맡고 있는 작업 (대기 + 처리 중)
+        self._processed = 0
+        self._failed = 0
+
+    def _ensure_workers(self):
+        """첫 작업 제출 시 실행 중인 이벤트 루프에 워커 시작"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._tasks = [task for task in self._tasks if not task.done()]
+        for _ in range(self.workers - len(self._tasks)):
+            self._tasks.append(asyncio.create_task(self._worker()))
+        self.start_lease_keeper()
+
+    def start_lease_keeper(self):
+        """임대 갱신/만료 작업 정리 루프 시작 (실행 중인 이벤트 루프에서 호출)"""
+        if self._lease_task is None or self._lease_task.done():
+            self._lease_task = asyncio.create_task(self._lease_loop())
+
+    async def _lease_loop(self):
+        """맡은 작업의 임대를 주기적으로 갱신하고 다른 프로세스가 버린 작업을 정리"""
+        interval = max(1, self.lease_seconds // 3)
+        while True:
+            if self._active:
+                try:
+                    await receipt_service.renew_job_leases(list(self._active))
+                except Exception as e:
+                    print(f"[OCR JOB ERROR] 작업 임대 갱신 실패: {str(e)}")
+            await self.recover_orphaned_jobs()
+            await asyncio.sleep(interval)
+
+    async def _worker(self):
+        """큐에서 작업을 꺼내 처리"""
+        while True:
+            job = await self._queue.get()
+            try:
+                await receipt_service.process_pending_receipt(**job)
+                self._processed += 1
+            except Exception as e:
+                self._failed += 1
+                print(f"[OCR JOB ERROR] {job['receipt_id']}: {str(e)}")
+            finally:
+                self._active.discard(job["receipt_id"])
+                self._queue.task_done()
+
+    async def submit(
+        self,
+        user_id: str,
+        image_data: bytes,
+        create_expense: bool = False,
+        organizationName: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        OCR 작업 등록
+
+        Args:
+            user_id: 사용자 ID
+            image_data: 이미지 바이트 데이터
+            create_expense: Expense 자동 생성 여부
+            organizationName: 생성되는 Expense에 저장할 조직 이름
+
+        Returns:
+            대기 상태로 생성된 영수증 데이터 (id가 작업 ID)
+
+        Raises:
+            RuntimeError: 작업 대기열이 가득 찬 경우
+        """
+        self._ensure_workers()
+        if self._queue.full():
+            raise RuntimeError("OCR 작업 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요")
+
+        receipt = await receipt_service.create_pending_receipt(user_id, image_data)
+        self._active.add(receipt["id"])
+
+        try:
+            self._queue.put_nowait({
+                "receipt_id": receipt["id"],
+                "user_id": user_id,
+                "image_data": image_data,
+                "create_expense": create_expense,
+                "organizationName": organizationName
+            })
+        except asyncio.QueueFull:
+            # 영수증을 만드는 사이 다른 요청이 대기열을 채운 경우
+            self._active.discard(receipt["id"])
+            await receipt_service.fail_pending_receipt(receipt["id"], "OCR 작업 대기열이 가득 찼습니다")
+            raise RuntimeError("OCR 작업 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요")
+        return receipt
+
+    async def recover_orphaned_jobs(self):
+        """임대가 만료된 작업(종료된 프로세스에서 끝나지 않은 작업)을 실패 처리"""
+        try:
+            count = await receipt_service.fail_orphaned_jobs(
+                "서버 재시작으로 작업이 중단되었습니다. 다시 업로드해주세요",
+                self.lease_seconds
+            )
+            if count:
+                print(f"[OCR JOB] 중단된 작업 {count}개를 실패 처리했습니다")
+        except Exception as e:
+            print(f"[OCR JOB ERROR] 중단된 작업 정리 실패: {str(e)}")
+
+    async def get_status(self, job_id: str, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 상태 조회
+
+        Returns:
+            작업 상태 딕셔너리 또는 None (없거나 다른 사용자의 작업)
+        """
+        receipt = await receipt_service.get_receipt(job_id)
+        if not receipt or receipt.get("user_id") != user_id:
+            return None
+
+        ocr_status = receipt.get("ocr_status")
+        result = {"job_id": job_id, "receipt_id": job_id, "status": ocr_status}
+
+        if ocr_status == "completed":
+            purchase_date = receipt.get("purchase_date")
+            result.update({
+                "status": "success",
+                "data": {
+                    "store_name": receipt.get("store_name", ""),
+                    "store_address": receipt.get("store_address", ""),
+                    "store_phone_number": receipt.get("store_phone_number", ""),
+                    "date": purchase_date.strftime("%Y-%m-%d") if purchase_date else None,
+                    "total_amount": receipt.get("total_amount", 0)
+                },
+                "store_name": receipt.get("store_name", ""),
+                "total_amount": receipt.get("total_amount", 0),
+                "expenses_count": len(receipt.get("expense_ids", [])),
+                "message": f"영수증 처리 완료: 총 {receipt.get('total_amount', 0)}원"
+            })
+        elif ocr_status == "failed":
+            result["message"] = (receipt.get("ocr_raw_data") or {}).get("error", "OCR 처리에 실패했습니다")
+
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """큐 및 워커 상태"""
+        return {
+            "workers": len([task for task in self._tasks if not task.done()]),
+            "queued": self._queue.qsize() if self._queue else 0,
+            "max_queued": self.max_queued,
+            "active": len(self._active),
+            "processed": self._processed,
+            "failed": self._failed
+        }
+
+
+# 싱글톤 인스턴스
+ocr_job_service = OCRJobService(
+    settings.OCR_JOB_WORKERS,
+    settings.OCR_JOB_QUEUE_MAX,
+    settings.OCR_JOB_LEASE_SECONDS
+)
@@ -1,14 +1,18 @@
 import io
 import os
 import re
+import asyncio
 import cv2
 from datetime import datetime
-from typing import Dict, Any, Optional
-from PIL import Image
+import numpy as np
+from typing import Dict, Any, BinaryIO, Optional, Union
+from PIL import Image, ImageOps
 from azure.core.credentials import AzureKeyCredential
 from azure.ai.documentintelligence import DocumentIntelligenceClient
 from azure.ai.documentintelligence.models import AnalyzeResult
 from dotenv import load_dotenv
+from src.core.config import settings
+from src.services.ocr_cache_service import ocr_cache_service
 
 # .env 파일 로드
 load_dotenv()
@@ -40,6 +44,135 @@ class OCRService:
         self.file_limit_mb = 4
         print("[OCR] Azure Document Intelligence initialized successfully")
 
+    async def preprocess_image(self, image: Union[bytes, BinaryIO]) -> bytes:
+        """
+        OCR 및 Storage 업로드 전 이미지 전처리
+
+        EXIF 회전 보정 → 영수증 윤곽 잘라내기/기울기 보정 → 긴 변 축소
+        → (선택) 흑백 변환 → JPEG 인코딩 순서로 처리합니다.
+        CPU 작업이므로 이벤트 루프 밖에서 실행하며, 실패 시 원본을 반환합니다.
+
+        Args:
+            image: 원본 이미지 바이트 또는 파일 객체 (UploadFile.file)
+                파일 객체면 원본 전체를 바이트로 복사하지 않고 파일에서 바로 디코딩합니다.
+
+        Returns:
+            전처리된 JPEG 바이트 (비활성화/실패 시 원본)
+        """
+        if not settings.OCR_PREPROCESS_ENABLED:
+            return image if isinstance(image, bytes) else await asyncio.to_thread(self._read_all, image)
+        return await asyncio.to_thread(self._preprocess, image)
+
+    @staticmethod
+    def _read_all(stream: BinaryIO) -> bytes:
+        """파일 객체를 처음부터 끝까지 읽기"""
+        stream.seek(0)
+        return stream.read()
+
+    def _preprocess(self, original: Union[bytes, BinaryIO]) -> bytes:
+        """preprocess_image의 동기 구현"""
+        source = io.BytesIO(original) if isinstance(original, bytes) else original
+        try:
+            # 1. EXIF 회전 정보 반영 (휴대폰 사진은 픽셀이 누운 채 저장되는 경우가 많음)
+            source.seek(0, os.SEEK_END)
+            original_size = source.tell()
+            source.seek(0)
+            pil_image = ImageOps.exif_transpose(Image.open(source))
+            image = cv2.cvtColor(np.asarray(pil_image.convert("RGB")), cv2.COLOR_RGB2BGR)
+
+            # 2. 영수증 윤곽 잘라내기/기울기 보정
+            if settings.OCR_DESKEW:
+                image = self._crop_receipt(image)
+
+            # 3. 긴 변 기준 축소 (확대는 하지 않음)
+            height, width = image.shape[:2]
+            scale = settings.OCR_MAX_DIMENSION / max(height, width)
+            if scale < 1:
+                image = cv2.resize(
+                    image,
+                    (int(width * scale), int(height * scale)),
+                    interpolation=cv2.INTER_AREA
+                )
+
+            # 4. 흑백 변환 (선택)
+            if settings.OCR_GRAYSCALE:
+                image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+            # 5. JPEG 인코딩
+            encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), settings.OCR_JPEG_QUALITY]
+            result, encoded_image = cv2.imencode('.jpg', image, encode_param)
+            if not result:
+                return self._read_all(source)
+
+            processed = encoded_image.tobytes()
+            print(f"[OCR] 전처리 완료: {original_size / 1024:.0f}KB → {len(processed) / 1024:.0f}KB")
+            return processed
+
+        except Exception as e:
+            print(f"[OCR] 이미지 전처리 실패, 원본 사용: {str(e)}")
+            return self._read_all(source)
+
+    def _crop_receipt(self, image):
+        """
+        영수증 사각형 윤곽을 찾아 원근 보정으로 잘라내기
+
+        윤곽 검출은 축소본에서 수행하고 변환은 원본 해상도에 적용합니다.
+        이미지 면적의 20% 이상인 사각형을 찾지 못하면 원본을 그대로 반환합니다.
+        """
+        height, width = image.shape[:2]
+        ratio = 800 / max(height, width)
+        small = cv2.resize(image, (int(width * ratio), int(height * ratio))) if ratio < 1 else image
+        ratio = min(ratio, 1)
+
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        gray = cv2.GaussianBlur(gray, (5, 5), 0)
+        edges = cv2.Canny(gray, 50, 150)
+        edges = cv2.dilate(edges, np.ones((3, 3), np.uint8), iterations=2)
+
+        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        min_area = small.shape[0] * small.shape[1] * 0.2
+
+        for contour in sorted(contours, key=cv2.contourArea, reverse=True)[:5]:
+            if cv2.contourArea(contour) < min_area:
+                break
+            approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+            if len(approx) != 4:
+                continue
+
+            # 꼭짓점 순서: 좌상, 우상, 우하, 좌하
+            points = approx.reshape(4, 2).astype("float32") / ratio
+            sums = points.sum(axis=1)
+            diffs = np.diff(points, axis=1).ravel()
+            ordered = np.array([
+                points[np.argmin(sums)],
+                points[np.argmin(diffs)],
+                points[np.argmax(sums)],
+                points[np.argmax(diffs)]
+            ], dtype="float32")
+
+            top_left, top_right, bottom_right, bottom_left = ordered
+            target_width = int(max(
+                np.linalg.norm(bottom_right - bottom_left),
+                np.linalg.norm(top_right - top_left)
+            ))
+            target_height = int(max(
+                np.linalg.norm(top_right - bottom_right),
+                np.linalg.norm(top_left - bottom_left)
+            ))
+            if target_width < 100 or target_height < 100:
+                continue
+
+            destination = np.array([
+                [0, 0],
+                [target_width - 1, 0],
+                [target_width - 1, target_height - 1],
+                [0, target_height - 1]
+            ], dtype="float32")
+            matrix = cv2.getPerspectiveTransform(ordered, destination)
+            return cv2.warpPerspective(image, matrix, (target_width, target_height))
+
+        return image
+
     async def process_receipt(self, image_data: bytes = None, image_path: str = None) -> Dict[str, Any]:
         """
         영수증 이미지를 Azure OCR 처리하여 구조화된 데이터 추출
@@ -61,6 +194,21 @@ class OCRService:
             else:
                 raise ValueError("image_data 또는 image_path가 필요합니다")
 
+            # 동일 이미지의 이전 분석 결과가 있으면 Azure 호출 생략
+            cache_key = ocr_cache_service.image_key(image_bytes)
+            cached = await ocr_cache_service.get(cache_key)
+            if cached:
+                print(f"[OCR] 캐시 적중: {cache_key[:12]}")
+                return {
+                    "status": "success",
+                    "data": dict(cached["data"]),
+                    "raw_ocr_response": {
+                        "engine": "Azure Document Intelligence",
+                        "confidence": cached["confidence"],
+                        "cache_hit": True
+                    }
+                }
+
             # 파일 크기 확인 및 압축
             file_size_mb = len(image_bytes) / (1024 * 1024)
             content_type = "application/octet-stream"
@@ -74,23 +222,24 @@ class OCRService:
 
             # Azure Document Intelligence API 호출
             print("[OCR] Azure Document Intelligence로 영수증 분석 중...")
-            poller = self.client.begin_analyze_document(
-                "prebuilt-receipt",
-                body=image_bytes,
-                content_type=content_type
+            # 분석 완료까지 블로킹되므로 이벤트 루프 밖에서 실행
+            result: AnalyzeResult = await asyncio.to_thread(
+                self._analyze, image_bytes, content_type
             )
 
-            result: AnalyzeResult = poller.result()
-
             # Azure OCR 결과 파싱
             parsed_data = self._parse_azure_receipt(result)
+            confidence = result.documents[0].confidence if result.documents else 0
+
+            await ocr_cache_service.set(cache_key, parsed_data, confidence)
 
             return {
                 "status": "success",
                 "data": parsed_data,
                 "raw_ocr_response": {
                     "engine": "Azure Document Intelligence",
-                    "confidence": result.documents[0].confidence if result.documents else 0
+                    "confidence": confidence,
+                    "cache_hit": False
                 }
             }
 
@@ -102,6 +251,15 @@ class OCRService:
                 "data": None
             }
 
+    def _analyze(self, image_bytes: bytes, content_type: str) -> AnalyzeResult:
+        """Azure prebuilt-receipt 분석 호출 (동기)"""
+        poller = self.client.begin_analyze_document(
+            "prebuilt-receipt",
+            body=image_bytes,
+            content_type=content_type
+        )
+        return poller.result()
+
     def _compress_image(self, image_bytes: bytes) -> bytes:
         """
         이미지 압축 (4MB 초과 시)
@@ -114,7 +272,7 @@ class OCRService:
         """
         try:
             image = cv2.imdecode(
-                __import__('numpy').frombuffer(image_bytes, __import__('numpy').uint8),
+                np.frombuffer(image_bytes, np.uint8),
                 cv2.IMREAD_COLOR
             )
             if image is None:
@@ -1,461 +1,310 @@
-import io
 import os
+import multiprocessing
+import shutil
+import tempfile
+import time
+import asyncio
 import requests
+from urllib.parse import unquote
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
-from typing import Dict, Any, Optional
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import mm
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image as RLImage, KeepTogether, PageBreak
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from PIL import Image
+from typing import Dict, Any, Iterator, List, Optional
+from src.core.config import settings
+from src.services.pdf_renderer import init_worker, render
+from src.services.receipt_thumbnail_service import receipt_thumbnail_service
+
+
+def _picklable(value: Any) -> Any:
+    """
+    워커 프로세스로 넘길 수 있도록 값 변환
+
+    Firestore 타임스탬프(datetime 하위 클래스)는 일반 datetime으로,
+    그 밖의 알 수 없는 객체는 문자열로 바꿉니다.
+    """
+    if isinstance(value, dict):
+        return {key: _picklable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_picklable(item) for item in value]
+    if isinstance(value, datetime):
+        return datetime(
+            value.year, value.month, value.day,
+            value.hour, value.minute, value.second, value.microsecond,
+            tzinfo=value.tzinfo
+        )
+    if value is None or isinstance(value, (str, int, float, bool, bytes)):
+        return value
+    return str(value)
 
 
 class PDFService:
-    """PDF 생성 서비스 (한글 지원)"""
+    """
+    PDF 생성 서비스
+
+    렌더링은 CPU 작업이므로 프로세스 풀(PDF_MAX_WORKERS)에서 실행하여
+    이벤트 루프를 막지 않고 동시 내보내기를 여러 코어로 분산합니다.
+    대기 중인 작업이 PDF_MAX_PENDING을 넘으면 새 요청을 거절합니다.
+    """
 
     def __init__(self):
-        """한글 폰트 등록"""
-        try:
-            # Windows 기본 한글 폰트 등록 시도
-            font_paths = [
-                "C:/Windows/Fonts/malgun.ttf",  # 맑은 고딕
-                "C:/Windows/Fonts/gulim.ttc",    # 굴림
-                "C:/Windows/Fonts/NanumGothic.ttf",  # 나눔고딕
-                "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",  # Ubuntu
-                "/System/Library/Fonts/AppleSDGothicNeo.ttc",  # macOS
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"  # Linux fallback
-            ]
-
-            self.font_name = None
-            for font_path in font_paths:
-                if os.path.exists(font_path):
-                    try:
-                        pdfmetrics.registerFont(TTFont('KoreanFont', font_path))
-                        self.font_name = 'KoreanFont'
-                        print(f"[PDF] 한글 폰트 등록 성공: {font_path}")
-                        break
-                    except Exception as e:
-                        print(f"[PDF] 폰트 등록 실패 ({font_path}): {str(e)}")
-                        continue
-
-            if not self.font_name:
-                print("[PDF] 한글 폰트를 찾을 수 없습니다. 기본 폰트 사용")
-                self.font_name = 'DejaVuSans'
-                
-        except Exception as e:
-            print(f"[PDF] 폰트 초기화 오류: {str(e)}")
-            self.font_name = 'DejaVuSans'
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._http: Optional[requests.Session] = None
+        self._pending = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._render_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """
+        프로세스 풀 (첫 사용 시 생성)
 
-    async def generate_expense_pdf(
-        self,
-        expense: Dict[str, Any],
-        receipt: Optional[Dict[str, Any]] = None
-    ) -> bytes:
+        Linux 기본값인 fork는 Firestore/gRPC 스레드와 잠금이 있는 서버 프로세스를 그대로 복제해
+        워커가 멈출 수 있으므로 spawn으로 시작합니다. 워커는 pdf_renderer 모듈만 임포트하며,
+        python main.py로 실행할 때 spawn이 __main__을 다시 임포트해도 main.py는 앱을 만들지 않습니다.
         """
-        개별 지출 내역 PDF 생성
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.PDF_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker
+            )
+        return self._executor
 
-        Args:
-            expense: 지출 내역 데이터
-            receipt: 영수증 데이터 (이미지 포함)
+    async def _submit(self, kind: str, *args) -> bytes:
+        """
+        렌더링 작업을 프로세스 풀에 제출하고 결과 대기
 
-        Returns:
-            PDF 바이트 데이터
+        Raises:
+            RuntimeError: 대기열이 가득 찬 경우
         """
+        if self._pending >= settings.PDF_MAX_PENDING:
+            self._rejected += 1
+            raise RuntimeError("PDF 생성 요청이 많습니다. 잠시 후 다시 시도해주세요")
+
+        self._pending += 1
+        started = time.perf_counter()
         try:
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(
-                buffer,
-                pagesize=A4,
-                rightMargin=20*mm,
-                leftMargin=20*mm,
-                topMargin=20*mm,
-                bottomMargin=20*mm
+            loop = asyncio.get_running_loop()
+            pdf_bytes = await loop.run_in_executor(self._get_executor(), render, kind, *args)
+            self._completed += 1
+            return pdf_bytes
+        except BrokenProcessPool:
+            # 워커 프로세스가 비정상 종료되면 다음 요청에서 풀을 다시 생성
+            self._failed += 1
+            self._executor = None
+            raise
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._pending -= 1
+            self._render_seconds += time.perf_counter() - started
+
+    def _http_session(self) -> requests.Session:
+        """이미지 다운로드용 공유 HTTP 세션 (연결 재사용)"""
+        if self._http is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=settings.PDF_IMAGE_FETCH_CONCURRENCY,
+                pool_maxsize=settings.PDF_IMAGE_FETCH_CONCURRENCY
             )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._http = session
+        return self._http
 
-            # 문서 요소 리스트
-            elements = []
-
-            # 스타일 설정
-            styles = self._get_styles()
-
-            # 제목
-            title = Paragraph("지출 내역서", styles['CustomTitle'])
-            elements.append(title)
-            elements.append(Spacer(1, 10*mm))
-
-            # 영수증 이미지 추가 (있는 경우)
-            if receipt and receipt.get("image_url"):
-                try:
-                    receipt_image = self._add_receipt_image(receipt["image_url"])
-                    if receipt_image:
-                        elements.append(receipt_image)
-                        elements.append(Spacer(1, 5*mm))
-                except Exception as e:
-                    print(f"[PDF] 영수증 이미지 추가 실패: {str(e)}")
-
-            # 지출 정보 테이블
-            expense_info = self._create_expense_table(expense, styles)
-            elements.append(expense_info)
-            elements.append(Spacer(1, 10*mm))
-
-            # 재무 정보 (총액 등)
-            financial_info = self._create_financial_table(expense, styles)
-            elements.append(financial_info)
-            elements.append(Spacer(1, 10*mm))
-
-            # 발행 정보
-            footer_text = f"발행일: {datetime.now().strftime('%Y년 %m월 %d일')}"
-            footer = Paragraph(footer_text, styles['Footer'])
-            elements.append(footer)
-
-            # PDF 생성
-            doc.build(elements)
-            pdf_bytes = buffer.getvalue()
-            buffer.close()
+    def _download_image(self, image_url: str) -> bytes:
+        """
+        영수증 이미지 다운로드 (동기)
 
-            return pdf_bytes
+        이 서비스의 Storage 버킷 공개 URL이면 HTTP 대신 blob을 직접 읽습니다.
+        """
+        # 워커 프로세스에서 Firebase가 초기화되지 않도록 부모 프로세스에서만 임포트
+        from src.core.firebase import firebase_client
 
-        except Exception as e:
-            raise Exception(f"PDF 생성 실패: {str(e)}")
-
-    def _get_styles(self):
-        """PDF 스타일 정의"""
-        styles = getSampleStyleSheet()
-
-        # 제목 스타일 - 이미 존재하면 덮어쓰기
-        if 'CustomTitle' not in styles:
-            styles.add(ParagraphStyle(
-                name='CustomTitle',
-                parent=styles['Heading1'],
-                fontName=self.font_name,
-                fontSize=24,
-                alignment=TA_CENTER,
-                spaceAfter=12,
-                textColor=colors.HexColor('#1e3a8a')
-            ))
-
-        # 본문 스타일
-        if 'Korean' not in styles:
-            styles.add(ParagraphStyle(
-                name='Korean',
-                parent=styles['Normal'],
-                fontName=self.font_name,
-                fontSize=11,
-                leading=14
-            ))
-
-        # 테이블 헤더 스타일
-        if 'TableHeader' not in styles:
-            styles.add(ParagraphStyle(
-                name='TableHeader',
-                parent=styles['Normal'],
-                fontName=self.font_name,
-                fontSize=11,
-                textColor=colors.white,
-                alignment=TA_CENTER
-            ))
-
-        # 테이블 셀 스타일
-        if 'TableCell' not in styles:
-            styles.add(ParagraphStyle(
-                name='TableCell',
-                parent=styles['Normal'],
-                fontName=self.font_name,
-                fontSize=10
-            ))
-
-        # 푸터 스타일
-        if 'Footer' not in styles:
-            styles.add(ParagraphStyle(
-                name='Footer',
-                parent=styles['Normal'],
-                fontName=self.font_name,
-                fontSize=9,
-                alignment=TA_RIGHT,
-                textColor=colors.grey
-            ))
-
-        return styles
-
-    def _add_receipt_image(self, image_url: str) -> Optional[RLImage]:
-        """영수증 이미지 다운로드 및 추가"""
-        try:
-            print(f"[PDF] 이미지 다운로드 시도: {image_url}")
+        print(f"[PDF] 이미지 다운로드 시도: {image_url}")
+        bucket = firebase_client.bucket
+        if bucket is not None:
+            prefix = f"https://storage.googleapis.com/{bucket.name}/"
+            if image_url.startswith(prefix):
+                return bucket.blob(unquote(image_url[len(prefix):])).download_as_bytes(timeout=15)
 
-            # 이미지 다운로드
-            response = requests.get(image_url, timeout=15, verify=False)
-            response.raise_for_status()
+        response = self._http_session().get(image_url, timeout=15, verify=False)
+        response.raise_for_status()
+        return response.content
 
-            # PIL로 이미지 처리
-            img = Image.open(io.BytesIO(response.content))
+    def _fetch_receipt_image(self, image_url: str) -> Optional[bytes]:
+        """
+        PDF용 축소 영수증 이미지 조회 (스레드에서 실행, 실패 시 None)
 
-            # EXIF 방향 정보 확인 및 자동 회전
-            try:
-                from PIL import ImageOps
-                img = ImageOps.exif_transpose(img)
-                print(f"[PDF] EXIF 방향 정보 기반 자동 회전 완료")
-            except Exception as e:
-                print(f"[PDF] EXIF 처리 건너뜀: {str(e)}")
+        썸네일 캐시(디스크 → Storage)에 없을 때만 원본을 내려받아 축소합니다.
+        """
+        try:
+            return receipt_thumbnail_service.get_or_create(image_url, self._download_image)
+        except Exception as e:
+            print(f"[PDF] 이미지 로드 실패: {str(e)}")
+            return None
 
-            # RGB 모드로 변환 (RGBA나 다른 모드일 경우)
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
+    async def prefetch_receipt_images(self, image_urls: List[Optional[str]]) -> List[Optional[bytes]]:
+        """
+        PDF용 축소 영수증 이미지들을 동시에 조회 (캐시 미스는 내려받아 축소)
 
-            # 이미지 리사이즈 (같은 페이지에 들어갈 수 있도록 더 작게)
-            # A4 페이지 너비에서 좌우 여백(40mm)을 빼면 약 170mm
-            # 지출 내역과 같은 페이지에 들어가도록 작게 조정
-            max_width_mm = 70  # mm (더 작게 조정)
-            max_height_mm = 90  # mm (더 작게 조정)
+        동시 다운로드 수는 PDF_IMAGE_FETCH_CONCURRENCY로 제한하며,
+        같은 URL은 한 번만 내려받습니다.
 
-            # mm를 픽셀로 변환 (150 DPI 기준으로 높여서 화질 개선)
-            max_width_px = int(max_width_mm * 150 / 25.4)
-            max_height_px = int(max_height_mm * 150 / 25.4)
+        Args:
+            image_urls: 이미지 URL 리스트 (없는 항목은 None)
 
-            # 비율 유지하면서 리사이즈
-            img.thumbnail((max_width_px, max_height_px), Image.Resampling.LANCZOS)
+        Returns:
+            입력 순서와 같은 축소 이미지(JPEG) 리스트 (실패/없음은 None)
+        """
+        return await self._map_images(image_urls, self._fetch_receipt_image)
 
-            # BytesIO로 변환 (quality를 95로 높여서 화질 개선)
-            img_buffer = io.BytesIO()
-            img.save(img_buffer, format='JPEG', quality=95)
-            img_buffer.seek(0)
+    async def spool_receipt_images(self, image_urls: List[Optional[str]], spool_dir: str) -> List[Optional[str]]:
+        """
+        PDF용 축소 영수증 이미지들을 동시에 조회해 spool_dir에 파일로 저장
 
-            # ReportLab Image 객체 생성 (thumbnail 후의 실제 크기 사용)
-            actual_width = img.width
-            actual_height = img.height
+        이미지를 받는 즉시 디스크에 쓰므로 이미지 수와 관계없이
+        메모리에는 동시 다운로드 중인 이미지만 남습니다.
 
-            # 픽셀을 mm로 변환
-            width_mm = actual_width * 25.4 / 72
-            height_mm = actual_height * 25.4 / 72
+        Returns:
+            입력 순서와 같은 이미지 파일 경로 리스트 (실패/없음은 None)
+        """
+        def spool(url: str) -> Optional[str]:
+            thumbnail = self._fetch_receipt_image(url)
+            if thumbnail is None:
+                return None
+            path = os.path.join(spool_dir, f"{receipt_thumbnail_service.thumbnail_key(url)}.jpg")
+            with open(path, "wb") as f:
+                f.write(thumbnail)
+            return path
+
+        return await self._map_images(image_urls, spool)
+
+    async def _map_images(self, image_urls: List[Optional[str]], fetch) -> list:
+        """
+        URL별 이미지 작업을 스레드에서 동시에 실행 (PDF_IMAGE_FETCH_CONCURRENCY로 제한)
 
-            rl_img = RLImage(img_buffer, width=width_mm*mm, height=height_mm*mm)
+        같은 URL은 한 번만 처리하며, 결과는 입력 순서대로 반환합니다.
+        """
+        semaphore = asyncio.Semaphore(settings.PDF_IMAGE_FETCH_CONCURRENCY)
 
-            print(f"[PDF] 이미지 추가 성공: {actual_width}x{actual_height} (원본에서 리사이즈됨)")
-            return rl_img
+        async def run(url: str):
+            async with semaphore:
+                return await asyncio.to_thread(fetch, url)
 
-        except Exception as e:
-            print(f"[PDF] 이미지 로드 실패: {str(e)}")
-            return None
+        unique_urls = list(dict.fromkeys(url for url in image_urls if url))
+        results = dict(zip(unique_urls, await asyncio.gather(*(run(url) for url in unique_urls))))
+        return [results.get(url) if url else None for url in image_urls]
 
-    def _create_expense_table(self, expense: Dict[str, Any], styles) -> Table:
-        """지출 정보 테이블 생성"""
-        # 날짜 포맷팅
-        expense_date = expense.get('date')
-        if isinstance(expense_date, datetime):
-            date_str = expense_date.strftime('%Y년 %m월 %d일')
-        else:
-            try:
-                date_obj = datetime.fromisoformat(str(expense_date).replace('Z', '+00:00'))
-                date_str = date_obj.strftime('%Y년 %m월 %d일')
-            except:
-                date_str = str(expense_date)
-
-        data = [
-            [Paragraph("항목", styles['TableHeader']), Paragraph("내용", styles['TableHeader'])],
-            [Paragraph("상호명", styles['TableCell']), Paragraph(expense.get('store_name', '-'), styles['TableCell'])],
-            [Paragraph("주소", styles['TableCell']), Paragraph(expense.get('store_address', '-'), styles['TableCell'])],
-            [Paragraph("전화번호", styles['TableCell']), Paragraph(expense.get('store_phone_number', '-'), styles['TableCell'])],
-            [Paragraph("날짜", styles['TableCell']), Paragraph(date_str, styles['TableCell'])],
-            [Paragraph("카테고리", styles['TableCell']), Paragraph(expense.get('category', '-'), styles['TableCell'])],
-            [Paragraph("설명", styles['TableCell']), Paragraph(expense.get('description', '-'), styles['TableCell'])],
-        ]
-
-        table = Table(data, colWidths=[50*mm, 120*mm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 0), (-1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f3f4f6')])
-        ]))
-
-        return table
-
-    def _create_financial_table(self, expense: Dict[str, Any], styles) -> Table:
-        """재무 정보 테이블 생성"""
-        amount = expense.get('amount', 0)
-        amount_str = f"₩ {amount:,.0f}"
-
-        data = [
-            [Paragraph("총 금액", styles['TableHeader']), Paragraph(amount_str, styles['TableCell'])]
-        ]
-
-        table = Table(data, colWidths=[50*mm, 120*mm])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, 0), colors.HexColor('#10b981')),
-            ('TEXTCOLOR', (0, 0), (0, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-            ('FONTSIZE', (0, 0), (-1, -1), 12),
-            ('FONTSIZE', (1, 0), (1, 0), 16),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1.5, colors.HexColor('#10b981')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-
-        return table
-
-    async def generate_report_pdf(self, expenses: list) -> bytes:
+    async def generate_expense_pdf(
+        self,
+        expense: Dict[str, Any],
+        receipt: Optional[Dict[str, Any]] = None
+    ) -> bytes:
         """
-        여러 지출 내역의 리포트 PDF 생성
-        
+        개별 지출 내역 PDF 생성
+
         Args:
-            expenses: 지출 내역 리스트
-            
+            expense: 지출 내역 데이터
+            receipt: 영수증 데이터 (이미지 포함)
+
         Returns:
             PDF 바이트 데이터
         """
-        try:
-            buffer = io.BytesIO()
-            doc = SimpleDocTemplate(
-                buffer,
-                pagesize=A4,
-                rightMargin=20*mm,
-                leftMargin=20*mm,
-                topMargin=20*mm,
-                bottomMargin=20*mm
-            )
+        image_url = receipt.get("image_url") if receipt else None
+        [receipt_image] = await self.prefetch_receipt_images([image_url])
+        return await self._submit("expense", _picklable(expense), receipt_image)
 
-            elements = []
-            styles = self._get_styles()
-
-            # 제목
-            title = Paragraph("지출 내역 리포트", styles['CustomTitle'])
-            elements.append(title)
-            elements.append(Spacer(1, 10*mm))
-
-            # 요약 정보
-            total_amount = sum(exp.get('amount', 0) for exp in expenses)
-            avg_amount = total_amount / len(expenses) if len(expenses) > 0 else 0
-            summary_data = [
-                [Paragraph("항목", styles['TableHeader']), Paragraph("내용", styles['TableHeader'])],
-                [Paragraph("총 지출 건수", styles['TableCell']), Paragraph(f"{len(expenses)}건", styles['TableCell'])],
-                [Paragraph("총 지출 금액", styles['TableCell']), Paragraph(f"₩ {total_amount:,.0f}", styles['TableCell'])],
-                [Paragraph("평균 지출", styles['TableCell']), Paragraph(f"₩ {avg_amount:,.0f}", styles['TableCell'])],
-                [Paragraph("생성일", styles['TableCell']), Paragraph(datetime.now().strftime('%Y년 %m월 %d일'), styles['TableCell'])]
-            ]
-
-            summary_table = Table(summary_data, colWidths=[50*mm, 120*mm])
-            summary_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('TOPPADDING', (0, 0), (-1, 0), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f3f4f6')])
-            ]))
-
-            elements.append(summary_table)
-
-            # 페이지 나누기 - 지출 내역을 다음 페이지부터 표시
-            elements.append(PageBreak())
-
-            # 각 지출 내역마다 정보와 영수증을 위아래로 표시
-            for idx, expense in enumerate(expenses, 1):
-                # 각 지출 내역을 함께 묶을 요소들
-                expense_elements = []
-
-                # 지출 내역 번호
-                expense_date = expense.get('date')
-                if isinstance(expense_date, datetime):
-                    date_str = expense_date.strftime('%Y-%m-%d')
-                else:
-                    try:
-                        date_obj = datetime.fromisoformat(str(expense_date).replace('Z', '+00:00'))
-                        date_str = date_obj.strftime('%Y-%m-%d')
-                    except:
-                        date_str = str(expense_date)
-
-                # 지출 내역 헤더
-                header_text = f"{idx}. {date_str} | {expense.get('store_name', '-')} | ₩{expense.get('amount', 0):,}"
-                header_para = Paragraph(header_text, styles['Korean'])
-                expense_elements.append(header_para)
-                expense_elements.append(Spacer(1, 2*mm))
-
-                # 영수증 이미지 가져오기
-                receipt_url = expense.get('receipt_url')
-                receipt_img = None
-                if receipt_url:
-                    receipt_img = self._add_receipt_image(receipt_url)
-
-                # 단일 큰 테이블로 정보와 영수증을 함께 배치
-                # 왼쪽: 정보, 오른쪽: 영수증 이미지
-
-                # 정보 셀 데이터 구성
-                info_rows = [
-                    [Paragraph("카테고리", styles['TableHeader']), Paragraph(expense.get('category', '-'), styles['TableCell'])],
-                    [Paragraph("설명", styles['TableHeader']), Paragraph(expense.get('description', '-'), styles['TableCell'])]
-                ]
-
-                if expense.get('store_address'):
-                    info_rows.append([Paragraph("주소", styles['TableHeader']), Paragraph(expense.get('store_address'), styles['TableCell'])])
-
-                if expense.get('store_phone_number'):
-                    info_rows.append([Paragraph("전화번호", styles['TableHeader']), Paragraph(expense.get('store_phone_number'), styles['TableCell'])])
-
-                # 위아래 배치: 정보 테이블 위, 영수증 이미지 아래
-                info_table = Table(info_rows, colWidths=[30*mm, 140*mm])
-                info_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#3b82f6')),
-                    ('TEXTCOLOR', (0, 0), (0, -1), colors.white),
-                    ('BACKGROUND', (1, 0), (1, -1), colors.white),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, -1), self.font_name),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('TOPPADDING', (0, 0), (-1, -1), 6),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6)
-                ]))
-                expense_elements.append(info_table)
-
-                # 영수증 이미지 (정보 테이블 아래)
-                if receipt_img:
-                    expense_elements.append(Spacer(1, 3*mm))
-                    # 영수증 이미지 레이블
-                    img_label = Paragraph("영수증 이미지:", styles['Korean'])
-                    expense_elements.append(img_label)
-                    expense_elements.append(Spacer(1, 2*mm))
-                    expense_elements.append(receipt_img)
-                else:
-                    expense_elements.append(Spacer(1, 2*mm))
-                    no_receipt_text = Paragraph("(영수증 이미지 없음)", styles['TableCell'])
-                    expense_elements.append(no_receipt_text)
-
-                # 이 지출 내역의 모든 요소를 KeepTogether로 묶기
-                elements.append(KeepTogether(expense_elements))
-
-                # 항목 간 간격 (구분선 제거, 여백만)
-                if idx < len(expenses):
-                    elements.append(Spacer(1, 8*mm))
-
-            # 발행 정보
-            footer_text = f"발행일: {datetime.now().strftime('%Y년 %m월 %d일')}"
-            footer = Paragraph(footer_text, styles['Footer'])
-            elements.append(footer)
-
-            # PDF 생성
-            doc.build(elements)
-            pdf_bytes = buffer.getvalue()
-            buffer.close()
+    async def generate_report_pdf_file(self, expenses: List[Dict[str, Any]]) -> str:
+        """
+        여러 지출 내역의 리포트 PDF를 임시 파일로 생성
 
-            return pdf_bytes
+        영수증 이미지는 동시에 내려받아 임시 디렉터리에 축소 JPEG로 저장하고,
+        워커 프로세스는 이미지 경로만 받아 PDF를 같은 디렉터리에 씁니다.
+        PDF 바이트가 프로세스 간에 복사되거나 메모리 버퍼에 쌓이지 않으므로
+        메모리 사용량은 원본 이미지 크기와 무관하게 축소 이미지 합계
+        (최대 PDF_REPORT_MAX_EXPENSES장, 장당 약 70x90mm/150dpi JPEG) 이내로 유지됩니다.
 
-        except Exception as e:
-            raise Exception(f"리포트 PDF 생성 실패: {str(e)}")
+        Args:
+            expenses: 지출 내역 리스트 (receipt_url 포함, 최대 PDF_REPORT_MAX_EXPENSES건)
+
+        Returns:
+            PDF 파일 경로 (사용 후 iter_report_file 또는 remove_report_file로 삭제)
+
+        Raises:
+            ValueError: 지출 건수가 한도를 넘는 경우
+            RuntimeError: 대기열이 가득 찬 경우
+        """
+        if len(expenses) > settings.PDF_REPORT_MAX_EXPENSES:
+            raise ValueError(
+                f"리포트에는 최대 {settings.PDF_REPORT_MAX_EXPENSES}건까지 포함할 수 있습니다"
+            )
+
+        spool_dir = tempfile.mkdtemp(prefix="expense-report-", dir=settings.PDF_SPOOL_DIR)
+        try:
+            image_paths = await self.spool_receipt_images(
+                [expense.get("receipt_url") for expense in expenses],
+                spool_dir
+            )
+            output_path = os.path.join(spool_dir, "report.pdf")
+            await self._submit("report", _picklable(expenses), image_paths, output_path)
+
+            # 렌더링이 끝난 이미지는 바로 삭제 (PDF만 남김)
+            for image_path in set(filter(None, image_paths)):
+                os.remove(image_path)
+            return output_path
+        except Exception:
+            shutil.rmtree(spool_dir, ignore_errors=True)
+            raise
+
+    async def generate_report_pdf(self, expenses: List[Dict[str, Any]]) -> bytes:
+        """
+        여러 지출 내역의 리포트 PDF 생성 (바이트로 반환)
+
+        응답으로 내려줄 때는 파일을 청크 단위로 읽는 generate_report_pdf_file을 사용하세요.
+        """
+        path = await self.generate_report_pdf_file(expenses)
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        finally:
+            self.remove_report_file(path)
+
+    @staticmethod
+    def iter_report_file(path: str, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+        """리포트 PDF 파일을 청크 단위로 읽고 다 읽으면(또는 연결이 끊기면) 삭제"""
+        chunk_size = chunk_size or settings.PDF_STREAM_CHUNK_BYTES
+        try:
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        finally:
+            PDFService.remove_report_file(path)
+
+    @staticmethod
+    def remove_report_file(path: str):
+        """리포트 PDF와 임시 디렉터리 삭제"""
+        shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """PDF 작업 대기열 및 썸네일 캐시 통계"""
+        finished = self._completed + self._failed
+        return {
+            "workers": settings.PDF_MAX_WORKERS,
+            "in_flight": min(self._pending, settings.PDF_MAX_WORKERS),
+            "queued": max(0, self._pending - settings.PDF_MAX_WORKERS),
+            "max_pending": settings.PDF_MAX_PENDING,
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+            "avg_render_ms": round(self._render_seconds / finished * 1000, 1) if finished else 0.0,
+            "thumbnail_cache": receipt_thumbnail_service.stats()
+        }
 
 
 pdf_service = PDFService()
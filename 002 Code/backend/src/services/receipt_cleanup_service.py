@@ -1,9 +1,11 @@
 """영수증 정리 서비스 - 자동 삭제 및 아카이브"""
 from typing import Dict, Any, List
+import asyncio
 from datetime import datetime, timedelta
-from src.core.firebase import firebase_client
+from src.core.firebase import firebase_client, firestore_repo
 from src.services.receipt_service import receipt_service
 from src.services.expense_service import expense_service
+from src.services.receipt_thumbnail_service import receipt_thumbnail_service
 
 
 class ReceiptCleanupService:
@@ -11,6 +13,7 @@ class ReceiptCleanupService:
 
     def __init__(self):
         self.db = firebase_client.db
+        self.repo = firestore_repo
         self.storage = firebase_client.bucket
 
     async def cleanup_old_receipts(
@@ -40,7 +43,8 @@ class ReceiptCleanupService:
                 # 실패한 영수증만 삭제 (성공한 것은 보관)
                 query = query.where("ocr_status", "==", "failed")
             
-            docs = query.stream()
+            # 삭제에 필요한 이미지 URL만 조회 (ocr_raw_data 등 대용량 필드 제외)
+            docs = await self.repo.stream(query.select(["image_url"]))
             
             deleted_count = 0
             storage_freed = 0
@@ -62,6 +66,7 @@ class ReceiptCleanupService:
                                     if blob.exists():
                                         storage_freed += blob.size or 0
                                         blob.delete()
+                                receipt_thumbnail_service.delete(receipt_data["image_url"])
                             except Exception as e:
                                 print(f"Storage 삭제 실패 {receipt_id}: {e}")
                         
@@ -69,7 +74,7 @@ class ReceiptCleanupService:
                         # 또는 옵션에 따라 함께 삭제
                         
                         # 3. Firestore에서 영수증 삭제
-                        doc.reference.delete()
+                        await self.repo.delete(doc.reference)
                     
                     deleted_count += 1
                     
@@ -100,7 +105,7 @@ class ReceiptCleanupService:
             .where("ocr_status", "==", "failed")\
             .where("created_at", "<", cutoff_date)
         
-        docs = query.stream()
+        docs = await self.repo.stream(query.select(["image_url"]))
         deleted_count = 0
         
         for doc in docs:
@@ -114,9 +119,10 @@ class ReceiptCleanupService:
                         blob = self.storage.bucket().blob(image_path)
                         if blob.exists():
                             blob.delete()
+                    receipt_thumbnail_service.delete(receipt_data["image_url"])
                 
                 # Firestore 문서 삭제
-                doc.reference.delete()
+                await self.repo.delete(doc.reference)
                 deleted_count += 1
                 
             except Exception as e:
@@ -131,30 +137,16 @@ class ReceiptCleanupService:
     async def get_storage_usage_stats(self) -> Dict[str, Any]:
         """Storage 사용량 통계"""
         try:
-            # 모든 영수증의 이미지 크기 합계 계산
-            receipts_query = self.db.collection("receipts").stream()
-            
-            total_receipts = 0
-            total_size_bytes = 0
-            failed_receipts = 0
-            
-            for doc in receipts_query:
-                receipt_data = doc.to_dict()
-                total_receipts += 1
-                
-                if receipt_data.get("ocr_status") == "failed":
-                    failed_receipts += 1
-                
-                # Storage 파일 크기 확인 (실제 구현 시 필요)
-                if receipt_data.get("image_url"):
-                    try:
-                        image_path = self._extract_storage_path(receipt_data["image_url"])
-                        if image_path:
-                            blob = self.storage.bucket().blob(image_path)
-                            if blob.exists():
-                                total_size_bytes += blob.size or 0
-                    except:
-                        pass
+            receipts_ref = self.db.collection("receipts")
+
+            # 서버 측 count()/sum() 집계로 문서를 내려받지 않고 통계 계산
+            # (이미지 크기는 업로드 시 기록되는 image_size_bytes 필드 기준)
+            total_receipts, failed_receipts, total_size_bytes = await asyncio.gather(
+                self.repo.count(receipts_ref),
+                self.repo.count(receipts_ref.where("ocr_status", "==", "failed")),
+                self.repo.sum(receipts_ref, "image_size_bytes"),
+            )
+            total_size_bytes = int(total_size_bytes)
             
             return {
                 "total_receipts": total_receipts,
@@ -208,7 +200,7 @@ class ReceiptCleanupService:
             .where("created_at", "<", cutoff_date)\
             .where("ocr_status", "==", "completed")
         
-        docs = query.stream()
+        docs = await self.repo.stream(query)
         archived_count = 0
         
         for doc in docs:
@@ -218,10 +210,10 @@ class ReceiptCleanupService:
                 receipt_data["original_id"] = doc.id
                 
                 # 아카이브 컬렉션으로 이동
-                self.db.collection("receipts_archive").document().set(receipt_data)
+                await self.repo.set(self.db.collection("receipts_archive").document(), receipt_data)
                 
                 # 원본 삭제
-                doc.reference.delete()
+                await self.repo.delete(doc.reference)
                 archived_count += 1
                 
             except Exception as e:
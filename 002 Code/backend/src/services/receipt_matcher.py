@@ -0,0 +1,134 @@
+"""지출 ↔ 영수증 매칭 (사용자별 후보 인덱스)"""
+import bisect
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from src.services.store_name_matcher import StoreKey, StoreNameIndex, store_name_matcher
+
+# 매칭으로 인정하는 최소 점수 (상호명 50 + 금액 30 + 날짜 20 = 100점 만점)
+MATCH_MIN_SCORE = 50
+# 총액을 읽지 못한 영수증을 상호명으로 찾을 때 날짜 확인 전 후보 수
+UNPRICED_SEARCH_LIMIT = 20
+
+
+def to_naive_utc(value: Any) -> Optional[datetime]:
+    """
+    datetime/ISO 문자열을 UTC 기준 naive datetime으로 변환
+
+    Firestore 타임스탬프(UTC aware)와 요청에서 온 naive 날짜를 비교할 수 있도록 맞춥니다.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def store_name_score(receipt_store: StoreKey, store_name: StoreKey) -> float:
+    """상호명 점수 (유사도 × 50점, 같은 상호로 볼 수 없으면 0점)"""
+    return 50 * store_name_matcher.match_score(receipt_store, store_name)
+
+
+def date_score(receipt_date: datetime, date: datetime) -> float:
+    """날짜 점수 (같은 날 20점, 하루 차이마다 5점 감점)"""
+    days_diff = abs((receipt_date - date).days)
+    return max(0, 20 - days_diff * 5)
+
+
+class ReceiptCandidateIndex:
+    """
+    한 사용자의 영수증을 금액 순으로 정렬한 매칭 후보 인덱스
+
+    리포트 하나를 만들 때 한 번 구성하고, 지출마다 금액 범위를 이분 탐색한 뒤
+    그 안에서 날짜 범위에 드는 영수증만 점수를 계산합니다.
+    상호명 비교 키(StoreKey)는 인덱스를 만들 때 영수증마다 한 번만 계산합니다.
+    OCR이 총액을 읽지 못한 영수증(총액 0)은 금액 범위에 들지 않으므로
+    상호명 3-gram 역색인(StoreNameIndex)에 따로 넣고 상호명 + 날짜로만 찾습니다.
+    image_url이 없는 영수증은 PDF에 넣을 이미지가 없으므로 제외합니다.
+    """
+
+    def __init__(self, receipts: List[Dict[str, Any]]):
+        entries = []
+        self._unpriced: List[Tuple[datetime, Dict[str, Any]]] = []
+        self._unpriced_index = StoreNameIndex(store_name_matcher)
+        for receipt in receipts:
+            if not receipt.get("image_url"):
+                continue
+            purchase_date = to_naive_utc(receipt.get("purchase_date"))
+            if purchase_date is None:
+                continue
+
+            amount = float(receipt.get("total_amount") or 0)
+            if amount <= 0:
+                self._unpriced_index.add(str(len(self._unpriced)), receipt.get("store_name", ""))
+                self._unpriced.append((purchase_date, receipt))
+                continue
+
+            entries.append((
+                amount,
+                purchase_date,
+                store_name_matcher.key(receipt.get("store_name", "")),
+                receipt
+            ))
+
+        entries.sort(key=lambda entry: entry[0])
+        self._amounts = [entry[0] for entry in entries]
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._unpriced)
+
+    def candidates(
+        self,
+        store_name: str,
+        amount: float,
+        date: datetime,
+        tolerance_days: int = 1,
+        amount_tolerance_percent: float = 5.0
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        금액 범위와 날짜 범위에 드는 영수증의 (점수, 영수증) 목록 (최소 점수 이상만)
+
+        점수: 상호명 유사도(최대 50) + 금액 차이(최대 30) + 날짜 차이(최대 20)
+        총액을 읽지 못한 영수증은 금액 점수 없이 상호명 + 날짜 점수로만 계산합니다.
+        """
+        amount_min = amount * (1 - amount_tolerance_percent / 100)
+        amount_max = amount * (1 + amount_tolerance_percent / 100)
+        date_min = date - timedelta(days=tolerance_days)
+        date_max = date + timedelta(days=tolerance_days)
+
+        start = bisect.bisect_left(self._amounts, amount_min)
+        end = bisect.bisect_right(self._amounts, amount_max)
+
+        store_key = store_name_matcher.key(store_name)
+
+        scored = []
+        for receipt_amount, receipt_date, receipt_store, receipt in self._entries[start:end]:
+            if not date_min <= receipt_date <= date_max:
+                continue
+
+            score = store_name_score(receipt_store, store_key)
+
+            # 금액이 정확할수록 높은 점수
+            amount_diff_percent = abs(receipt_amount - amount) / amount * 100 if amount > 0 else 100
+            score += max(0, 30 - amount_diff_percent)
+
+            # 날짜가 정확할수록 높은 점수
+            score += date_score(receipt_date, date)
+
+            if score >= MATCH_MIN_SCORE:
+                scored.append((score, receipt))
+
+        if len(self._unpriced_index):
+            for similarity, position in self._unpriced_index.search(store_name, limit=UNPRICED_SEARCH_LIMIT):
+                receipt_date, receipt = self._unpriced[int(position)]
+                if not date_min <= receipt_date <= date_max:
+                    continue
+                score = 50 * similarity + date_score(receipt_date, date)
+                if score >= MATCH_MIN_SCORE:
+                    scored.append((score, receipt))
+        return scored
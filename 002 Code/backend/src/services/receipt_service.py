@@ -1,9 +1,12 @@
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-from src.core.firebase import firebase_client
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
+import asyncio
+from src.core.firebase import firebase_client, firestore_repo
 from src.services.ocr_service import ocr_service
 from src.services.expense_service import expense_service
-from src.services.category_service import category_service
+from src.services.receipt_matcher import ReceiptCandidateIndex, to_naive_utc
+from src.services.receipt_thumbnail_service import receipt_thumbnail_service
+from src.services.storage_service import storage_service
 
 
 class ReceiptService:
@@ -11,13 +14,56 @@ class ReceiptService:
 
     def __init__(self):
         self.db = firebase_client.db
+        self.repo = firestore_repo
         self.collection = "receipts"
+        self._thumbnail_tasks = set()
+
+    async def _upload_image(self, user_id: str, image_data: bytes) -> Dict[str, Any]:
+        """
+        이미지를 Storage에 업로드
+
+        Returns:
+            영수증 문서에 저장할 이미지 필드 (업로드 실패 시 image_url은 None)
+        """
+        uploaded = await storage_service.upload_receipt_image(image_data, user_id)
+        if not uploaded:
+            return {"image_url": None, "image_size_bytes": 0}
+
+        self._warm_thumbnail(uploaded["image_url"], image_data)
+        return {
+            "image_url": uploaded["image_url"],
+            "image_size_bytes": uploaded["size_bytes"],
+            "image_content_type": uploaded["content_type"]
+        }
+
+    @staticmethod
+    async def _merge_image_fields(image_fields: Dict[str, Any], upload_task) -> Dict[str, Any]:
+        """업로드 결과로 이미지 필드 갱신 (업로드 실패 시 기존 image_url 유지)"""
+        uploaded = await upload_task
+        return uploaded if uploaded["image_url"] else image_fields
+
+    def _warm_thumbnail(self, image_url: str, image_data: bytes):
+        """
+        업로드한 원본으로 PDF용 썸네일을 백그라운드에서 미리 생성
+
+        이후 PDF 내보내기에서는 원본을 다시 내려받지 않고 캐시된 썸네일을 사용합니다.
+        """
+        async def warm():
+            try:
+                await asyncio.to_thread(receipt_thumbnail_service.store, image_url, image_data)
+            except Exception as e:
+                print(f"[Thumbnail] 썸네일 미리 생성 실패: {e}")
+
+        task = asyncio.create_task(warm())
+        self._thumbnail_tasks.add(task)
+        task.add_done_callback(self._thumbnail_tasks.discard)
 
     async def upload_and_process_receipt(
         self,
         user_id: str,
         image_data: bytes = None,
-        image_url: str = None
+        image_url: str = None,
+        organizationName: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         영수증 업로드 및 전체 처리 플로우
@@ -33,26 +79,25 @@ class ReceiptService:
             user_id: 사용자 ID
             image_data: 이미지 바이트 데이터
             image_url: 이미지 URL (선택)
+            organizationName: 조직 이름 (생성되는 Expense에 저장)
 
         Returns:
             처리 결과 (receipt, expenses)
         """
+        image_fields = {"image_url": image_url, "image_size_bytes": 0}
+        upload_task = None
         try:
-            # 1. 이미지를 Firebase Storage에 업로드
-            uploaded_image_url = None
+            # 1. 이미지를 Firebase Storage에 업로드 (OCR과 동시에 진행)
             if image_data:
-                uploaded_image_url = firebase_client.upload_image(
-                    image_data=image_data,
-                    user_id=user_id
-                )
-                if uploaded_image_url:
-                    print(f"[Storage] 이미지 업로드 완료: {uploaded_image_url}")
-                    image_url = uploaded_image_url
+                upload_task = asyncio.create_task(self._upload_image(user_id, image_data))
 
             # 2. OCR 처리
             print(f"[OCR] Receipt OCR processing started...")
             ocr_result = await ocr_service.process_receipt(image_data=image_data)
 
+            if upload_task is not None:
+                image_fields = await self._merge_image_fields(image_fields, upload_task)
+
             if ocr_result["status"] != "success":
                 raise Exception(f"OCR 처리 실패: {ocr_result.get('message', 'Unknown error')}")
 
@@ -73,7 +118,7 @@ class ReceiptService:
                 "total_amount": ocr_data["total_amount"],
                 "purchase_date": purchase_date,
                 "items": [],  # 개별 품목은 저장하지 않음
-                "image_url": image_url,
+                **image_fields,
                 "ocr_raw_data": ocr_result.get("raw_ocr_response"),
                 "ocr_status": "completed",
                 "ocr_processed_at": datetime.utcnow(),
@@ -83,7 +128,7 @@ class ReceiptService:
 
             # 3. Firestore에 Receipt 저장
             receipt_ref = self.db.collection(self.collection).document()
-            receipt_ref.set(receipt_data)
+            await self.repo.set(receipt_ref, receipt_data)
             receipt_data["id"] = receipt_ref.id
 
             print(f"[SUCCESS] Receipt saved: {receipt_ref.id}")
@@ -91,14 +136,7 @@ class ReceiptService:
             # 4. 총액으로 단일 Expense 자동 생성
             created_expenses = []
 
-            # 카테고리 자동 분류
-            category, confidence = category_service.classify(
-                store_name=ocr_data["store_name"],
-                item_name="",
-                amount=ocr_data["total_amount"]
-            )
-
-            # Expense 생성
+            # Expense 생성 (카테고리는 자동 분류되고 분류 방식이 ai/keyword로 기록됨)
             expense = await expense_service.create_expense(
                 user_id=user_id,
                 receipt_id=receipt_ref.id,
@@ -108,12 +146,12 @@ class ReceiptService:
                 amount=ocr_data["total_amount"],
                 date=receipt_data["purchase_date"],
                 item_name="",
-                category=category,
-                description=f"{ocr_data['store_name']}에서 구매"
+                description=f"{ocr_data['store_name']}에서 구매",
+                organizationName=organizationName
             )
 
             created_expenses.append(expense)
-            print(f"[EXPENSE] Created: {category} - {ocr_data['total_amount']} KRW")
+            print(f"[EXPENSE] Created: {expense['category']} - {ocr_data['total_amount']} KRW")
 
             return {
                 "status": "success",
@@ -123,6 +161,9 @@ class ReceiptService:
             }
 
         except Exception as e:
+            if upload_task is not None:
+                image_fields = await self._merge_image_fields(image_fields, upload_task)
+
             # 에러 발생 시 Receipt는 failed 상태로 저장
             error_receipt_data = {
                 "user_id": user_id,
@@ -132,7 +173,7 @@ class ReceiptService:
                 "total_amount": 0,
                 "purchase_date": datetime.utcnow(),
                 "items": [],
-                "image_url": image_url,
+                **image_fields,
                 "ocr_status": "failed",
                 "ocr_raw_data": {"error": str(e)},
                 "created_at": datetime.utcnow(),
@@ -140,18 +181,216 @@ class ReceiptService:
             }
 
             receipt_ref = self.db.collection(self.collection).document()
-            receipt_ref.set(error_receipt_data)
+            await self.repo.set(receipt_ref, error_receipt_data)
 
             raise Exception(f"영수증 처리 실패: {str(e)}")
 
+    async def create_pending_receipt(self, user_id: str, image_data: bytes) -> Dict[str, Any]:
+        """
+        OCR 작업 모드용 대기 영수증 생성
+
+        이미지만 Storage에 업로드하고 ocr_status="pending" 상태로 저장합니다.
+        OCR 및 Expense 생성은 process_pending_receipt에서 백그라운드로 수행합니다.
+
+        Args:
+            user_id: 사용자 ID
+            image_data: 이미지 바이트 데이터
+
+        Returns:
+            생성된 영수증 데이터 (id 포함)
+        """
+        try:
+            image_fields = await self._upload_image(user_id, image_data)
+
+            now = datetime.utcnow()
+            receipt_data = {
+                "user_id": user_id,
+                "store_name": "",
+                "store_address": "",
+                "store_phone_number": "",
+                "total_amount": 0,
+                "purchase_date": now,
+                "items": [],
+                **image_fields,
+                "ocr_status": "pending",
+                "created_at": now,
+                "updated_at": now
+            }
+
+            receipt_ref = self.db.collection(self.collection).document()
+            await self.repo.set(receipt_ref, receipt_data)
+            receipt_data["id"] = receipt_ref.id
+            return receipt_data
+
+        except Exception as e:
+            raise Exception(f"영수증 작업 생성 실패: {str(e)}")
+
+    async def process_pending_receipt(
+        self,
+        receipt_id: str,
+        user_id: str,
+        image_data: bytes,
+        create_expense: bool = False,
+        organizationName: Optional[str] = None
+    ):
+        """
+        대기 영수증의 OCR 처리 (백그라운드 워커에서 호출)
+
+        processing → completed / failed 순서로 ocr_status를 갱신하며,
+        create_expense=True이면 총액으로 Expense를 생성하고 expense_ids를 기록합니다.
+
+        Args:
+            receipt_id: 영수증 ID
+            user_id: 사용자 ID
+            image_data: 이미지 바이트 데이터
+            create_expense: Expense 자동 생성 여부 (/receipt/upload 작업)
+            organizationName: 생성되는 Expense에 저장할 조직 이름
+        """
+        receipt_ref = self.db.collection(self.collection).document(receipt_id)
+
+        try:
+            await self.repo.update(receipt_ref, {
+                "ocr_status": "processing",
+                "updated_at": datetime.utcnow()
+            })
+
+            ocr_result = await ocr_service.process_receipt(image_data=image_data)
+
+            if ocr_result["status"] != "success":
+                raise Exception(f"OCR 처리 실패: {ocr_result.get('message', 'Unknown error')}")
+
+            ocr_data = ocr_result["data"]
+
+            # 날짜 처리
+            date_value = ocr_data.get("date")
+            if isinstance(date_value, datetime):
+                purchase_date = date_value
+            else:
+                try:
+                    purchase_date = datetime.strptime(str(date_value), "%Y-%m-%d")
+                except:
+                    purchase_date = datetime.utcnow()
+
+            update_data = {
+                "store_name": ocr_data.get("store_name", ""),
+                "store_address": ocr_data.get("store_address", ""),
+                "store_phone_number": ocr_data.get("store_phone_number", ""),
+                "total_amount": ocr_data.get("total_amount", 0),
+                "purchase_date": purchase_date,
+                "ocr_raw_data": ocr_result.get("raw_ocr_response"),
+                "ocr_status": "completed",
+                "ocr_processed_at": datetime.utcnow(),
+                "updated_at": datetime.utcnow()
+            }
+
+            if create_expense:
+                # 카테고리는 자동 분류되고 분류 방식이 ai/keyword로 기록됨
+                expense = await expense_service.create_expense(
+                    user_id=user_id,
+                    receipt_id=receipt_id,
+                    store_name=update_data["store_name"],
+                    store_address=update_data["store_address"],
+                    store_phone_number=update_data["store_phone_number"],
+                    amount=update_data["total_amount"],
+                    date=purchase_date,
+                    item_name="",
+                    description=f"{update_data['store_name']}에서 구매",
+                    organizationName=organizationName
+                )
+                update_data["expense_ids"] = [expense["id"]]
+                print(f"[EXPENSE] Created: {expense['category']} - {update_data['total_amount']} KRW")
+
+            await self.repo.update(receipt_ref, update_data)
+            print(f"[SUCCESS] Receipt job completed: {receipt_id}")
+
+        except Exception as e:
+            print(f"[OCR JOB ERROR] {receipt_id}: {str(e)}")
+            await self.fail_pending_receipt(receipt_id, str(e))
+
+    async def fail_pending_receipt(self, receipt_id: str, error: str):
+        """대기/처리 중인 영수증 작업을 실패 상태로 변경"""
+        await self.repo.update(self.db.collection(self.collection).document(receipt_id), {
+            "ocr_status": "failed",
+            "ocr_raw_data": {"error": error},
+            "updated_at": datetime.utcnow()
+        })
+
+    async def renew_job_leases(self, receipt_ids: List[str]) -> int:
+        """
+        이 프로세스가 맡고 있는 대기/처리 중 작업의 임대(updated_at) 갱신
+
+        updated_at이 OCR_JOB_LEASE_SECONDS보다 오래된 작업은 fail_orphaned_jobs가
+        버려진 작업으로 보므로, 작업을 가진 프로세스가 주기적으로 호출합니다.
+        이미 끝났거나 삭제된 작업은 건너뜁니다.
+
+        Returns:
+            갱신한 영수증 수
+        """
+        collection = self.db.collection(self.collection)
+        docs = await self.repo.get_all(collection.document(receipt_id) for receipt_id in receipt_ids)
+        now = datetime.utcnow()
+        return await self.repo.batch_update(
+            (doc.reference, {"updated_at": now})
+            for doc in docs
+            if doc.exists and doc.to_dict().get("ocr_status") in ("pending", "processing")
+        )
+
+    async def fail_orphaned_jobs(self, error: str, lease_seconds: int) -> int:
+        """
+        임대가 만료된 pending/processing 영수증 작업을 실패 처리
+
+        작업 큐는 프로세스 메모리에 있고 이미지 바이트와 Expense 생성 여부도 큐에만 있으므로
+        작업을 가진 프로세스가 종료되면 다시 처리할 수 없습니다. 살아 있는 프로세스는
+        renew_job_leases로 updated_at을 갱신하므로, updated_at이 lease_seconds보다 오래된
+        작업만 버려진 것으로 보고 실패로 표시합니다 (다른 워커 프로세스의 작업은 유지).
+
+        Args:
+            error: 실패 사유
+            lease_seconds: 임대 만료 기준 (초)
+
+        Returns:
+            실패 처리한 영수증 수
+        """
+        # ocr_status + updated_at 범위 조건은 복합 색인이 필요하므로 만료 여부는 조회 후 판단
+        query = self.db.collection(self.collection)\
+            .where("ocr_status", "in", ["pending", "processing"])\
+            .select(["ocr_status", "updated_at"])
+        docs = await self.repo.stream(query)
+        now = datetime.utcnow()
+        expires_before = now - timedelta(seconds=lease_seconds)
+
+        expired = []
+        for doc in docs:
+            updated_at = to_naive_utc(doc.to_dict().get("updated_at"))
+            if updated_at is None or updated_at < expires_before:
+                expired.append(doc.reference)
+
+        return await self.repo.batch_update(
+            (ref, {
+                "ocr_status": "failed",
+                "ocr_raw_data": {"error": error},
+                "updated_at": now
+            })
+            for ref in expired
+        )
+
     async def get_receipts(
         self,
         user_id: str,
         start_date: datetime = None,
         end_date: datetime = None,
-        limit: int = 100
-    ) -> List[Dict[str, Any]]:
-        """영수증 목록 조회"""
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        영수증 목록 조회 (커서 기반 페이지)
+
+        Returns:
+            {"items": 영수증 리스트, "next_cursor": 다음 페이지 커서 또는 None}
+
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
         try:
             query = self.db.collection(self.collection).where("user_id", "==", user_id)
 
@@ -160,24 +399,26 @@ class ReceiptService:
             if end_date:
                 query = query.where("purchase_date", "<=", end_date)
 
-            query = query.order_by("purchase_date", direction="DESCENDING").limit(limit)
+            query = query.order_by("purchase_date", direction="DESCENDING")
 
-            docs = query.stream()
+            docs, next_cursor = await self.repo.page(query, "purchase_date", limit, cursor)
             receipts = []
             for doc in docs:
                 receipt_data = doc.to_dict()
                 receipt_data["id"] = doc.id
                 receipts.append(receipt_data)
 
-            return receipts
+            return {"items": receipts, "next_cursor": next_cursor}
 
+        except ValueError:
+            raise
         except Exception as e:
             raise Exception(f"영수증 목록 조회 실패: {str(e)}")
 
     async def get_receipt(self, receipt_id: str) -> Optional[Dict[str, Any]]:
         """특정 영수증 조회"""
         try:
-            doc = self.db.collection(self.collection).document(receipt_id).get()
+            doc = await self.repo.get(self.db.collection(self.collection).document(receipt_id))
 
             if doc.exists:
                 receipt_data = doc.to_dict()
@@ -188,6 +429,31 @@ class ReceiptService:
         except Exception as e:
             raise Exception(f"영수증 조회 실패: {str(e)}")
 
+    async def get_receipts_by_ids(self, receipt_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 영수증을 배치 읽기로 조회
+
+        Args:
+            receipt_ids: 영수증 ID 리스트 (중복/빈 값 무시)
+
+        Returns:
+            {영수증 ID: 영수증 데이터} (존재하지 않는 ID는 제외)
+        """
+        try:
+            collection = self.db.collection(self.collection)
+            refs = [collection.document(receipt_id) for receipt_id in dict.fromkeys(filter(None, receipt_ids))]
+
+            receipts = {}
+            for doc in await self.repo.get_all(refs):
+                if doc.exists:
+                    receipt_data = doc.to_dict()
+                    receipt_data["id"] = doc.id
+                    receipts[doc.id] = receipt_data
+            return receipts
+
+        except Exception as e:
+            raise Exception(f"영수증 조회 실패: {str(e)}")
+
     async def get_receipt_with_expenses(self, receipt_id: str) -> Optional[Dict[str, Any]]:
         """영수증과 관련 지출 내역을 함께 조회"""
         try:
@@ -221,7 +487,7 @@ class ReceiptService:
                     await expense_service.delete_expense(expense["id"])
 
             # Receipt 삭제
-            self.db.collection(self.collection).document(receipt_id).delete()
+            await self.repo.delete(self.db.collection(self.collection).document(receipt_id))
             return True
 
         except Exception as e:
@@ -239,6 +505,8 @@ class ReceiptService:
         """
         지출 내역과 매칭되는 영수증 찾기
 
+        여러 지출을 한 번에 매칭할 때는 match_receipts를 사용하세요.
+
         Args:
             user_id: 사용자 ID
             store_name: 상호명
@@ -248,90 +516,126 @@ class ReceiptService:
             amount_tolerance_percent: 금액 허용 오차 (%)
 
         Returns:
-            매칭되는 영수증 또는 None
+            매칭되는 영수증 (매칭에 필요한 필드만 포함) 또는 None
         """
-        try:
-            print(f"[Receipt Match] 영수증 매칭 시도 - user: {user_id}, store: {store_name}, amount: {amount}, date: {date}")
-
-            # user_id로 필터링
-            receipts_ref = self.db.collection(self.collection).where("user_id", "==", user_id)
-            receipts = receipts_ref.stream()
-
-            # 날짜 범위 계산
-            from datetime import timedelta
-            date_min = date - timedelta(days=tolerance_days)
-            date_max = date + timedelta(days=tolerance_days)
-
-            # 금액 범위 계산
-            amount_min = amount * (1 - amount_tolerance_percent / 100)
-            amount_max = amount * (1 + amount_tolerance_percent / 100)
+        matches = await self.match_receipts(
+            [{"id": "_", "user_id": user_id, "store_name": store_name, "amount": amount, "date": date}],
+            tolerance_days=tolerance_days,
+            amount_tolerance_percent=amount_tolerance_percent
+        )
+        return matches.get("_")
+
+    async def match_receipts(
+        self,
+        expenses: List[Dict[str, Any]],
+        tolerance_days: int = 1,
+        amount_tolerance_percent: float = 5.0
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 지출 내역을 한 번에 영수증과 매칭
 
-            best_match = None
-            best_score = 0
+        사용자별로 지출 날짜 ± tolerance_days 구간의 영수증만 범위 쿼리로 읽어
+        금액 순 후보 인덱스(ReceiptCandidateIndex)를 한 번 만들고,
+        모든 (지출, 영수증) 후보를 점수 내림차순으로 배정합니다.
+        영수증 하나는 지출 하나에만 배정됩니다.
 
-            for receipt_doc in receipts:
-                receipt_data = receipt_doc.to_dict()
-                receipt_data["id"] = receipt_doc.id
+        Args:
+            expenses: 지출 내역 리스트 (id, user_id, store_name, amount, date 필요)
+            tolerance_days: 날짜 허용 오차 (일)
+            amount_tolerance_percent: 금액 허용 오차 (%)
 
-                # image_url이 없는 receipt는 스킵
-                if not receipt_data.get("image_url"):
+        Returns:
+            {지출 ID: 매칭된 영수증} (매칭 실패한 지출은 제외, 영수증은 매칭에 필요한 필드만 포함)
+        """
+        try:
+            targets_by_user: Dict[str, List[Tuple[str, str, float, datetime]]] = {}
+            for expense in expenses:
+                expense_date = to_naive_utc(expense.get("date"))
+                if not expense.get("id") or not expense.get("user_id") or expense_date is None:
+                    continue
+                targets_by_user.setdefault(expense["user_id"], []).append((
+                    expense["id"],
+                    expense.get("store_name") or "",
+                    float(expense.get("amount") or 0),
+                    expense_date
+                ))
+
+            if not targets_by_user:
+                return {}
+
+            async def build_index(user_id: str, targets) -> Tuple[str, ReceiptCandidateIndex]:
+                windows = self._merge_date_windows(
+                    [target[3] for target in targets],
+                    timedelta(days=tolerance_days)
+                )
+                results = await asyncio.gather(*(
+                    self._stream_match_candidates(user_id, date_min, date_max)
+                    for date_min, date_max in windows
+                ))
+                return user_id, ReceiptCandidateIndex([receipt for result in results for receipt in result])
+
+            indexes = dict(await asyncio.gather(*(
+                build_index(user_id, targets) for user_id, targets in targets_by_user.items()
+            )))
+
+            candidates = []
+            for user_id, targets in targets_by_user.items():
+                index = indexes[user_id]
+                for expense_id, store_name, amount, expense_date in targets:
+                    for score, receipt in index.candidates(
+                        store_name, amount, expense_date, tolerance_days, amount_tolerance_percent
+                    ):
+                        candidates.append((score, expense_id, receipt))
+
+            # 점수가 높은 쌍부터 배정 (같은 점수는 먼저 나온 후보 우선)
+            candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+            matches: Dict[str, Dict[str, Any]] = {}
+            used_receipts = set()
+            for score, expense_id, receipt in candidates:
+                if expense_id in matches or receipt["id"] in used_receipts:
                     continue
+                matches[expense_id] = receipt
+                used_receipts.add(receipt["id"])
 
-                # 매칭 점수 계산
-                score = 0
-
-                # 1. 상호명 매칭 (50점)
-                receipt_store = receipt_data.get("store_name", "")
-                if receipt_store and store_name:
-                    if receipt_store.lower() == store_name.lower():
-                        score += 50
-                    elif receipt_store.lower() in store_name.lower() or store_name.lower() in receipt_store.lower():
-                        score += 30
-
-                # 2. 금액 매칭 (30점)
-                receipt_amount = receipt_data.get("total_amount", 0)
-                if amount_min <= receipt_amount <= amount_max:
-                    # 금액이 정확할수록 높은 점수
-                    amount_diff_percent = abs(receipt_amount - amount) / amount * 100 if amount > 0 else 100
-                    amount_score = max(0, 30 - amount_diff_percent)
-                    score += amount_score
-                    print(f"[Receipt Match] 금액 매칭: receipt={receipt_amount}, expense={amount}, diff={amount_diff_percent:.2f}%, score={amount_score}")
-
-                # 3. 날짜 매칭 (20점)
-                receipt_date = receipt_data.get("purchase_date")
-                # 날짜 타입 변환
-                if receipt_date and not isinstance(receipt_date, datetime):
-                    try:
-                        if isinstance(receipt_date, str):
-                            receipt_date = datetime.fromisoformat(receipt_date.replace('Z', '+00:00'))
-                    except:
-                        receipt_date = None
-
-                if receipt_date and isinstance(receipt_date, datetime):
-                    if date_min <= receipt_date <= date_max:
-                        # 날짜가 정확할수록 높은 점수
-                        days_diff = abs((receipt_date - date).days)
-                        date_score = max(0, 20 - days_diff * 5)
-                        score += date_score
-                        print(f"[Receipt Match] 날짜 매칭: receipt={receipt_date}, expense={date}, diff={days_diff}일, score={date_score}")
-
-                print(f"[Receipt Match] Receipt {receipt_doc.id}: total_score={score}, store={receipt_store}, amount={receipt_amount}")
-
-                # 최고 점수 업데이트 (최소 50점 이상으로 완화)
-                if score > best_score and score >= 50:
-                    best_score = score
-                    best_match = receipt_data
-
-            if best_match:
-                print(f"[Receipt Match] 매칭 성공! Receipt ID: {best_match['id']}, score: {best_score}")
-                return best_match
-            else:
-                print(f"[Receipt Match] 매칭 실패 - 적합한 영수증을 찾지 못함")
-                return None
+            target_count = sum(len(targets) for targets in targets_by_user.values())
+            print(f"[Receipt Match] {target_count}건 중 {len(matches)}건 매칭 (후보 영수증 {sum(len(index) for index in indexes.values())}건)")
+            return matches
 
         except Exception as e:
             print(f"[Receipt Match] 에러: {str(e)}")
-            return None
+            return {}
+
+    @staticmethod
+    def _merge_date_windows(dates: List[datetime], tolerance: timedelta) -> List[Tuple[datetime, datetime]]:
+        """날짜 ± 허용 오차 구간들을 겹치는 것끼리 합쳐 쿼리 수를 줄임"""
+        windows: List[Tuple[datetime, datetime]] = []
+        for date in sorted(dates):
+            date_min, date_max = date - tolerance, date + tolerance
+            if windows and date_min <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], max(windows[-1][1], date_max))
+            else:
+                windows.append((date_min, date_max))
+        return windows
 
+    async def _stream_match_candidates(
+        self,
+        user_id: str,
+        date_min: datetime,
+        date_max: datetime
+    ) -> List[Dict[str, Any]]:
+        """구매일이 구간 안에 있는 사용자의 영수증 조회 (매칭에 필요한 필드만)"""
+        query = self.db.collection(self.collection)\
+            .where("user_id", "==", user_id)\
+            .where("purchase_date", ">=", date_min)\
+            .where("purchase_date", "<=", date_max)\
+            .order_by("purchase_date", direction="DESCENDING")\
+            .select(["store_name", "total_amount", "purchase_date", "image_url"])
+
+        receipts = []
+        for doc in await self.repo.stream(query):
+            receipt_data = doc.to_dict()
+            receipt_data["id"] = doc.id
+            receipts.append(receipt_data)
+        return receipts
 
 receipt_service = ReceiptService()
@@ -0,0 +1,259 @@
+"""PDF용 영수증 썸네일 캐시 (로컬 디스크 LRU + Firebase Storage)"""
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Optional
+from PIL import Image, ImageOps
+from src.core.config import settings
+
+# PDF 영수증 이미지 크기/화질 (바꾸면 버전을 올려 이전 썸네일을 무효화)
+THUMBNAIL_MAX_WIDTH_MM = 70
+THUMBNAIL_MAX_HEIGHT_MM = 90
+THUMBNAIL_DPI = 150
+THUMBNAIL_JPEG_QUALITY = 95
+THUMBNAIL_VERSION = f"pdf-{THUMBNAIL_MAX_WIDTH_MM}x{THUMBNAIL_MAX_HEIGHT_MM}mm-{THUMBNAIL_DPI}dpi-q{THUMBNAIL_JPEG_QUALITY}"
+
+
+def prepare_receipt_image(image_data: bytes) -> bytes:
+    """
+    영수증 이미지 EXIF 회전 보정 및 PDF용 축소 (JPEG)
+
+    PIL의 디코딩/리사이즈/인코딩은 GIL을 해제하므로 여러 스레드에서 병렬로 실행됩니다.
+    """
+    img = Image.open(io.BytesIO(image_data))
+
+    # EXIF 방향 정보 확인 및 자동 회전
+    try:
+        img = ImageOps.exif_transpose(img)
+    except Exception as e:
+        print(f"[Thumbnail] EXIF 처리 건너뜀: {str(e)}")
+
+    # RGB 모드로 변환 (RGBA나 다른 모드일 경우)
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    # 지출 내역과 같은 페이지에 들어가도록 작게 조정 (mm → 픽셀)
+    max_width_px = int(THUMBNAIL_MAX_WIDTH_MM * THUMBNAIL_DPI / 25.4)
+    max_height_px = int(THUMBNAIL_MAX_HEIGHT_MM * THUMBNAIL_DPI / 25.4)
+
+    # 비율 유지하면서 리사이즈
+    img.thumbnail((max_width_px, max_height_px), Image.Resampling.LANCZOS)
+
+    img_buffer = io.BytesIO()
+    img.save(img_buffer, format='JPEG', quality=THUMBNAIL_JPEG_QUALITY)
+    return img_buffer.getvalue()
+
+
+class ReceiptThumbnailService:
+    """
+    원본 이미지 URL → PDF용 축소 JPEG 캐시
+
+    키는 원본 URL과 썸네일 버전의 SHA-256 해시이므로 같은 영수증은 항상 같은 키를 가집니다.
+    로컬 디스크 LRU를 먼저 확인하고, 없으면 Storage의 thumbnails/pdf/<키>.jpg를 읽습니다.
+    둘 다 없으면 원본을 내려받아 한 번만 만들고 두 곳에 저장합니다.
+    모든 메서드는 동기이며 PDFService의 다운로드 스레드에서 호출됩니다.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.storage_prefix = "thumbnails/pdf"
+        self._index: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.disk_hits = 0
+        self.storage_hits = 0
+        self.generated = 0
+
+    @staticmethod
+    def thumbnail_key(image_url: str) -> str:
+        """원본 URL + 썸네일 버전의 SHA-256 해시"""
+        return hashlib.sha256(f"{THUMBNAIL_VERSION}\x1f{image_url}".encode("utf-8")).hexdigest()
+
+    def get_or_create(self, image_url: str, download: Callable[[str], bytes]) -> bytes:
+        """
+        캐시된 썸네일 반환 (없으면 생성 후 캐시)
+
+        Args:
+            image_url: 원본 영수증 이미지 URL
+            download: 원본 이미지를 내려받는 함수 (캐시 미스 시에만 호출)
+
+        Returns:
+            PDF용 축소 JPEG 바이트
+        """
+        key = self.thumbnail_key(image_url)
+
+        thumbnail = self._read_disk(key)
+        if thumbnail is not None:
+            self.disk_hits += 1
+            return thumbnail
+
+        thumbnail = self._read_storage(key)
+        if thumbnail is not None:
+            self.storage_hits += 1
+            self._write_disk(key, thumbnail)
+            return thumbnail
+
+        return self.store(image_url, download(image_url))
+
+    def store(self, image_url: str, image_data: bytes) -> bytes:
+        """
+        원본 이미지로 썸네일을 만들어 Storage와 디스크에 저장
+
+        업로드 직후 이미 가지고 있는 원본 바이트로 미리 만들어 둘 때도 사용합니다.
+        """
+        key = self.thumbnail_key(image_url)
+        thumbnail = prepare_receipt_image(image_data)
+        self.generated += 1
+        self._write_storage(key, thumbnail)
+        self._write_disk(key, thumbnail)
+        return thumbnail
+
+    def delete(self, image_url: str):
+        """원본 이미지 삭제 시 썸네일도 삭제 (실패는 무시)"""
+        key = self.thumbnail_key(image_url)
+        with self._lock:
+            index = self._load_index()
+            size = index.pop(key, None)
+            if size is not None:
+                self._total_bytes -= size
+        try:
+            os.remove(self._disk_path(key))
+        except OSError:
+            pass
+
+        bucket = self._bucket()
+        if bucket is not None:
+            try:
+                bucket.blob(self._storage_path(key)).delete()
+            except Exception as e:
+                print(f"[Thumbnail] Storage 썸네일 삭제 실패: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """디스크 캐시 사용량과 적중 통계"""
+        with self._lock:
+            index = self._load_index()
+            return {
+                "disk_entries": len(index),
+                "disk_bytes": self._total_bytes,
+                "disk_max_bytes": self.max_bytes,
+                "disk_hits": self.disk_hits,
+                "storage_hits": self.storage_hits,
+                "generated": self.generated,
+                "version": THUMBNAIL_VERSION
+            }
+
+    def _storage_path(self, key: str) -> str:
+        return f"{self.storage_prefix}/{key}.jpg"
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.jpg")
+
+    @staticmethod
+    def _bucket():
+        # PDF 워커 프로세스에서 Firebase가 초기화되지 않도록 사용할 때 임포트
+        from src.core.firebase import firebase_client
+        return firebase_client.bucket
+
+    def _read_storage(self, key: str) -> Optional[bytes]:
+        bucket = self._bucket()
+        if bucket is None:
+            return None
+        try:
+            blob = bucket.blob(self._storage_path(key))
+            if not blob.exists():
+                return None
+            return blob.download_as_bytes(timeout=15)
+        except Exception as e:
+            print(f"[Thumbnail] Storage 썸네일 조회 실패: {e}")
+            return None
+
+    def _write_storage(self, key: str, thumbnail: bytes):
+        bucket = self._bucket()
+        if bucket is None:
+            return
+        try:
+            blob = bucket.blob(self._storage_path(key))
+            blob.cache_control = "public, max-age=31536000, immutable"
+            blob.upload_from_string(thumbnail, content_type="image/jpeg")
+        except Exception as e:
+            print(f"[Thumbnail] Storage 썸네일 저장 실패: {e}")
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """디스크 캐시 인덱스 (처음 사용할 때 파일 수정 시각 순으로 구성, 잠금 안에서 호출)"""
+        if self._index is None:
+            self._index = OrderedDict()
+            self._total_bytes = 0
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                entries = [
+                    entry for entry in os.scandir(self.cache_dir)
+                    if entry.is_file() and entry.name.endswith(".jpg")
+                ]
+                for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+                    size = entry.stat().st_size
+                    self._index[entry.name[:-4]] = size
+                    self._total_bytes += size
+            except OSError as e:
+                print(f"[Thumbnail] 디스크 캐시 사용 불가: {e}")
+        return self._index
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            index = self._load_index()
+            if key not in index:
+                return None
+            index.move_to_end(key)
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            # 재시작 후에도 LRU 순서가 유지되도록 수정 시각 갱신
+            os.utime(path)
+            return data
+        except OSError:
+            with self._lock:
+                size = self._index.pop(key, None)
+                if size is not None:
+                    self._total_bytes -= size
+            return None
+
+    def _write_disk(self, key: str, thumbnail: bytes):
+        """디스크에 저장 후 최대 용량을 넘으면 가장 오래 사용하지 않은 썸네일부터 삭제"""
+        with self._lock:
+            self._load_index()  # 캐시 디렉터리 생성
+
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(thumbnail)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[Thumbnail] 디스크 캐시 저장 실패: {e}")
+            return
+
+        evicted = []
+        with self._lock:
+            index = self._load_index()
+            self._total_bytes += len(thumbnail) - index.pop(key, 0)
+            index[key] = len(thumbnail)
+            while self._total_bytes > self.max_bytes and len(index) > 1:
+                old_key, size = index.popitem(last=False)
+                self._total_bytes -= size
+                evicted.append(old_key)
+
+        for old_key in evicted:
+            try:
+                os.remove(self._disk_path(old_key))
+            except OSError:
+                pass
+
+
+# 싱글톤 인스턴스
+receipt_thumbnail_service = ReceiptThumbnailService(
+    settings.PDF_THUMBNAIL_CACHE_DIR,
+    settings.PDF_THUMBNAIL_CACHE_MAX_MB * 1024 * 1024
+)
@@ -0,0 +1,98 @@
+"""영수증 이미지 Storage 업로드 서비스"""
+import asyncio
+import io
+import uuid
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+from src.core.config import settings
+from src.core.firebase import firebase_client
+
+# 파일 앞부분 시그니처 → (Content-Type, 확장자)
+IMAGE_SIGNATURES = [
+    (b"\xff\xd8\xff", ("image/jpeg", "jpg")),
+    (b"\x89PNG\r\n\x1a\n", ("image/png", "png")),
+    (b"GIF87a", ("image/gif", "gif")),
+    (b"GIF89a", ("image/gif", "gif")),
+]
+
+
+def detect_image_type(header: bytes) -> Tuple[str, str]:
+    """파일 앞부분으로 이미지 형식 판별 (알 수 없으면 application/octet-stream)"""
+    for signature, image_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return image_type
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp", "webp"
+    if header[4:8] == b"ftyp" and header[8:12] in (b"heic", b"heix", b"mif1", b"msf1"):
+        return "image/heic", "heic"
+    return "application/octet-stream", "bin"
+
+
+class StorageService:
+    """
+    영수증 이미지 업로드
+
+    OCR이 이미지 전체를 사용하므로 업로드도 메모리에 있는 이미지 바이트를 그대로 보냅니다.
+    STORAGE_UPLOAD_CHUNK_MB보다 큰 이미지는 재개 가능 업로드로 나누어 전송하고,
+    Content-Type은 파일 시그니처로 판별하며, 공개 읽기 권한도 업로드 요청에 함께 지정해
+    make_public 호출을 따로 하지 않습니다.
+    SDK가 동기 API이므로 업로드는 스레드에서 실행합니다.
+    """
+
+    def __init__(self):
+        self.bucket = firebase_client.bucket
+
+    async def upload_receipt_image(
+        self,
+        image_data: bytes,
+        user_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        영수증 이미지 업로드
+
+        Args:
+            image_data: 이미지 바이트 데이터
+            user_id: 사용자 ID
+
+        Returns:
+            {"image_url", "size_bytes", "content_type"} 또는 None (버킷 미설정/실패)
+        """
+        if not self.bucket:
+            print("[Storage] Firebase Storage bucket이 설정되지 않았습니다")
+            return None
+
+        try:
+            size_bytes = len(image_data)
+            content_type, extension = detect_image_type(image_data[:16])
+
+            image_path = f"receipts/{user_id}/{uuid.uuid4().hex}.{extension}"
+            image_url = await asyncio.to_thread(
+                self._upload, image_path, io.BytesIO(image_data), content_type, size_bytes
+            )
+
+            print(f"[Storage] 이미지 업로드 성공: {image_path} ({content_type}, {size_bytes / 1024:.0f}KB)")
+            return {
+                "image_url": image_url,
+                "size_bytes": size_bytes,
+                "content_type": content_type
+            }
+
+        except Exception as e:
+            print(f"[Storage] 이미지 업로드 실패: {e}")
+            return None
+
+    def _upload(self, path: str, stream: BinaryIO, content_type: str, size: int) -> str:
+        """blob 업로드 후 공개 URL 반환 (동기, 청크 크기보다 큰 파일은 재개 가능 업로드로 나누어 전송)"""
+        chunk_size = settings.STORAGE_UPLOAD_CHUNK_MB * 1024 * 1024
+        blob = self.bucket.blob(path, chunk_size=chunk_size if size > chunk_size else None)
+        blob.cache_control = "public, max-age=31536000, immutable"
+        blob.upload_from_file(
+            stream,
+            size=size,
+            content_type=content_type,
+            predefined_acl="publicRead"
+        )
+        return blob.public_url
+
+
+# 싱글톤 인스턴스
+storage_service = StorageService()
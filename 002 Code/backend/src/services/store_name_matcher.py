@@ -0,0 +1,284 @@
+"""상호명 정규화 및 유사도 (영수증 ↔ 지출 매칭용)"""
+import json
+import re
+import unicodedata
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from src.core.config import settings
+
+# 한글 음절 분해 (유니코드 조합 규칙: 음절 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성)
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+
+# 상호명 앞뒤의 법인 표기와 괄호 안 내용
+CORPORATE_PATTERN = re.compile(r"\([^)]*\)|\[[^\]]*\]|㈜|주식회사|유한회사|\b(?:co|corp|inc|ltd)\b\.?")
+# 여러 단어로 된 상호명의 마지막 지점명 ("GS25 한밭대점" → "GS25")
+BRANCH_PATTERN = re.compile(r"\s+\S+(?:점|지점|직영점|센터)$")
+# 정규화 후 남길 문자 (영문 소문자, 숫자, 한글 음절)
+NON_NAME_PATTERN = re.compile(r"[^0-9a-z가-힣]+")
+# 브랜드 별칭 바로 뒤에 붙어도 되는 부분 (숫자 또는 띄어 쓰지 않은 지점명, "cu대전점")
+ALIAS_SUFFIX_PATTERN = re.compile(r"\d+|[가-힣]*(?:점|지점|직영점|센터)")
+
+# 유사도가 이 값보다 낮으면 다른 상호로 봄
+# 0.6이면 첫 음절/단어만 같은 다른 상호도 통과함 ("다이소"/"다이닝" 0.66, "김밥천국"/"김밥나라" 0.64)
+# benchmark_store_matching.py 기준 0.6: 1순위 정확도 98.4%, 없는 상호 오매칭률 50.8%
+#                                   0.7: 1순위 정확도 97.8%, 없는 상호 오매칭률 6.6%
+MIN_SIMILARITY = 0.7
+# 포함 관계를 인정하는 짧은 쪽의 최소 자모 수 ("cu"가 "cupbob"에 포함되는 경우 제외)
+MIN_CONTAINED_JAMO = 3
+
+
+def decompose_jamo(text: str) -> str:
+    """
+    한글 음절을 초성/중성/종성 자모로 분해
+
+    OCR이 "스타벅스"를 "스타빅스"로 읽은 경우 음절 단위로는 한 글자가 통째로 다르지만
+    자모 단위로는 모음 하나만 달라 유사도가 크게 떨어지지 않습니다.
+    """
+    chars = []
+    for char in text:
+        code = ord(char)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            chars.append(chr(0x1100 + offset // (JUNGSEONG_COUNT * JONGSEONG_COUNT)))
+            chars.append(chr(0x1161 + (offset // JONGSEONG_COUNT) % JUNGSEONG_COUNT))
+            if offset % JONGSEONG_COUNT:
+                chars.append(chr(0x11A7 + offset % JONGSEONG_COUNT))
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """앞뒤 경계 표시를 붙인 3-gram 집합"""
+    padded = f"^{text}$"
+    if len(padded) < 3:
+        return frozenset([padded])
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def jaro_winkler(a: str, b: str, prefix_scale: float = 0.1) -> float:
+    """Jaro-Winkler 유사도 (0~1, 앞부분이 같을수록 가산)"""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+
+    window = max(max(len(a), len(b)) // 2 - 1, 0)
+    a_matched = [False] * len(a)
+    b_matched = [False] * len(b)
+
+    matches = 0
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(len(b), i + window + 1)):
+            if not b_matched[j] and b[j] == char:
+                a_matched[i] = b_matched[j] = True
+                matches += 1
+                break
+    if not matches:
+        return 0.0
+
+    a_chars = [char for char, matched in zip(a, a_matched) if matched]
+    b_chars = [char for char, matched in zip(b, b_matched) if matched]
+    transpositions = sum(x != y for x, y in zip(a_chars, b_chars)) / 2
+
+    jaro = (matches / len(a) + matches / len(b) + (matches - transpositions) / matches) / 3
+
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+
+class StoreKey(NamedTuple):
+    """비교용으로 미리 계산한 상호명 정보"""
+    normalized: str
+    brand: Optional[str]
+    jamo: str
+    grams: FrozenSet[str]
+
+
+class StoreNameMatcher:
+    """
+    상호명 정규화 + 브랜드 별칭 + 자모 3-gram/Jaro-Winkler 유사도
+
+    상호명마다 StoreKey(정규화 문자열, 브랜드, 자모 분해, 3-gram)를 한 번만 계산해
+    캐시하므로 후보 영수증이 늘어나도 비교당 비용은 집합 교집합과 짧은 문자열 비교뿐입니다.
+    별칭 표는 정규 브랜드명 → 표기 목록이며, 상호명 앞쪽 단어들이 표기와 같으면
+    해당 부분을 정규 브랜드명으로 바꿉니다 ("지에스25 한밭대점" → "gs25").
+    표기 뒤에 다른 글자가 붙어 있으면 숫자나 지점명일 때만 인정하므로
+    "Cupbob", "CUBE카페"가 "cu"로 바뀌지 않습니다.
+    """
+
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None, max_cached_keys: int = 8192):
+        self.max_cached_keys = max_cached_keys
+        self._keys: Dict[str, StoreKey] = {}
+
+        # 정규화한 표기 → 정규 브랜드명
+        self._aliases: Dict[str, str] = {}
+        for brand, variants in (aliases or {}).items():
+            canonical = self._compact(brand)
+            for variant in [brand, *variants]:
+                compact = self._compact(variant)
+                if compact:
+                    self._aliases[compact] = canonical
+        # 표기 길이 (긴 표기부터 시도)
+        self._alias_lengths = sorted({len(variant) for variant in self._aliases}, reverse=True)
+
+    @classmethod
+    def from_file(cls, path: str) -> "StoreNameMatcher":
+        """별칭 설정 파일(JSON)에서 생성 (파일이 없거나 잘못되면 별칭 없이 사용)"""
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(json.load(f))
+        except Exception as e:
+            print(f"[Store Match] 별칭 파일 로드 실패, 별칭 없이 사용: {e}")
+            return cls()
+
+    @staticmethod
+    def _compact(text: str) -> str:
+        """NFKC 정규화, 소문자, 영문/숫자/한글 외 문자 제거"""
+        return NON_NAME_PATTERN.sub("", unicodedata.normalize("NFKC", text or "").lower())
+
+    def normalize(self, name: str) -> Tuple[str, Optional[str]]:
+        """
+        상호명 정규화
+
+        Returns:
+            (정규화한 상호명, 브랜드명 또는 None)
+        """
+        text = unicodedata.normalize("NFKC", name or "").lower()
+        text = CORPORATE_PATTERN.sub(" ", text).strip()
+        text = BRANCH_PATTERN.sub("", text)
+        words = [word for word in (NON_NAME_PATTERN.sub("", word) for word in text.split()) if word]
+
+        # 앞쪽 단어를 많이 묶은 것부터 ("gs 25" → "gs25") 별칭 표기로 시작하는지 확인
+        for count in range(len(words), 0, -1):
+            head = "".join(words[:count])
+            for length in self._alias_lengths:
+                if length > len(head):
+                    continue
+                brand = self._aliases.get(head[:length])
+                rest = head[length:]
+                if brand and (not rest or ALIAS_SUFFIX_PATTERN.fullmatch(rest)):
+                    return brand + rest + "".join(words[count:]), brand
+        return "".join(words), None
+
+    def key(self, name: str) -> StoreKey:
+        """상호명의 비교용 키 (캐시)"""
+        name = name or ""
+        key = self._keys.get(name)
+        if key is None:
+            normalized, brand = self.normalize(name)
+            jamo = decompose_jamo(normalized)
+            key = StoreKey(normalized, brand, jamo, trigrams(jamo))
+            if len(self._keys) >= self.max_cached_keys:
+                self._keys.clear()
+            self._keys[name] = key
+        return key
+
+    @staticmethod
+    def similarity(a: StoreKey, b: StoreKey) -> float:
+        """
+        두 상호명 키의 유사도 (0~1)
+
+        - 정규화 결과가 같으면 1.0
+        - 둘 다 브랜드가 있으면 같은 브랜드는 0.9 이상, 다른 브랜드는 0
+        - 그 밖에는 자모 3-gram Dice 계수와 Jaro-Winkler의 평균
+          (짧은 쪽이 MIN_CONTAINED_JAMO 자모 이상이고 다른 쪽에 포함되면 최소 MIN_SIMILARITY)
+        """
+        if not a.normalized or not b.normalized:
+            return 0.0
+        if a.normalized == b.normalized:
+            return 1.0
+        if a.brand and b.brand and a.brand != b.brand:
+            return 0.0
+
+        dice = 2 * len(a.grams & b.grams) / (len(a.grams) + len(b.grams))
+        score = (dice + jaro_winkler(a.jamo, b.jamo)) / 2
+
+        if a.brand and a.brand == b.brand:
+            score = max(score, 0.9)
+        shorter, longer = sorted((a, b), key=lambda key: len(key.jamo))
+        if len(shorter.jamo) >= MIN_CONTAINED_JAMO and shorter.normalized in longer.normalized:
+            score = max(score, MIN_SIMILARITY)
+        return score
+
+    def match_score(self, a: StoreKey, b: StoreKey) -> float:
+        """같은 상호로 볼 수 있으면(MIN_SIMILARITY 이상) 유사도, 아니면 0"""
+        similarity = self.similarity(a, b)
+        return similarity if similarity >= MIN_SIMILARITY else 0.0
+
+    def score(self, name_a: str, name_b: str) -> float:
+        """두 상호명의 유사도 (0~1)"""
+        return self.similarity(self.key(name_a), self.key(name_b))
+
+
+class StoreNameIndex:
+    """
+    상호명 3-gram 역색인
+
+    많은 영수증 중 상호명이 비슷한 것을 찾을 때 모든 항목과 비교하지 않고,
+    3-gram을 공유하는 항목만 골라 Dice 계수로 거른 뒤 상위 후보만 정밀 비교합니다.
+    """
+
+    def __init__(self, matcher: StoreNameMatcher):
+        self.matcher = matcher
+        self._keys: Dict[str, StoreKey] = {}
+        self._postings: Dict[str, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, item_id: str, name: str):
+        """항목 추가 (같은 ID를 다시 추가하지 않는다고 가정)"""
+        key = self.matcher.key(name)
+        if not key.normalized:
+            return
+        self._keys[item_id] = key
+        for gram in key.grams:
+            self._postings.setdefault(gram, []).append(item_id)
+
+    def search(
+        self,
+        name: str,
+        limit: int = 5,
+        min_dice: float = 0.2
+    ) -> List[Tuple[float, str]]:
+        """
+        상호명이 비슷한 항목 검색 (StoreNameMatcher.match_score 기준을 넘는 항목만)
+
+        Returns:
+            유사도 내림차순 (유사도, 항목 ID) 리스트
+        """
+        query = self.matcher.key(name)
+        if not query.normalized:
+            return []
+
+        shared: Dict[str, int] = {}
+        for gram in query.grams:
+            for item_id in self._postings.get(gram, ()):
+                shared[item_id] = shared.get(item_id, 0) + 1
+
+        # 3-gram 공유 수만으로 Dice 계수를 구해 1차 필터링
+        candidates = []
+        for item_id, count in shared.items():
+            dice = 2 * count / (len(query.grams) + len(self._keys[item_id].grams))
+            if dice >= min_dice:
+                candidates.append((dice, item_id))
+        candidates.sort(reverse=True)
+
+        results = []
+        for _, item_id in candidates[:max(limit * 4, 20)]:
+            similarity = self.matcher.match_score(query, self._keys[item_id])
+            if similarity:
+                results.append((similarity, item_id))
+        results.sort(reverse=True)
+        return results[:limit]
+
+
+# 싱글톤 인스턴스
+store_name_matcher = StoreNameMatcher.from_file(settings.STORE_ALIASES_PATH)
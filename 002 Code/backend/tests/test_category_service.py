@@ -0,0 +1,39 @@
+"""하이브리드 카테고리 분류 테스트"""
+import asyncio
+import threading
+import pytest
+from src.services.category_service import category_service
+
+
+@pytest.fixture
+def unloaded_ai_service(monkeypatch):
+    """AI_MODEL_PRELOAD=False로 시작해 아직 로드하지 않은 모델 (실제 로드 대신 호출만 기록)"""
+    ai_service = category_service.ai_service
+    if ai_service is None:
+        pytest.skip("AI 분류 서비스를 사용할 수 없습니다")
+
+    started = threading.Event()
+    monkeypatch.setattr(ai_service, "engine", None)
+    monkeypatch.setattr(ai_service, "state", "not_loaded")
+    monkeypatch.setattr(ai_service, "_initialize_model", started.set)
+    return ai_service, started
+
+
+def test_async_classification_starts_lazy_model_loading(unloaded_ai_service):
+    ai_service, started = unloaded_ai_service
+
+    result = asyncio.run(category_service.classify_detailed_async("스타벅스 강남점", "아메리카노"))
+
+    assert started.wait(timeout=1)
+    assert ai_service.state == "loading"
+    assert "ai" not in result["signals"]
+
+
+def test_sync_classification_starts_lazy_model_loading(unloaded_ai_service):
+    ai_service, started = unloaded_ai_service
+
+    category_service.classify("스타벅스 강남점", "아메리카노")
+
+    assert started.wait(timeout=1)
+    assert ai_service.state == "loading"
+
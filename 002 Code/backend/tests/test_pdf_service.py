@@ -0,0 +1,58 @@
+"""PDF 렌더링 프로세스 풀 테스트"""
+import asyncio
+import os
+import subprocess
+import sys
+from datetime import datetime
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVER_MODULES = ["src.app", "src.api.routes.receipt", "src.core.firebase", "src.services.ai_category_service"]
+
+
+def _loaded_server_modules():
+    """워커 프로세스에서 실행: 임포트된 서버 모듈 목록"""
+    return [name for name in SERVER_MODULES if name in sys.modules]
+
+
+def test_main_reimport_has_no_side_effects():
+    """spawn 워커가 python main.py를 __mp_main__으로 다시 임포트해도 앱/Firebase를 불러오지 않음"""
+    script = (
+        "import runpy, sys\n"
+        "runpy.run_path('main.py', run_name='__mp_main__')\n"
+        f"print([name for name in {SERVER_MODULES!r} if name in sys.modules])\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=BACKEND_DIR, capture_output=True, text=True, timeout=60
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_process_pool_renders_report(tmp_path):
+    pytest.importorskip("reportlab")
+    pytest.importorskip("PIL")
+    from src.services.pdf_service import pdf_service
+
+    expense = {
+        "date": datetime(2025, 3, 14),
+        "store_name": "스타벅스 강남점",
+        "category": "식비",
+        "description": "회의 음료",
+        "amount": 12000
+    }
+    output_path = str(tmp_path / "report.pdf")
+
+    try:
+        asyncio.run(pdf_service._submit("report", [expense], [None], output_path))
+        worker_modules = pdf_service._get_executor().submit(_loaded_server_modules).result(timeout=60)
+    finally:
+        if pdf_service._executor is not None:
+            pdf_service._executor.shutdown()
+            pdf_service._executor = None
+
+    with open(output_path, "rb") as f:
+        assert f.read(5) == b"%PDF-"
+    assert worker_modules == []
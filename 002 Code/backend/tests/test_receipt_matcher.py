@@ -0,0 +1,45 @@
+"""지출 ↔ 영수증 후보 인덱스 테스트"""
+from datetime import datetime
+from src.services.receipt_matcher import ReceiptCandidateIndex
+
+PURCHASE_DATE = datetime(2025, 3, 14, 12, 0)
+
+
+def receipt(receipt_id, store_name, total_amount, purchase_date=PURCHASE_DATE):
+    return {
+        "id": receipt_id,
+        "store_name": store_name,
+        "total_amount": total_amount,
+        "purchase_date": purchase_date,
+        "image_url": f"https://example.com/{receipt_id}.jpg"
+    }
+
+
+def test_scores_fuzzy_store_name_within_amount_range():
+    index = ReceiptCandidateIndex([
+        receipt("r1", "GS25 한밭대점", 4500),
+        receipt("r2", "다이닝", 4500)
+    ])
+
+    candidates = index.candidates("지에스25", 4500, PURCHASE_DATE)
+
+    scores = {item["id"]: score for score, item in candidates}
+    assert scores["r1"] > scores["r2"]
+    assert scores["r2"] == 50  # 상호명 0점 + 금액 30 + 날짜 20
+
+
+def test_unpriced_receipt_is_found_by_store_name():
+    index = ReceiptCandidateIndex([
+        receipt("r1", "스타벅스 강남점", 0),
+        receipt("r2", "다이소 강남점", 0)
+    ])
+
+    candidates = index.candidates("스타벅스", 12000, PURCHASE_DATE)
+
+    assert [item["id"] for _, item in candidates] == ["r1"]
+
+
+def test_unpriced_receipt_outside_date_range_is_ignored():
+    index = ReceiptCandidateIndex([receipt("r1", "스타벅스 강남점", 0, datetime(2025, 3, 20))])
+
+    assert index.candidates("스타벅스", 12000, PURCHASE_DATE) == []
@@ -0,0 +1,82 @@
+"""상호명 정규화/브랜드 별칭 테스트"""
+import os
+import pytest
+from src.services.store_name_matcher import MIN_SIMILARITY, StoreNameMatcher
+
+ALIASES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "src", "core", "store_aliases.json"
+)
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return StoreNameMatcher.from_file(ALIASES_PATH)
+
+
+@pytest.mark.parametrize("name, brand", [
+    ("GS25 한밭대점", "gs25"),
+    ("지에스25 궁동점", "gs25"),
+    ("GS 25", "gs25"),
+    ("CU 대전점", "cu"),
+    ("CU대전점", "cu"),
+    ("씨유", "cu"),
+    ("(주)코리아세븐 세븐일레븐 유성점", "세븐일레븐"),
+    ("KFC 둔산점", "kfc"),
+    ("CJ CGV 대전", "cgv"),
+    ("이마트24 궁동점", "이마트24"),
+    ("emart24", "이마트24"),
+    ("이마트 둔산점", "이마트"),
+])
+def test_brand_alias(matcher, name, brand):
+    assert matcher.normalize(name)[1] == brand
+
+
+@pytest.mark.parametrize("name", [
+    "Cupbob",
+    "CUBE카페",
+    "큐브카페",
+    "KFCK 치킨",
+    "CGVR스튜디오",
+    "GS칼텍스 주유소",
+    "GS리테일마트",
+])
+def test_alias_requires_boundary(matcher, name):
+    assert matcher.normalize(name)[1] is None
+
+
+@pytest.mark.parametrize("name", ["Cupbob", "CUBE카페"])
+def test_prefix_lookalike_does_not_match_brand(matcher, name):
+    assert matcher.score(name, "CU 대전점") < MIN_SIMILARITY
+
+
+def test_same_brand_different_branch(matcher):
+    assert matcher.score("CU 대전점", "씨유 궁동점") >= 0.9
+    assert matcher.score("지에스25", "GS25 한밭대점") >= 0.9
+
+
+def test_emart24_is_not_emart(matcher):
+    assert matcher.normalize("이마트24 궁동점") == ("이마트24", "이마트24")
+    assert matcher.normalize("이마트 궁동점") == ("이마트", "이마트")
+    assert matcher.score("이마트24 궁동점", "이마트 궁동점") == 0.0
+
+
+@pytest.mark.parametrize("name_a, name_b", [
+    ("다이소", "다이닝"),
+    ("이디야", "이디저디"),
+    ("홍콩반점", "홍콩각"),
+    ("김밥천국", "김밥나라"),
+    ("새마을식당", "새마을금고"),
+])
+def test_shared_first_syllables_are_different_stores(matcher, name_a, name_b):
+    assert matcher.match_score(matcher.key(name_a), matcher.key(name_b)) == 0.0
+
+
+@pytest.mark.parametrize("name_a, name_b", [
+    ("본죽", "본쭉"),
+    ("다이소", "다이쏘"),
+    ("이디야", "이디아"),
+    ("김밥천국 궁동점", "김밥천극"),
+])
+def test_ocr_typo_in_short_name_still_matches(matcher, name_a, name_b):
+    assert matcher.match_score(matcher.key(name_a), matcher.key(name_b)) >= MIN_SIMILARITY
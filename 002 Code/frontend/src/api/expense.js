@@ -6,15 +6,16 @@ import apiClient from './client'
 export const expenseAPI = {
   /**
    * 지출 목록 조회
-   * @param {Object} params - 쿼리 파라미터 (category, start_date, end_date, limit)
-   * @returns {Promise} 지출 목록
+   * @param {Object} params - 쿼리 파라미터 (category, start_date, end_date, limit, cursor)
+   * @returns {Promise} 지출 목록 (nextCursor: 다음 페이지 커서, 없으면 null)
    */
   async getExpenses(params = {}) {
     try {
       const response = await apiClient.get('/expense/', { params })
       return {
         success: true,
-        data: response.data
+        data: response.data,
+        nextCursor: response.headers['x-next-cursor'] || null
       }
     } catch (error) {
       return {
@@ -1,5 +1,27 @@
 import apiClient from './client'
 
+const JOB_POLL_INTERVAL_MS = 1000
+const JOB_POLL_TIMEOUT_MS = 120000
+
+/**
+ * OCR 작업이 끝날 때까지 상태 조회 (success / failed)
+ * @param {string} jobId - 작업 ID
+ * @returns {Promise} 최종 작업 상태
+ */
+async function waitForJob(jobId) {
+  const deadline = Date.now() + JOB_POLL_TIMEOUT_MS
+  while (Date.now() < deadline) {
+    const response = await apiClient.get(`/receipt/jobs/${jobId}`)
+    if (response.data.status === 'success' || response.data.status === 'failed') {
+      return response.data
+    }
+    await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS))
+  }
+  const error = new Error('timeout')
+  error.code = 'ECONNABORTED'
+  throw error
+}
+
 /**
  * 영수증 관련 API
  */
@@ -14,11 +36,14 @@ export const receiptAPI = {
       const formData = new FormData()
       formData.append('file', file)
 
-      const response = await apiClient.post('/receipt/ocr', formData, {
+      // 작업 모드로 등록 후 완료될 때까지 상태 조회
+      const accepted = await apiClient.post('/receipt/ocr', formData, {
         headers: {
           'Content-Type': 'multipart/form-data'
-        }
+        },
+        params: { async_job: true }
       })
+      const response = { data: await waitForJob(accepted.data.job_id) }
 
       console.log('[receiptAPI] OCR 백엔드 응답:', response.data)
 
@@ -60,11 +85,14 @@ export const receiptAPI = {
       const formData = new FormData()
       formData.append('file', file)
 
-      const response = await apiClient.post('/receipt/upload', formData, {
+      // 작업 모드로 등록 후 완료될 때까지 상태 조회
+      const accepted = await apiClient.post('/receipt/upload', formData, {
         headers: {
           'Content-Type': 'multipart/form-data'
-        }
+        },
+        params: { async_job: true }
       })
+      const response = { data: await waitForJob(accepted.data.job_id) }
 
       console.log('[receiptAPI] 백엔드 응답:', response.data)
 
@@ -100,15 +128,16 @@ export const receiptAPI = {
 
   /**
    * 영수증 목록 조회
-   * @param {Object} params - 쿼리 파라미터 (start_date, end_date, limit)
-   * @returns {Promise} 영수증 목록
+   * @param {Object} params - 쿼리 파라미터 (start_date, end_date, limit 최대 500, cursor)
+   * @returns {Promise} 영수증 목록 (nextCursor: 다음 페이지 커서, 없으면 null)
    */
   async getReceipts(params = {}) {
     try {
       const response = await apiClient.get('/receipt/', { params })
       return {
         success: true,
-        data: response.data
+        data: response.data,
+        nextCursor: response.headers['x-next-cursor'] || null
       }
     } catch (error) {
       return {
@@ -29,6 +29,33 @@ const apiRequest = async (endpoint, options = {}) => {
   }
 }
 
+// 목록 API 최대 페이지 크기 (서버 상한과 동일)
+export const MAX_PAGE_LIMIT = 500
+
+// 커서 기반 목록의 한 페이지 조회 (다음 페이지 커서는 X-Next-Cursor 헤더)
+export const fetchPage = async (endpoint, params = {}, { auth = true, limit = 100, cursor = null } = {}) => {
+  const token = auth ? localStorage.getItem('access_token') : null
+  const query = new URLSearchParams({
+    ...params,
+    limit: Math.min(limit, MAX_PAGE_LIMIT),
+    ...(cursor && { cursor })
+  }).toString()
+  const response = await fetch(`${API_BASE_URL}${endpoint}?${query}`, {
+    headers: token ? { Authorization: `Bearer ${token}` } : {}
+  })
+
+  if (!response.ok) {
+    const errorData = await response.json().catch(() => ({}))
+    throw new Error(errorData.detail || `HTTP error! status: ${response.status}`)
+  }
+
+  const items = await response.json()
+  return {
+    items: Array.isArray(items) ? items : [],
+    nextCursor: response.headers.get('X-Next-Cursor')
+  }
+}
+
 // 인증 관련 API
 export const authAPI = {
   // 로그인
@@ -116,11 +143,9 @@ export const budgetAPI = {
 
 // 지출 관련 API
 export const expenseAPI = {
-  // 지출 목록 조회
-  getAll: async (params = {}) => {
-    const queryString = new URLSearchParams(params).toString()
-    const endpoint = queryString ? `/expense/?${queryString}` : '/expense/'
-    return await apiRequest(endpoint)
+  // 지출 목록 한 페이지 조회 ({ items, nextCursor })
+  getPage: async (params = {}, { limit = 100, cursor = null } = {}) => {
+    return await fetchPage('/expense/', params, { limit, cursor })
   },
 
   // 지출 생성